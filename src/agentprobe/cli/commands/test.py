@@ -45,7 +45,7 @@ def test_cmd(
     if test_dir:
         config.test_dir = test_dir
     if parallel is not None:
-        config.runner.parallel = parallel
+        config.runner = config.runner.model_copy(update={"parallel": parallel})
 
     test_cases = extract_test_cases(config.test_dir, pattern)
 
@@ -7,8 +7,10 @@ slow responses, and empty responses.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import random
+from collections import OrderedDict
 from typing import Any
 
 from agentprobe.core.models import (
@@ -21,6 +23,33 @@ from agentprobe.core.protocols import AdapterProtocol
 
 logger = logging.getLogger(__name__)
 
+# Distinct inputs whose invocation counts are remembered. Beyond this, the
+# least recently sent input is forgotten and restarts at occurrence 0.
+_MAX_TRACKED_INPUTS = 10_000
+
+# Faults whose updates do not depend on the tool call or override. ERROR
+# and SLOW are built per call in ``ChaosProxy._inject_fault``.
+_STATIC_FAULTS: dict[ChaosType, dict[str, Any]] = {
+    ChaosType.TIMEOUT: {
+        "success": False,
+        "error": "Chaos: operation timed out",
+        "tool_output": None,
+    },
+    ChaosType.MALFORMED: {
+        "success": True,
+        "tool_output": "{malformed: data, <<invalid>>}",
+    },
+    ChaosType.RATE_LIMIT: {
+        "success": False,
+        "error": "Chaos: rate limit exceeded (429)",
+        "tool_output": None,
+    },
+    ChaosType.EMPTY: {
+        "success": True,
+        "tool_output": "",
+    },
+}
+
 
 class ChaosProxy:
     """Wraps an adapter and injects chaos faults into tool call results.
@@ -29,6 +58,13 @@ class ChaosProxy:
     and probabilistically replaces their outputs with fault-injected
     variants. The modified trace is returned as a frozen copy.
 
+    Each trace draws from its own RNG derived from the seed, the trace's
+    input text, and how many times that input was sent before. Repeats of
+    an input get independent faults, while the n-th invocation of an input
+    receives the same faults in every run with the same seed, however other
+    inputs are interleaved or run concurrently. Counts are kept for the
+    most recently sent inputs only; call ``reset()`` to start over.
+
     Attributes:
         overrides: Configured fault injection rules.
     """
@@ -49,13 +85,22 @@ class ChaosProxy:
         """
         self._adapter = adapter
         self._overrides = overrides
-        self._rng = random.Random(seed)
+        self._seed = seed
+        # Invocations started so far, per input text.
+        self._invocations: OrderedDict[str, int] = OrderedDict()
+        # False when there are no overrides or every override is disabled
+        # (probability 0.0), in which case traces pass through untouched.
+        self._any_active = any(o.probability > 0.0 for o in overrides)
 
     @property
     def name(self) -> str:
         """Return the adapter name with chaos prefix."""
         return f"chaos-{self._adapter.name}"
 
+    def reset(self) -> None:
+        """Forget invocation counts, so every input restarts at occurrence 0."""
+        self._invocations.clear()
+
     async def invoke(self, input_text: str, **kwargs: Any) -> Trace:
         """Invoke the wrapped adapter and inject faults.
 
@@ -66,31 +111,55 @@ class ChaosProxy:
         Returns:
             A modified trace with chaos faults injected.
         """
+        # Counted before awaiting, so concurrent repeats are numbered in the
+        # order they were started.
+        invocations = self._invocations
+        occurrence = invocations.get(input_text, 0)
+        invocations[input_text] = occurrence + 1
+        invocations.move_to_end(input_text)
+        if len(invocations) > _MAX_TRACKED_INPUTS:
+            invocations.popitem(last=False)
         trace = await self._adapter.invoke(input_text, **kwargs)
-        return self._apply_chaos(trace)
+        return self._apply_chaos(trace, occurrence, input_text=input_text)
 
-    def _apply_chaos(self, trace: Trace) -> Trace:
-        """Apply chaos overrides to tool calls in the trace."""
-        if not trace.tool_calls or not self._overrides:
-            return trace
-
-        modified_calls: list[ToolCall] = []
-        any_modified = False
+    def _apply_chaos(
+        self, trace: Trace, occurrence: int = 0, *, input_text: str | None = None
+    ) -> Trace:
+        """Apply chaos overrides to tool calls in the trace.
 
-        for tc in trace.tool_calls:
-            override = self._match_override(tc)
-            if override is not None and self._rng.random() < override.probability:
-                modified_calls.append(self._inject_fault(tc, override))
-                any_modified = True
-            else:
-                modified_calls.append(tc)
+        Args:
+            trace: The trace produced by the wrapped adapter.
+            occurrence: How many earlier invocations had the same input.
+            input_text: The input the invocation was counted under.
+                Defaults to the trace's input text.
+        """
+        tool_calls = trace.tool_calls
+        if not self._any_active or not tool_calls:
+            return trace
 
-        if not any_modified:
+        # Draw every probability up front so the fault decision and the
+        # output build fuse into a single comprehension.
+        rng = self._rng_for(trace.input_text if input_text is None else input_text, occurrence)
+        draws = [rng.random() for _ in tool_calls]
+        modified_calls = [
+            self._inject_fault(tc, override)
+            if (override := self._match_override(tc)) is not None and draw < override.probability
+            else tc
+            for tc, draw in zip(tool_calls, draws, strict=True)
+        ]
+
+        if all(mc is tc for mc, tc in zip(modified_calls, tool_calls, strict=True)):
             return trace
 
-        return trace.model_copy(
-            update={"tool_calls": tuple(modified_calls)},
-        )
+        return trace.model_copy(update={"tool_calls": tuple(modified_calls)})
+
+    def _rng_for(self, input_text: str, occurrence: int) -> random.Random:
+        """Derive a deterministic RNG from the seed, input, and occurrence."""
+        digest = hashlib.blake2b(
+            f"{self._seed}:{occurrence}:{input_text}".encode(),
+            digest_size=8,
+        ).digest()
+        return random.Random(int.from_bytes(digest, "big"))
 
     def _match_override(self, tool_call: ToolCall) -> ChaosOverride | None:
         """Find the first matching override for a tool call."""
@@ -101,43 +170,27 @@ class ChaosProxy:
 
     def _inject_fault(self, tool_call: ToolCall, override: ChaosOverride) -> ToolCall:
         """Create a fault-injected copy of a tool call."""
-        logger.debug(
-            "Injecting %s fault into tool '%s'",
-            override.chaos_type.value,
-            tool_call.tool_name,
-        )
-        fault_map: dict[ChaosType, dict[str, Any]] = {
-            ChaosType.TIMEOUT: {
-                "success": False,
-                "error": "Chaos: operation timed out",
-                "tool_output": None,
-            },
-            ChaosType.ERROR: {
-                "success": False,
-                "error": f"Chaos: {override.error_message}",
-                "tool_output": None,
-            },
-            ChaosType.MALFORMED: {
-                "success": True,
-                "tool_output": "{malformed: data, <<invalid>>}",
-            },
-            ChaosType.RATE_LIMIT: {
-                "success": False,
-                "error": "Chaos: rate limit exceeded (429)",
-                "tool_output": None,
-            },
-            ChaosType.SLOW: {
-                "success": True,
-                "tool_output": tool_call.tool_output,
-                "latency_ms": tool_call.latency_ms + override.delay_ms,
-            },
-            ChaosType.EMPTY: {
-                "success": True,
-                "tool_output": "",
-            },
-        }
-        updates = fault_map.get(
-            override.chaos_type,
-            {"success": False, "error": f"Chaos: unknown type {override.chaos_type}"},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Injecting %s fault into tool '%s'",
+                override.chaos_type.value,
+                tool_call.tool_name,
+            )
+        chaos_type = override.chaos_type
+        updates = _STATIC_FAULTS.get(chaos_type)
+        if updates is None:
+            if chaos_type is ChaosType.ERROR:
+                updates = {
+                    "success": False,
+                    "error": f"Chaos: {override.error_message}",
+                    "tool_output": None,
+                }
+            elif chaos_type is ChaosType.SLOW:
+                updates = {
+                    "success": True,
+                    "tool_output": tool_call.tool_output,
+                    "latency_ms": tool_call.latency_ms + override.delay_ms,
+                }
+            else:
+                updates = {"success": False, "error": f"Chaos: unknown type {chaos_type}"}
         return tool_call.model_copy(update=updates)
@@ -6,20 +6,48 @@ Loads configuration from ``agentprobe.yaml`` with support for
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
 import re
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
 from agentprobe.core.exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
-_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+@functools.cache
+def _env_var_pattern() -> re.Pattern[str]:
+    """Return the compiled ``${VAR}`` pattern, compiling it on first use."""
+    return re.compile(r"\$\{([^}]+)\}")
+
+
+@functools.cache
+def _yaml_safe_loader() -> Any:
+    """Return PyYAML's LibYAML-backed safe loader, or the pure-Python one."""
+    import yaml  # noqa: PLC0415
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _try_parse_json(text: str) -> Any:
+    """Parse config text as JSON when it looks like a JSON object.
+
+    JSON is a subset of YAML, so a JSON-compatible config can skip the
+    YAML parser entirely. Returns None when the text is not valid JSON.
+    """
+    stripped = text.lstrip()
+    if not stripped.startswith("{"):
+        return None
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError:
+        return None
 
 
 def _interpolate_env_vars(value: str) -> str:
@@ -33,7 +61,7 @@ def _interpolate_env_vars(value: str) -> str:
             return match.group(0)
         return env_val
 
-    return _ENV_VAR_PATTERN.sub(_replace, value)
+    return _env_var_pattern().sub(_replace, value)
 
 
 def _interpolate_recursive(data: Any) -> Any:
@@ -54,13 +82,19 @@ class RunnerConfig(BaseModel):
         parallel: Whether to run tests in parallel.
         max_workers: Maximum number of concurrent tests.
         default_timeout: Default test timeout in seconds.
+        fail_fast: Cancel a test's remaining evaluators once one fails.
+        cache_results: Reuse stored results for unchanged test cases.
+        cache_dir: Directory for cached test results.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     parallel: bool = False
     max_workers: int = Field(default=4, ge=1)
     default_timeout: float = Field(default=30.0, gt=0)
+    fail_fast: bool = False
+    cache_results: bool = False
+    cache_dir: str = ".agentprobe/cache"
 
 
 class EvalConfig(BaseModel):
@@ -85,7 +119,7 @@ class JudgeConfig(BaseModel):
         max_tokens: Maximum response tokens.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     model: str = "claude-sonnet-4-5-20250929"
     provider: str = "anthropic"
@@ -102,7 +136,7 @@ class TraceConfig(BaseModel):
         database_path: Path to SQLite database file.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = True
     storage_backend: str = "sqlite"
@@ -118,7 +152,7 @@ class CostConfig(BaseModel):
         pricing_dir: Directory containing pricing YAML files.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = True
     budget_limit_usd: float | None = None
@@ -148,7 +182,7 @@ class ChaosConfig(BaseModel):
         default_probability: Default probability of applying a fault.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = False
     seed: int = 42
@@ -165,7 +199,7 @@ class SnapshotConfig(BaseModel):
         threshold: Similarity threshold for snapshot matching.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = False
     snapshot_dir: str = ".agentprobe/snapshots"
@@ -181,7 +215,7 @@ class BudgetConfig(BaseModel):
         suite_budget_usd: Maximum cost per test suite run.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     test_budget_usd: float | None = None
     suite_budget_usd: float | None = None
@@ -196,7 +230,7 @@ class RegressionConfig(BaseModel):
         threshold: Score delta threshold for flagging regressions.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = False
     baseline_dir: str = ".agentprobe/baselines"
@@ -212,7 +246,7 @@ class MetricsConfig(BaseModel):
         trend_window: Number of recent runs to use for trend analysis.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = True
     builtin_metrics: bool = True
@@ -249,6 +283,19 @@ class ReportingConfig(BaseModel):
     output_dir: str = "agentprobe-report"
 
 
+# Frozen sub-configs hold only scalars, so every default AgentProbeConfig
+# can share one instance of each instead of building fresh copies.
+_DEFAULT_RUNNER = RunnerConfig()
+_DEFAULT_JUDGE = JudgeConfig()
+_DEFAULT_TRACE = TraceConfig()
+_DEFAULT_COST = CostConfig()
+_DEFAULT_CHAOS = ChaosConfig()
+_DEFAULT_SNAPSHOT = SnapshotConfig()
+_DEFAULT_BUDGET = BudgetConfig()
+_DEFAULT_REGRESSION = RegressionConfig()
+_DEFAULT_METRICS = MetricsConfig()
+
+
 class AgentProbeConfig(BaseModel):
     """Top-level AgentProbe configuration.
 
@@ -268,18 +315,18 @@ class AgentProbeConfig(BaseModel):
 
     project_name: str = "agentprobe"
     test_dir: str = "tests"
-    runner: RunnerConfig = Field(default_factory=RunnerConfig)
+    runner: RunnerConfig = Field(default_factory=lambda: _DEFAULT_RUNNER)
     eval: EvalConfig = Field(default_factory=EvalConfig)
-    judge: JudgeConfig = Field(default_factory=JudgeConfig)
-    trace: TraceConfig = Field(default_factory=TraceConfig)
-    cost: CostConfig = Field(default_factory=CostConfig)
+    judge: JudgeConfig = Field(default_factory=lambda: _DEFAULT_JUDGE)
+    trace: TraceConfig = Field(default_factory=lambda: _DEFAULT_TRACE)
+    cost: CostConfig = Field(default_factory=lambda: _DEFAULT_COST)
     safety: SafetyConfig = Field(default_factory=SafetyConfig)
     reporting: ReportingConfig = Field(default_factory=ReportingConfig)
-    chaos: ChaosConfig = Field(default_factory=ChaosConfig)
-    snapshot: SnapshotConfig = Field(default_factory=SnapshotConfig)
-    budget: BudgetConfig = Field(default_factory=BudgetConfig)
-    regression: RegressionConfig = Field(default_factory=RegressionConfig)
-    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    chaos: ChaosConfig = Field(default_factory=lambda: _DEFAULT_CHAOS)
+    snapshot: SnapshotConfig = Field(default_factory=lambda: _DEFAULT_SNAPSHOT)
+    budget: BudgetConfig = Field(default_factory=lambda: _DEFAULT_BUDGET)
+    regression: RegressionConfig = Field(default_factory=lambda: _DEFAULT_REGRESSION)
+    metrics: MetricsConfig = Field(default_factory=lambda: _DEFAULT_METRICS)
     plugins: PluginConfig = Field(default_factory=PluginConfig)
 
 
@@ -314,11 +361,18 @@ def load_config(
             logger.debug("No config file found, using defaults")
             return AgentProbeConfig()
 
+    # Deferred so importing the config models (e.g. for ``--help``) does
+    # not pay for PyYAML; it is only needed once a file is actually read.
+    import yaml  # noqa: PLC0415
+
     logger.info("Loading config from %s", config_path)
-    try:
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
-    except yaml.YAMLError as exc:
-        raise ConfigError(f"Invalid YAML in {config_path}: {exc}") from exc
+    text = config_path.read_text(encoding="utf-8")
+    raw = _try_parse_json(text)
+    if raw is None:
+        try:
+            raw = yaml.load(text, Loader=_yaml_safe_loader())
+        except yaml.YAMLError as exc:
+            raise ConfigError(f"Invalid YAML in {config_path}: {exc}") from exc
 
     if raw is None:
         return AgentProbeConfig()
@@ -326,9 +380,9 @@ def load_config(
     if not isinstance(raw, dict):
         raise ConfigError(f"Config file must be a YAML mapping, got {type(raw).__name__}")
 
-    interpolated = _interpolate_recursive(raw)
-
     try:
-        return AgentProbeConfig.model_validate(interpolated)
+        # Substituted into parsed strings, so values stay strings whatever
+        # they contain; files without references skip the walk.
+        return AgentProbeConfig.model_validate(_interpolate_recursive(raw) if "${" in text else raw)
     except Exception as exc:
         raise ConfigError(f"Invalid configuration: {exc}") from exc
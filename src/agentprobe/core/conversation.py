@@ -66,20 +66,23 @@ class ConversationRunner:
         Raises:
             ConversationError: If a critical error occurs during execution.
         """
+        resolved = self._resolve_evaluators(turns)
         turn_results: list[TurnResult] = []
         previous_output = ""
-        total_start = time.monotonic()
+        total_start = time.monotonic_ns()
+        turn_end = total_start
 
         for i, turn in enumerate(turns):
             input_text = turn.input_text
             if pass_context and previous_output:
                 input_text = f"{previous_output}\n\n{turn.input_text}"
 
-            turn_start = time.monotonic()
+            turn_start = time.monotonic_ns()
             try:
                 trace = await adapter.invoke(input_text)
                 previous_output = trace.output_text
             except Exception as exc:
+                turn_end = time.monotonic_ns()
                 logger.error("Turn %d failed: %s", i, exc)
                 turn_results.append(
                     TurnResult(
@@ -87,28 +90,26 @@ class ConversationRunner:
                         input_text=turn.input_text,
                         trace=None,
                         eval_results=(),
-                        duration_ms=int((time.monotonic() - turn_start) * 1000),
+                        duration_ms=(turn_end - turn_start) // 1_000_000,
                     )
                 )
                 continue
 
             # Run per-turn evaluators
             eval_results: list[EvalResult] = []
-            if turn.evaluators:
+            evaluators = resolved[turn.evaluators]
+            if evaluators:
                 test_case = TestCase(
                     name=f"turn_{i}",
                     input_text=turn.input_text,
                     expected_output=turn.expected_output,
                 )
-                for eval_name in turn.evaluators:
-                    evaluator = self._evaluators.get(eval_name)
-                    if evaluator is None:
-                        logger.warning("Turn %d: evaluator '%s' not found", i, eval_name)
-                        continue
+                for evaluator in evaluators:
                     result = await evaluator.evaluate(test_case, trace)
                     eval_results.append(result)
 
-            duration_ms = int((time.monotonic() - turn_start) * 1000)
+            turn_end = time.monotonic_ns()
+            duration_ms = (turn_end - turn_start) // 1_000_000
             turn_results.append(
                 TurnResult(
                     turn_index=i,
@@ -119,9 +120,36 @@ class ConversationRunner:
                 )
             )
 
-        total_duration = int((time.monotonic() - total_start) * 1000)
+        # The last turn boundary doubles as the end of the conversation.
+        total_duration = (turn_end - total_start) // 1_000_000
         return self._build_result(adapter.name, turn_results, total_duration)
 
+    def _resolve_evaluators(
+        self,
+        turns: Sequence[ConversationTurn],
+    ) -> dict[tuple[str, ...], tuple[EvaluatorProtocol, ...]]:
+        """Resolve each distinct per-turn evaluator list to its instances.
+
+        Turns commonly share the same evaluator list, so lookups happen
+        once per distinct list and each missing evaluator is logged once.
+        """
+        resolved: dict[tuple[str, ...], tuple[EvaluatorProtocol, ...]] = {}
+        missing: set[str] = set()
+        for turn in turns:
+            if turn.evaluators in resolved:
+                continue
+            found: list[EvaluatorProtocol] = []
+            for eval_name in turn.evaluators:
+                evaluator = self._evaluators.get(eval_name)
+                if evaluator is None:
+                    if eval_name not in missing:
+                        missing.add(eval_name)
+                        logger.warning("Evaluator '%s' not found", eval_name)
+                    continue
+                found.append(evaluator)
+            resolved[turn.evaluators] = tuple(found)
+        return resolved
+
     @staticmethod
     def _build_result(
         agent_name: str,
@@ -130,23 +158,27 @@ class ConversationRunner:
     ) -> ConversationResult:
         """Aggregate per-turn results into a ConversationResult."""
         passed = 0
-        scores: list[float] = []
+        score_sum = 0.0
 
+        # Single pass: each turn's verdicts and scores are folded together.
         for tr in turn_results:
-            if tr.eval_results:
-                turn_passed = all(er.verdict == EvalVerdict.PASS for er in tr.eval_results)
+            eval_results = tr.eval_results
+            if eval_results:
+                turn_passed = True
+                turn_total = 0.0
+                for er in eval_results:
+                    turn_total += er.score
+                    if er.verdict != EvalVerdict.PASS:
+                        turn_passed = False
                 if turn_passed:
                     passed += 1
-                turn_score = sum(er.score for er in tr.eval_results) / len(tr.eval_results)
-                scores.append(turn_score)
+                score_sum += turn_total / len(eval_results)
             elif tr.trace is not None:
                 # No evaluators but trace exists = pass
                 passed += 1
-                scores.append(1.0)
-            else:
-                scores.append(0.0)
+                score_sum += 1.0
 
-        aggregate_score = sum(scores) / len(scores) if scores else 0.0
+        aggregate_score = score_sum / len(turn_results) if turn_results else 0.0
 
         return ConversationResult(
             agent_name=agent_name,
@@ -6,10 +6,15 @@ and extracts registered test cases.
 
 from __future__ import annotations
 
+import fnmatch
 import importlib
 import importlib.util
 import logging
+import os
+import re
 import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 from agentprobe.core.models import TestCase
@@ -17,6 +22,86 @@ from agentprobe.core.scenario import get_scenarios
 
 logger = logging.getLogger(__name__)
 
+# Directory names never descended into during discovery, in addition to
+# any hidden (dot-prefixed) directory such as ``.git`` or ``.venv``.
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+# Maximum number of cached discovery walks; the oldest is dropped first.
+_WALK_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
+class _Walk:
+    """The result of one discovery walk.
+
+    Attributes:
+        dirs: (path, mtime_ns) of every directory searched. Adding or
+            removing an entry changes its directory's mtime, so the walk
+            is still valid while none of these have changed.
+        files: The matching files, sorted.
+    """
+
+    dirs: tuple[tuple[str, int], ...]
+    files: tuple[Path, ...]
+
+    def is_current(self) -> bool:
+        """Return True if no searched directory has changed since the walk."""
+        try:
+            return all(Path(path).stat().st_mtime_ns == mtime for path, mtime in self.dirs)
+        except OSError:
+            return False
+
+
+# Discovery walks keyed by (resolved root, pattern).
+_walk_cache: dict[tuple[str, str], _Walk] = {}
+
+
+def _iter_test_files(
+    root: str, name_pattern: re.Pattern[str], dirs: list[tuple[str, int]]
+) -> Iterator[str]:
+    """Recursively yield paths of files under ``root`` whose names match.
+
+    Uses ``os.scandir`` so directory entries carry their type information
+    and non-matching files never become ``Path`` objects. Each
+    subdirectory searched is appended to ``dirs`` with its mtime, read
+    before it is listed.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        logger.debug("Skipping unreadable directory: %s", root)
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
+                    continue
+                try:
+                    dirs.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                except OSError:
+                    continue
+                yield from _iter_test_files(entry.path, name_pattern, dirs)
+            elif name_pattern.match(entry.name) and entry.is_file():
+                yield entry.path
+
+
+def _discover(root: str, pattern: str) -> tuple[Path, ...]:
+    """Return the files under ``root`` matching ``pattern``, reusing a current walk."""
+    key = (root, pattern)
+    walk = _walk_cache.get(key)
+    if walk is not None and walk.is_current():
+        return walk.files
+
+    name_pattern = re.compile(fnmatch.translate(pattern))
+    dirs = [(root, Path(root).stat().st_mtime_ns)]
+    files = tuple(sorted(Path(p) for p in _iter_test_files(root, name_pattern, dirs)))
+    _walk_cache.pop(key, None)
+    _walk_cache[key] = _Walk(tuple(dirs), files)
+    while len(_walk_cache) > _WALK_CACHE_SIZE:
+        del _walk_cache[next(iter(_walk_cache))]
+    return files
+
 
 def discover_test_files(
     test_dir: str | Path,
@@ -24,9 +109,15 @@ def discover_test_files(
 ) -> list[Path]:
     """Find test files matching a pattern in the given directory.
 
+    The pattern is matched against file names only. Hidden directories
+    (``.git``, ``.venv``, ...) and ``__pycache__`` are not searched.
+
+    A walk is reused while none of the directories it searched has
+    changed, so repeated calls (e.g. in watch mode) only stat directories.
+
     Args:
         test_dir: Root directory to search.
-        pattern: Glob pattern for test files.
+        pattern: Glob pattern for test file names.
 
     Returns:
         Sorted list of matching file paths.
@@ -36,7 +127,10 @@ def discover_test_files(
         logger.warning("Test directory does not exist: %s", test_path)
         return []
 
-    files = sorted(test_path.rglob(pattern))
+    root = test_path.resolve()
+    found = _discover(str(root), pattern)
+    # Rebuild paths relative to the caller's spelling of ``test_dir``.
+    files = [test_path / p.relative_to(root) for p in found]
     logger.info("Discovered %d test files in %s", len(files), test_path)
     return files
 
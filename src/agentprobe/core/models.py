@@ -7,12 +7,73 @@ are frozen (immutable); input/configuration types are mutable.
 
 from __future__ import annotations
 
+import os
+import sys
+import threading
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
-from uuid import uuid4
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
+
+# ── Default Factories ──
+
+
+class _IDPool:
+    """Generates UUID4-formatted identifiers from pooled random bytes.
+
+    ``uuid4()`` reads 16 bytes from the OS and builds a ``UUID`` object for
+    every ID. The pool reads entropy in 4 KiB blocks instead and formats
+    the UUID string directly, keeping the RFC 4122 version and variant bits.
+    """
+
+    _BLOCK_SIZE = 4096
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._pos = 0
+
+    def reset(self) -> None:
+        """Discard buffered entropy and the lock (e.g. in a forked child process).
+
+        A fork can happen while another thread holds the lock, which would
+        leave it locked forever in the child, so a fresh lock is created.
+        """
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._pos = 0
+
+    def next(self) -> str:
+        """Return a new random identifier in canonical UUID4 form."""
+        with self._lock:
+            pos = self._pos
+            if pos >= len(self._buf):
+                self._buf = os.urandom(self._BLOCK_SIZE)
+                pos = 0
+            self._pos = pos + 16
+            h = self._buf[pos : pos + 16].hex()
+        variant = "89ab"[int(h[16], 16) & 3]
+        return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+
+
+_id_pool = _IDPool()
+# A forked child must not hand out the same IDs as its parent.
+os.register_at_fork(after_in_child=_id_pool.reset)
+_new_id = _id_pool.next
+
+# Model, tool, agent, evaluator and metric names take a handful of distinct
+# values across a run, so every instance shares one canonical string object.
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# ── Base Models ──
+
+
+class _FrozenModel(BaseModel):
+    """Base for the immutable output models: strict, frozen, no extra fields."""
+
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # ── Enumerations ──
 
@@ -60,7 +121,7 @@ class EvalVerdict(StrEnum):
 # ── Trace Models (frozen — assembled once, never mutated) ──
 
 
-class LLMCall(BaseModel):
+class LLMCall(_FrozenModel):
     """A single call to a language model within a trace.
 
     Attributes:
@@ -75,10 +136,8 @@ class LLMCall(BaseModel):
         timestamp: When the call was made.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    call_id: str = Field(default_factory=lambda: str(uuid4()))
-    model: str
+    call_id: str = Field(default_factory=_new_id)
+    model: _InternedStr
     input_tokens: int = Field(default=0, ge=0)
     output_tokens: int = Field(default=0, ge=0)
     input_text: str = ""
@@ -88,7 +147,7 @@ class LLMCall(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
-class ToolCall(BaseModel):
+class ToolCall(_FrozenModel):
     """A single tool invocation within a trace.
 
     Attributes:
@@ -102,10 +161,8 @@ class ToolCall(BaseModel):
         timestamp: When the call was made.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    call_id: str = Field(default_factory=lambda: str(uuid4()))
-    tool_name: str
+    call_id: str = Field(default_factory=_new_id)
+    tool_name: _InternedStr
     tool_input: dict[str, Any] = Field(default_factory=dict)
     tool_output: Any = None
     success: bool = True
@@ -114,7 +171,7 @@ class ToolCall(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
-class Turn(BaseModel):
+class Turn(_FrozenModel):
     """A single turn (event) within a trace timeline.
 
     Attributes:
@@ -126,9 +183,7 @@ class Turn(BaseModel):
         timestamp: When the turn occurred.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    turn_id: str = Field(default_factory=lambda: str(uuid4()))
+    turn_id: str = Field(default_factory=_new_id)
     turn_type: TurnType
     content: str = ""
     llm_call: LLMCall | None = None
@@ -136,7 +191,7 @@ class Turn(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
-class Trace(BaseModel):
+class Trace(_FrozenModel):
     """Complete execution trace of an agent run.
 
     A trace captures the full timeline of LLM calls, tool invocations,
@@ -160,11 +215,9 @@ class Trace(BaseModel):
         created_at: When the trace was created.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    trace_id: str = Field(default_factory=lambda: str(uuid4()))
-    agent_name: str
-    model: str | None = None
+    trace_id: str = Field(default_factory=_new_id)
+    agent_name: _InternedStr
+    model: _InternedStr | None = None
     input_text: str = ""
     output_text: str = ""
     turns: tuple[Turn, ...] = ()
@@ -181,7 +234,7 @@ class Trace(BaseModel):
 # ── Evaluation Models (frozen) ──
 
 
-class EvalResult(BaseModel):
+class EvalResult(_FrozenModel):
     """Result produced by an evaluator.
 
     Attributes:
@@ -194,10 +247,8 @@ class EvalResult(BaseModel):
         created_at: When the evaluation was performed.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    eval_id: str = Field(default_factory=lambda: str(uuid4()))
-    evaluator_name: str
+    eval_id: str = Field(default_factory=_new_id)
+    evaluator_name: _InternedStr
     verdict: EvalVerdict
     score: float = Field(..., ge=0.0, le=1.0)
     reason: str = ""
@@ -205,7 +256,7 @@ class EvalResult(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
-class AssertionResult(BaseModel):
+class AssertionResult(_FrozenModel):
     """Result of a single test assertion.
 
     Attributes:
@@ -216,8 +267,6 @@ class AssertionResult(BaseModel):
         message: Descriptive message about the result.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     assertion_type: str
     passed: bool
     expected: Any = None
@@ -248,7 +297,7 @@ class TestCase(BaseModel):
 
     model_config = ConfigDict(strict=True, extra="forbid")
 
-    test_id: str = Field(default_factory=lambda: str(uuid4()))
+    test_id: str = Field(default_factory=_new_id)
     name: str = Field(..., min_length=1, max_length=200)
     description: str = ""
     input_text: str = ""
@@ -269,7 +318,7 @@ class TestCase(BaseModel):
         return v
 
 
-class TestResult(BaseModel):
+class TestResult(_FrozenModel):
     """Complete result of executing a single test case.
 
     Attributes:
@@ -285,9 +334,7 @@ class TestResult(BaseModel):
         created_at: When the result was recorded.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    result_id: str = Field(default_factory=lambda: str(uuid4()))
+    result_id: str = Field(default_factory=_new_id)
     test_name: str = Field(..., min_length=1, max_length=200)
     status: TestStatus
     score: float = Field(default=0.0, ge=0.0, le=1.0)
@@ -302,7 +349,7 @@ class TestResult(BaseModel):
 # ── Aggregate Models (frozen) ──
 
 
-class CostBreakdown(BaseModel):
+class CostBreakdown(_FrozenModel):
     """Cost breakdown for a single model.
 
     Attributes:
@@ -315,9 +362,7 @@ class CostBreakdown(BaseModel):
         call_count: Number of calls to this model.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    model: str
+    model: _InternedStr
     input_tokens: int = Field(default=0, ge=0)
     output_tokens: int = Field(default=0, ge=0)
     input_cost_usd: float = Field(default=0.0, ge=0.0)
@@ -326,7 +371,7 @@ class CostBreakdown(BaseModel):
     call_count: int = Field(default=0, ge=0)
 
 
-class CostSummary(BaseModel):
+class CostSummary(_FrozenModel):
     """Aggregate cost summary for a trace or test suite.
 
     Attributes:
@@ -338,8 +383,6 @@ class CostSummary(BaseModel):
         total_output_tokens: Aggregate output tokens.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     total_llm_cost_usd: float = Field(default=0.0, ge=0.0)
     total_tool_cost_usd: float = Field(default=0.0, ge=0.0)
     total_cost_usd: float = Field(default=0.0, ge=0.0)
@@ -391,7 +434,7 @@ class ChaosType(StrEnum):
 # ── Conversation Models (frozen) ──
 
 
-class ConversationTurn(BaseModel):
+class ConversationTurn(_FrozenModel):
     """Specification for a single turn in a multi-turn conversation test.
 
     Attributes:
@@ -402,16 +445,14 @@ class ConversationTurn(BaseModel):
         metadata: Additional turn-level configuration.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    turn_id: str = Field(default_factory=lambda: str(uuid4()))
+    turn_id: str = Field(default_factory=_new_id)
     input_text: str
     expected_output: str | None = None
     evaluators: tuple[str, ...] = ()
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
-class TurnResult(BaseModel):
+class TurnResult(_FrozenModel):
     """Result from executing a single conversation turn.
 
     Attributes:
@@ -422,8 +463,6 @@ class TurnResult(BaseModel):
         duration_ms: Execution time for this turn in milliseconds.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     turn_index: int = Field(ge=0)
     input_text: str = ""
     trace: Trace | None = None
@@ -431,7 +470,7 @@ class TurnResult(BaseModel):
     duration_ms: int = Field(default=0, ge=0)
 
 
-class ConversationResult(BaseModel):
+class ConversationResult(_FrozenModel):
     """Aggregate result from a multi-turn conversation test.
 
     Attributes:
@@ -444,9 +483,7 @@ class ConversationResult(BaseModel):
         total_duration_ms: Total execution time in milliseconds.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    conversation_id: str = Field(default_factory=lambda: str(uuid4()))
+    conversation_id: str = Field(default_factory=_new_id)
     agent_name: str = ""
     turn_results: tuple[TurnResult, ...] = ()
     total_turns: int = Field(default=0, ge=0)
@@ -458,7 +495,7 @@ class ConversationResult(BaseModel):
 # ── Statistical Models (frozen) ──
 
 
-class StatisticalSummary(BaseModel):
+class StatisticalSummary(_FrozenModel):
     """Summary statistics from repeated evaluations.
 
     Attributes:
@@ -474,8 +511,6 @@ class StatisticalSummary(BaseModel):
         ci_upper: Upper bound of 95% confidence interval.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     evaluator_name: str
     sample_count: int = Field(ge=1)
     scores: tuple[float, ...] = ()
@@ -491,7 +526,7 @@ class StatisticalSummary(BaseModel):
 # ── Regression Models (frozen) ──
 
 
-class TestComparison(BaseModel):
+class TestComparison(_FrozenModel):
     """Comparison of a single test between baseline and current results.
 
     Attributes:
@@ -503,8 +538,6 @@ class TestComparison(BaseModel):
         is_improvement: Whether the change constitutes an improvement.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     test_name: str
     baseline_score: float = Field(ge=0.0, le=1.0)
     current_score: float = Field(ge=0.0, le=1.0)
@@ -513,7 +546,7 @@ class TestComparison(BaseModel):
     is_improvement: bool = False
 
 
-class RegressionReport(BaseModel):
+class RegressionReport(_FrozenModel):
     """Report from comparing current results against a baseline.
 
     Attributes:
@@ -526,8 +559,6 @@ class RegressionReport(BaseModel):
         threshold: Score delta threshold used for regression detection.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     baseline_name: str
     comparisons: tuple[TestComparison, ...] = ()
     total_tests: int = Field(default=0, ge=0)
@@ -540,7 +571,7 @@ class RegressionReport(BaseModel):
 # ── Budget Models (frozen) ──
 
 
-class BudgetCheckResult(BaseModel):
+class BudgetCheckResult(_FrozenModel):
     """Result of checking a cost against a budget.
 
     Attributes:
@@ -551,8 +582,6 @@ class BudgetCheckResult(BaseModel):
         utilization_pct: Percentage of budget used.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     within_budget: bool
     actual_cost_usd: float = Field(ge=0.0)
     budget_limit_usd: float = Field(ge=0.0)
@@ -563,7 +592,7 @@ class BudgetCheckResult(BaseModel):
 # ── Snapshot/Diff Models (frozen) ──
 
 
-class DiffItem(BaseModel):
+class DiffItem(_FrozenModel):
     """A single difference between two snapshots.
 
     Attributes:
@@ -573,15 +602,13 @@ class DiffItem(BaseModel):
         similarity: Similarity score for this dimension (0.0 to 1.0).
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     dimension: str
     expected: Any = None
     actual: Any = None
     similarity: float = Field(default=0.0, ge=0.0, le=1.0)
 
 
-class SnapshotDiff(BaseModel):
+class SnapshotDiff(_FrozenModel):
     """Comparison result between a snapshot and current output.
 
     Attributes:
@@ -592,8 +619,6 @@ class SnapshotDiff(BaseModel):
         threshold: Similarity threshold used.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     snapshot_name: str
     overall_similarity: float = Field(default=0.0, ge=0.0, le=1.0)
     diffs: tuple[DiffItem, ...] = ()
@@ -604,7 +629,7 @@ class SnapshotDiff(BaseModel):
 # ── Trace Replay Models (frozen) ──
 
 
-class TraceStep(BaseModel):
+class TraceStep(_FrozenModel):
     """A single step in a time-travel trace, with cumulative metrics.
 
     Attributes:
@@ -616,8 +641,6 @@ class TraceStep(BaseModel):
         cumulative_latency_ms: Total latency up to this step.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     step_index: int = Field(ge=0)
     turn: Turn
     cumulative_input_tokens: int = Field(default=0, ge=0)
@@ -626,7 +649,7 @@ class TraceStep(BaseModel):
     cumulative_latency_ms: int = Field(default=0, ge=0)
 
 
-class ReplayDiff(BaseModel):
+class ReplayDiff(_FrozenModel):
     """Diff between an original trace and a replay trace.
 
     Attributes:
@@ -638,8 +661,6 @@ class ReplayDiff(BaseModel):
         replay_output: Output from the replay trace.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     original_trace_id: str = ""
     replay_trace_id: str = ""
     tool_call_diffs: tuple[DiffItem, ...] = ()
@@ -651,7 +672,7 @@ class ReplayDiff(BaseModel):
 # ── Chaos Models (frozen) ──
 
 
-class ChaosOverride(BaseModel):
+class ChaosOverride(_FrozenModel):
     """Configuration for a single chaos fault injection.
 
     Attributes:
@@ -662,8 +683,6 @@ class ChaosOverride(BaseModel):
         error_message: Custom error message for ERROR type.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     chaos_type: ChaosType
     probability: float = Field(default=1.0, ge=0.0, le=1.0)
     target_tool: str | None = None
@@ -674,7 +693,7 @@ class ChaosOverride(BaseModel):
 # ── Aggregate Models (frozen) ──
 
 
-class AgentRun(BaseModel):
+class AgentRun(_FrozenModel):
     """A complete agent test run encompassing multiple test results.
 
     Attributes:
@@ -694,10 +713,8 @@ class AgentRun(BaseModel):
         created_at: When the run started.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    run_id: str = Field(default_factory=lambda: str(uuid4()))
-    agent_name: str
+    run_id: str = Field(default_factory=_new_id)
+    agent_name: _InternedStr
     status: RunStatus
     test_results: tuple[TestResult, ...] = ()
     total_tests: int = Field(default=0, ge=0)
@@ -715,7 +732,7 @@ class AgentRun(BaseModel):
 # ── Metric Models (frozen) ──
 
 
-class MetricDefinition(BaseModel):
+class MetricDefinition(_FrozenModel):
     """Definition of a named metric that can be collected and tracked.
 
     Attributes:
@@ -726,16 +743,14 @@ class MetricDefinition(BaseModel):
         lower_is_better: Whether lower values indicate better performance.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    name: str = Field(..., min_length=1, max_length=200)
+    name: _InternedStr = Field(..., min_length=1, max_length=200)
     metric_type: MetricType
     description: str = ""
     unit: str = ""
     lower_is_better: bool = True
 
 
-class MetricValue(BaseModel):
+class MetricValue(_FrozenModel):
     """A single metric measurement at a point in time.
 
     Attributes:
@@ -746,16 +761,14 @@ class MetricValue(BaseModel):
         timestamp: When the measurement was taken.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    metric_name: str = Field(..., min_length=1)
+    metric_name: _InternedStr = Field(..., min_length=1)
     value: float
     tags: tuple[str, ...] = ()
     metadata: dict[str, Any] = Field(default_factory=dict)
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
-class MetricAggregation(BaseModel):
+class MetricAggregation(_FrozenModel):
     """Aggregated statistics for a collection of metric values.
 
     Attributes:
@@ -770,9 +783,7 @@ class MetricAggregation(BaseModel):
         std_dev: Standard deviation.
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
-    metric_name: str = Field(..., min_length=1)
+    metric_name: _InternedStr = Field(..., min_length=1)
     count: int = Field(ge=1)
     mean: float = 0.0
     median: float = 0.0
@@ -786,7 +797,7 @@ class MetricAggregation(BaseModel):
 # ── Trace Diff Models (frozen) ──
 
 
-class TraceDiffReport(BaseModel):
+class TraceDiffReport(_FrozenModel):
     """Report from comparing two independent traces.
 
     Compares output text, tool call sequences, model usage,
@@ -802,8 +813,6 @@ class TraceDiffReport(BaseModel):
         overall_similarity: Weighted similarity score (0.0 to 1.0).
     """
 
-    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
-
     trace_a_id: str = ""
     trace_b_id: str = ""
     tool_call_diffs: tuple[DiffItem, ...] = ()
@@ -26,6 +26,11 @@ class AdapterProtocol(Protocol):
 
     Adapters wrap specific agent frameworks (LangChain, CrewAI, etc.)
     and translate their execution into AgentProbe's Trace format.
+
+    Adapters may also expose an optional ``max_concurrency: int``
+    attribute (e.g. the size of their HTTP connection pool). When
+    present, the parallel runner never runs more invocations at once.
+    It is not part of the protocol so existing adapters still conform.
     """
 
     @property
@@ -7,24 +7,38 @@ and assembles results into an AgentRun.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
 import time
+import weakref
+from collections import Counter
 from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import ValidationError
 
 from agentprobe.core.config import AgentProbeConfig
 from agentprobe.core.models import (
     AgentRun,
     EvalResult,
+    EvalVerdict,
     RunStatus,
     TestCase,
     TestResult,
     TestStatus,
     Trace,
+    _new_id,
 )
 from agentprobe.core.protocols import AdapterProtocol, EvaluatorProtocol
 
 logger = logging.getLogger(__name__)
 
+# Evaluator verdicts that let a test pass.
+_PASSING_VERDICTS = frozenset({EvalVerdict.PASS, EvalVerdict.PARTIAL})
+
 
 class TestRunner:
     """Orchestrates test case execution against an agent adapter.
@@ -50,6 +64,11 @@ class TestRunner:
         """
         self._config = config or AgentProbeConfig()
         self._evaluators = evaluators or []
+        # Parallel-run semaphore, reused across run() calls on the same
+        # event loop with the same limit: (loop ref, limit, semaphore).
+        self._semaphore: (
+            tuple[weakref.ref[asyncio.AbstractEventLoop], int, asyncio.Semaphore] | None
+        ) = None
 
     async def run(
         self,
@@ -66,18 +85,23 @@ class TestRunner:
             An AgentRun with all results.
         """
         start = time.monotonic()
-        results: list[TestResult] = []
+        # Neither execution path mutates the cases, so a list is used as-is.
+        cases = test_cases if isinstance(test_cases, list) else list(test_cases)
 
-        if self._config.runner.parallel:
-            results = await self._run_parallel(list(test_cases), adapter)
-        else:
-            results = await self._run_sequential(list(test_cases), adapter)
+        try:
+            if self._config.runner.parallel:
+                results = await self._run_parallel(cases, adapter)
+            else:
+                results = await self._run_sequential(cases, adapter)
+        finally:
+            await self._close_evaluators()
 
         elapsed_ms = int((time.monotonic() - start) * 1000)
-        passed = sum(1 for r in results if r.status == TestStatus.PASSED)
-        failed = sum(1 for r in results if r.status == TestStatus.FAILED)
-        errors = sum(1 for r in results if r.status == TestStatus.ERROR)
-        skipped = sum(1 for r in results if r.status == TestStatus.SKIPPED)
+        counts = Counter(r.status for r in results)
+        passed = counts[TestStatus.PASSED]
+        failed = counts[TestStatus.FAILED]
+        errors = counts[TestStatus.ERROR]
+        skipped = counts[TestStatus.SKIPPED]
 
         status = RunStatus.COMPLETED if errors == 0 else RunStatus.FAILED
 
@@ -93,6 +117,21 @@ class TestRunner:
             duration_ms=elapsed_ms,
         )
 
+    async def _close_evaluators(self) -> None:
+        """Close evaluators that hold resources, such as HTTP sessions.
+
+        Their sessions are bound to this run's event loop; evaluators reopen
+        them on their next use.
+        """
+        for evaluator in self._evaluators:
+            close = getattr(evaluator, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception:
+                logger.warning("Failed to close evaluator '%s'", evaluator.name, exc_info=True)
+
     async def _run_sequential(
         self,
         test_cases: list[TestCase],
@@ -111,23 +150,135 @@ class TestRunner:
         adapter: AdapterProtocol,
     ) -> list[TestResult]:
         """Execute tests concurrently with a semaphore limit."""
-        semaphore = asyncio.Semaphore(self._config.runner.max_workers)
-        results: list[TestResult] = [None] * len(test_cases)  # type: ignore[list-item]
+        semaphore = self._get_semaphore(self._concurrency_limit(adapter))
 
-        async def _run_with_semaphore(idx: int, tc: TestCase) -> None:
+        async def _bounded(tc: TestCase) -> TestResult:
             async with semaphore:
-                results[idx] = await self._execute_single(tc, adapter)
+                return await self._execute_single(tc, adapter)
 
-        async with asyncio.TaskGroup() as tg:
-            for i, tc in enumerate(test_cases):
-                tg.create_task(_run_with_semaphore(i, tc))
+        # gather() returns results in input order, so no index bookkeeping.
+        return list(await asyncio.gather(*(_bounded(tc) for tc in test_cases)))
 
-        return results
+    def _get_semaphore(self, limit: int) -> asyncio.Semaphore:
+        """Return the runner's semaphore, rebuilding it for a new loop or limit.
+
+        A semaphore binds to the event loop it is first awaited on, so it
+        is only reused while the running loop and the limit are unchanged.
+        """
+        loop = asyncio.get_running_loop()
+        cached = self._semaphore
+        if cached is not None and cached[0]() is loop and cached[1] == limit:
+            return cached[2]
+        semaphore = asyncio.Semaphore(limit)
+        self._semaphore = (weakref.ref(loop), limit, semaphore)
+        return semaphore
+
+    def _concurrency_limit(self, adapter: AdapterProtocol) -> int:
+        """Return the parallel limit, capped by the adapter's own if it reports one."""
+        limit = self._config.runner.max_workers
+        adapter_limit = getattr(adapter, "max_concurrency", None)
+        if isinstance(adapter_limit, int) and adapter_limit >= 1:
+            limit = min(limit, adapter_limit)
+        logger.debug("Running up to %d tests concurrently against '%s'", limit, adapter.name)
+        return limit
 
     async def _execute_single(
         self,
         test_case: TestCase,
         adapter: AdapterProtocol,
+    ) -> TestResult:
+        """Execute a single test case, consulting the result cache if enabled.
+
+        Args:
+            test_case: The test to execute.
+            adapter: The agent adapter.
+
+        Returns:
+            A TestResult reflecting the outcome.
+        """
+        if not self._config.runner.cache_results:
+            return await self._execute_uncached(test_case, adapter)
+
+        cache_path = self._cache_path(test_case, adapter)
+        if cache_path is None:
+            return await self._execute_uncached(test_case, adapter)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            logger.debug("Test '%s' served from result cache", test_case.name)
+            # A replay is a new result: it must not overwrite the stored
+            # row of the run that produced it.
+            return cached.model_copy(
+                update={"result_id": _new_id(), "created_at": datetime.now(UTC)}
+            )
+
+        result = await self._execute_uncached(test_case, adapter)
+        # Errors and timeouts are usually transient, so only settled
+        # outcomes are cached.
+        if result.status in (TestStatus.PASSED, TestStatus.FAILED):
+            self._store_cached(cache_path, result)
+        return result
+
+    def _cache_path(self, test_case: TestCase, adapter: AdapterProtocol) -> Path | None:
+        """Return the cache file for a test case run against an adapter.
+
+        The key covers everything that shapes the result: the adapter, the
+        test case's inputs and settings, and each evaluator's configuration
+        fingerprint (``cache_key()``).
+
+        Returns:
+            The cache file, or None if an evaluator cannot fingerprint its
+            configuration and the result must not be cached.
+        """
+        evaluator_keys: list[str] = []
+        for evaluator in self._evaluators:
+            cache_key = getattr(evaluator, "cache_key", None)
+            key = cache_key() if cache_key is not None else None
+            if not isinstance(key, str):
+                logger.debug(
+                    "Result cache disabled: evaluator '%s' has no cache key", evaluator.name
+                )
+                return None
+            evaluator_keys.append(f"{evaluator.name}={key}")
+        key_parts = (
+            adapter.name,
+            test_case.name,
+            test_case.input_text,
+            test_case.expected_output or "",
+            repr(test_case.timeout_seconds),
+            json.dumps(test_case.metadata, sort_keys=True, default=str),
+            *evaluator_keys,
+        )
+        key = hashlib.blake2b("\x1f".join(key_parts).encode(), digest_size=16).hexdigest()
+        return Path(self._config.runner.cache_dir) / f"{key}.json"
+
+    @staticmethod
+    def _load_cached(path: Path) -> TestResult | None:
+        """Load a cached result, or return None if absent or unreadable."""
+        try:
+            return TestResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError):
+            logger.warning("Ignoring unreadable result cache entry: %s", path)
+            return None
+
+    @staticmethod
+    def _store_cached(path: Path, result: TestResult) -> None:
+        """Persist a result to the cache, logging rather than failing on I/O errors."""
+        # Written to a temporary file and renamed into place, so concurrent
+        # runs never read a partially written entry.
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(result.model_dump_json(), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            logger.warning("Could not write result cache entry: %s", path)
+
+    async def _execute_uncached(
+        self,
+        test_case: TestCase,
+        adapter: AdapterProtocol,
     ) -> TestResult:
         """Execute a single test case with timeout and error handling.
 
@@ -168,12 +319,13 @@ class TestRunner:
         eval_results = await self._run_evaluators(test_case, trace)
         elapsed_ms = int((time.monotonic() - start) * 1000)
 
-        if eval_results:
-            avg_score = sum(r.score for r in eval_results) / len(eval_results)
-            all_passed = all(r.verdict.value in ("pass", "partial") for r in eval_results)
-        else:
-            avg_score = 1.0
-            all_passed = True
+        total_score = 0.0
+        all_passed = True
+        for r in eval_results:
+            total_score += r.score
+            if r.verdict not in _PASSING_VERDICTS:
+                all_passed = False
+        avg_score = total_score / len(eval_results) if eval_results else 1.0
 
         status = TestStatus.PASSED if all_passed else TestStatus.FAILED
 
@@ -191,7 +343,7 @@ class TestRunner:
         test_case: TestCase,
         trace: Trace,
     ) -> list[EvalResult]:
-        """Run all evaluators against a test result.
+        """Run all evaluators concurrently against a test result.
 
         Args:
             test_case: The test case.
@@ -200,15 +352,82 @@ class TestRunner:
         Returns:
             List of evaluation results.
         """
+        if self._config.runner.fail_fast:
+            return await self._run_evaluators_fail_fast(test_case, trace)
+
+        # Evaluators are independent (often network-bound LLM judges), so
+        # they run concurrently; results keep the evaluator order.
+        outcomes = await asyncio.gather(
+            *(evaluator.evaluate(test_case, trace) for evaluator in self._evaluators),
+            return_exceptions=True,
+        )
         results: list[EvalResult] = []
-        for evaluator in self._evaluators:
-            try:
-                result = await evaluator.evaluate(test_case, trace)
-                results.append(result)
-            except Exception:
-                logger.exception(
+        for evaluator, outcome in zip(self._evaluators, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(
                     "Evaluator '%s' failed for test '%s'",
                     evaluator.name,
                     test_case.name,
+                    exc_info=outcome,
                 )
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
         return results
+
+    async def _run_evaluators_fail_fast(
+        self,
+        test_case: TestCase,
+        trace: Trace,
+    ) -> list[EvalResult]:
+        """Run evaluators concurrently, cancelling the rest on the first failure.
+
+        Args:
+            test_case: The test case.
+            trace: The execution trace.
+
+        Returns:
+            Results of the evaluators that completed, in evaluator order.
+        """
+        tasks = {
+            asyncio.create_task(evaluator.evaluate(test_case, trace)): i
+            for i, evaluator in enumerate(self._evaluators)
+        }
+        completed: dict[int, EvalResult] = {}
+        pending: set[asyncio.Task[EvalResult]] = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = False
+                for task in done:
+                    idx = tasks[task]
+                    exc = task.exception()
+                    if exc is None:
+                        result = task.result()
+                        completed[idx] = result
+                        failed = failed or result.verdict == EvalVerdict.FAIL
+                    elif isinstance(exc, Exception):
+                        logger.error(
+                            "Evaluator '%s' failed for test '%s'",
+                            self._evaluators[idx].name,
+                            test_case.name,
+                            exc_info=exc,
+                        )
+                    else:
+                        raise exc
+                if failed:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if pending:
+            logger.info(
+                "Fail-fast: cancelled %d evaluator(s) for test '%s'",
+                len(pending),
+                test_case.name,
+            )
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [completed[i] for i in sorted(completed)]
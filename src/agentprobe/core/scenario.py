@@ -14,6 +14,9 @@ from agentprobe.core.models import TestCase
 
 # Global registry: module_path -> list of TestCase
 _scenario_registry: dict[str, list[TestCase]] = {}
+# Every registered scenario in registration order, so listing all of
+# them is a single list copy rather than a flatten over modules.
+_all_scenarios: list[TestCase] = []
 
 
 def scenario(
@@ -64,6 +67,7 @@ def scenario(
 
         module = func.__module__
         _scenario_registry.setdefault(module, []).append(test_case)
+        _all_scenarios.append(test_case)
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -87,9 +91,10 @@ def get_scenarios(module_name: str | None = None) -> list[TestCase]:
     """
     if module_name is not None:
         return list(_scenario_registry.get(module_name, []))
-    return [tc for cases in _scenario_registry.values() for tc in cases]
+    return list(_all_scenarios)
 
 
 def clear_registry() -> None:
     """Clear all registered scenarios. Primarily for testing."""
     _scenario_registry.clear()
+    _all_scenarios.clear()
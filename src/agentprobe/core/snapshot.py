@@ -7,7 +7,15 @@ calls, response structure, key facts, cost, and latency.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import operator
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 
 from agentprobe.core.exceptions import SnapshotError
@@ -15,6 +23,14 @@ from agentprobe.core.models import DiffItem, SnapshotDiff, Trace
 
 logger = logging.getLogger(__name__)
 
+# Word tokens for keyword overlap; punctuation is not part of a word.
+_WORD_RE = re.compile(r"\w+")
+
+
+def _serialize(trace: Trace) -> bytes:
+    """Serialize a trace to the snapshot file format."""
+    return trace.model_dump_json(indent=2).encode("utf-8")
+
 
 def _sequence_similarity(a: list[str], b: list[str]) -> float:
     """Compute normalized similarity between two string sequences."""
@@ -22,14 +38,25 @@ def _sequence_similarity(a: list[str], b: list[str]) -> float:
         return 1.0
     if not a or not b:
         return 0.0
-    matches = sum(1 for x, y in zip(a, b, strict=False) if x == y)
+    # map() stops at the shorter sequence, like zip(strict=False).
+    matches: int = sum(map(operator.eq, a, b))
     return matches / max(len(a), len(b))
 
 
+@functools.lru_cache(maxsize=256)
+def _word_set(text: str) -> frozenset[str]:
+    """Return the lowercase word set of a text, ignoring punctuation.
+
+    Cached because a baseline snapshot is typically compared against
+    many current traces with the same output text.
+    """
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
 def _keyword_overlap(a: str, b: str) -> float:
     """Compute keyword overlap between two strings."""
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
+    words_a = _word_set(a)
+    words_b = _word_set(b)
     if not words_a and not words_b:
         return 1.0
     if not words_a or not words_b:
@@ -39,6 +66,32 @@ def _keyword_overlap(a: str, b: str) -> float:
     return len(intersection) / len(union)
 
 
+@dataclass(frozen=True, slots=True)
+class _BaselineDigest:
+    """The parts of a snapshot trace that ``compare`` reads."""
+
+    tools: tuple[str, ...]
+    output_text: str
+    tokens: int
+    latency_ms: int
+
+    @classmethod
+    def from_trace(cls, trace: Trace) -> _BaselineDigest:
+        """Extract the digest from a loaded snapshot trace."""
+        return cls(
+            tools=tuple(tc.tool_name for tc in trace.tool_calls),
+            output_text=trace.output_text,
+            tokens=trace.total_input_tokens + trace.total_output_tokens,
+            latency_ms=trace.total_latency_ms,
+        )
+
+
+def _compare_one(snapshot_dir: str, threshold: float, name: str, trace_json: bytes) -> SnapshotDiff:
+    """Compare one trace against a snapshot in a worker process."""
+    manager = SnapshotManager(snapshot_dir, threshold=threshold)
+    return manager.compare(name, Trace.model_validate_json(trace_json))
+
+
 class SnapshotManager:
     """Manages snapshot files for golden-file testing.
 
@@ -64,6 +117,9 @@ class SnapshotManager:
         """
         self._dir = Path(snapshot_dir)
         self._threshold = threshold
+        # Snapshot name -> ((mtime_ns, size), digest); repeated compares
+        # against an unchanged file skip the JSON parse and validation.
+        self._digests: dict[str, tuple[tuple[int, int], _BaselineDigest]] = {}
 
     def _snapshot_path(self, name: str) -> Path:
         """Get the file path for a named snapshot."""
@@ -80,8 +136,12 @@ class SnapshotManager:
             Path to the saved snapshot file.
         """
         self._dir.mkdir(parents=True, exist_ok=True)
+        return self._write(name, _serialize(trace))
+
+    def _write(self, name: str, data: bytes) -> Path:
+        """Write pre-serialized snapshot data under a name."""
         path = self._snapshot_path(name)
-        path.write_text(trace.model_dump_json(indent=2), encoding="utf-8")
+        path.write_bytes(data)
         logger.info("Snapshot saved: %s", path)
         return path
 
@@ -102,6 +162,38 @@ class SnapshotManager:
             raise SnapshotError(f"Snapshot not found: {name}")
         return Trace.model_validate_json(path.read_text(encoding="utf-8"))
 
+    async def save_async(self, name: str, trace: Trace) -> Path:
+        """Save a trace as a named snapshot without blocking the event loop.
+
+        Serialization and the file write run in the default executor.
+
+        Args:
+            name: Snapshot name.
+            trace: Trace to save.
+
+        Returns:
+            Path to the saved snapshot file.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.save, name, trace))
+
+    async def load_async(self, name: str) -> Trace:
+        """Load a named snapshot without blocking the event loop.
+
+        The file read and validation run in the default executor.
+
+        Args:
+            name: Snapshot name.
+
+        Returns:
+            The saved Trace.
+
+        Raises:
+            SnapshotError: If the snapshot does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.load, name))
+
     def exists(self, name: str) -> bool:
         """Check if a named snapshot exists."""
         return self._snapshot_path(name).exists()
@@ -144,11 +236,11 @@ class SnapshotManager:
         Raises:
             SnapshotError: If the snapshot does not exist.
         """
-        baseline = self.load(name)
+        baseline = self._baseline_digest(name)
         diffs: list[DiffItem] = []
 
         # Tool call sequence similarity
-        baseline_tools = [tc.tool_name for tc in baseline.tool_calls]
+        baseline_tools = list(baseline.tools)
         current_tools = [tc.tool_name for tc in current.tool_calls]
         tool_sim = _sequence_similarity(baseline_tools, current_tools)
         diffs.append(
@@ -172,7 +264,7 @@ class SnapshotManager:
         )
 
         # Token usage similarity
-        baseline_tokens = baseline.total_input_tokens + baseline.total_output_tokens
+        baseline_tokens = baseline.tokens
         current_tokens = current.total_input_tokens + current.total_output_tokens
         if baseline_tokens > 0:
             token_ratio = min(current_tokens, baseline_tokens) / max(
@@ -192,9 +284,9 @@ class SnapshotManager:
         )
 
         # Latency similarity
-        if baseline.total_latency_ms > 0:
-            latency_ratio = min(current.total_latency_ms, baseline.total_latency_ms) / max(
-                current.total_latency_ms, baseline.total_latency_ms
+        if baseline.latency_ms > 0:
+            latency_ratio = min(current.total_latency_ms, baseline.latency_ms) / max(
+                current.total_latency_ms, baseline.latency_ms
             )
         elif current.total_latency_ms == 0:
             latency_ratio = 1.0
@@ -203,7 +295,7 @@ class SnapshotManager:
         diffs.append(
             DiffItem(
                 dimension="latency",
-                expected=baseline.total_latency_ms,
+                expected=baseline.latency_ms,
                 actual=current.total_latency_ms,
                 similarity=round(latency_ratio, 4),
             )
@@ -223,6 +315,62 @@ class SnapshotManager:
             threshold=self._threshold,
         )
 
+    def compare_many(
+        self,
+        traces: Mapping[str, Trace],
+        *,
+        max_workers: int = 1,
+    ) -> dict[str, SnapshotDiff]:
+        """Compare several traces against their snapshots.
+
+        With ``max_workers`` above 1 the comparisons are spread across a
+        process pool, which pays off for large batches of big traces;
+        traces cross the process boundary as JSON.
+
+        Args:
+            traces: Mapping of snapshot names to current traces.
+            max_workers: Number of worker processes. 1 compares in-process.
+
+        Returns:
+            Mapping of snapshot names to their diffs, in input order.
+
+        Raises:
+            SnapshotError: If any snapshot does not exist.
+        """
+        if max_workers <= 1 or len(traces) <= 1:
+            return {name: self.compare(name, trace) for name, trace in traces.items()}
+
+        names = list(traces)
+        workers = min(max_workers, len(names))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            diffs = executor.map(
+                _compare_one,
+                repeat(str(self._dir)),
+                repeat(self._threshold),
+                names,
+                (traces[name].model_dump_json().encode("utf-8") for name in names),
+                chunksize=max(1, len(names) // (workers * 4)),
+            )
+            return dict(zip(names, diffs, strict=True))
+
+    def _baseline_digest(self, name: str) -> _BaselineDigest:
+        """Return the comparison digest for a snapshot, reusing it while unchanged.
+
+        Raises:
+            SnapshotError: If the snapshot does not exist.
+        """
+        try:
+            st = self._snapshot_path(name).stat()
+        except FileNotFoundError:
+            raise SnapshotError(f"Snapshot not found: {name}") from None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._digests.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        digest = _BaselineDigest.from_trace(self.load(name))
+        self._digests[name] = (stamp, digest)
+        return digest
+
     def update_all(self, snapshots: dict[str, Trace]) -> int:
         """Update multiple snapshots at once.
 
@@ -232,8 +380,14 @@ class SnapshotManager:
         Returns:
             Number of snapshots updated.
         """
+        self._dir.mkdir(parents=True, exist_ok=True)
+        # The same trace is often saved under several names; serialize it once.
+        serialized: dict[int, bytes] = {}
         count = 0
         for name, trace in snapshots.items():
-            self.save(name, trace)
+            data = serialized.get(id(trace))
+            if data is None:
+                data = serialized[id(trace)] = _serialize(trace)
+            self._write(name, data)
             count += 1
         return count
@@ -7,6 +7,7 @@ and suite-level costs against configured budget limits.
 from __future__ import annotations
 
 import logging
+import math
 
 from agentprobe.core.models import BudgetCheckResult, CostSummary
 
@@ -92,7 +93,8 @@ class BudgetEnforcer:
         """
         if self._suite_budget is None:
             return None
-        total = sum(cs.total_cost_usd for cs in cost_summaries)
+        # fsum avoids accumulated rounding error tipping a suite over its limit.
+        total = math.fsum(cs.total_cost_usd for cs in cost_summaries)
         result = self._check(total, self._suite_budget)
         if not result.within_budget:
             logger.warning(
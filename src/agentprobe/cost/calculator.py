@@ -6,12 +6,19 @@ per-trace costs based on token usage.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, ValidationError
 
 from agentprobe.core.exceptions import BudgetExceededError
 from agentprobe.core.models import CostBreakdown, CostSummary, LLMCall, Trace
@@ -20,19 +27,86 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_PRICING_DIR = Path(__file__).parent / "pricing_data"
 
+# PyYAML's LibYAML-backed safe loader when available, else the pure-Python one.
+_YamlLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Interned like ``LLMCall.model``, so pricing lookups for a call's model
+# compare identical string objects.
+_ModelName = Annotated[str, AfterValidator(sys.intern)]
+
+# (file name, mtime_ns, size) for each pricing file in a directory.
+_DirSignature = tuple[tuple[str, int, int], ...]
+
+
+class _PartialPricingError(Exception):
+    """Raised by ``_load_entries`` when some pricing files failed to parse.
+
+    Raising keeps the partial entries out of the ``lru_cache`` memo;
+    callers use ``entries`` as the best available pricing.
+    """
+
+    def __init__(self, entries: dict[str, PricingEntry]) -> None:
+        super().__init__("Some pricing files failed to load")
+        self.entries = entries
+
+
+def _dir_signature(directory: Path) -> _DirSignature:
+    """Return the signature of the pricing files in a directory."""
+    signature: list[tuple[str, int, int]] = []
+    for yaml_file in sorted(directory.glob("*.yaml")):
+        st = yaml_file.stat()
+        signature.append((yaml_file.name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _pricing_cache_path(directory: Path) -> Path:
+    """Return the on-disk cache file for a pricing directory."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.blake2b(str(directory.resolve()).encode(), digest_size=8).hexdigest()
+    return Path(base) / "agentprobe" / f"pricing-{key}.json"
+
+
+def _read_pricing_cache(directory: Path, signature: _DirSignature) -> dict[str, Any] | None:
+    """Return cached pricing data if it was built from the same files."""
+    try:
+        cached = json.loads(_pricing_cache_path(directory).read_bytes())
+    except (OSError, ValueError):
+        return None
+    # JSON turns the signature's tuples into lists.
+    if not isinstance(cached, dict) or cached.get("signature") != [list(f) for f in signature]:
+        return None
+    pricing = cached.get("pricing")
+    return pricing if isinstance(pricing, dict) else None
+
+
+def _write_pricing_cache(directory: Path, signature: _DirSignature, config: PricingConfig) -> None:
+    """Store parsed pricing data; failures only cost the next load a re-parse."""
+    path = _pricing_cache_path(directory)
+    payload = {"signature": signature, "pricing": config.model_dump(mode="json")}
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        logger.debug("Could not write pricing cache: %s", path)
+
 
 class PricingEntry(BaseModel):
     """Pricing for a single model.
 
+    Frozen because loaded entries are shared by every config read from the
+    same directory in a process.
+
     Attributes:
         model: Model identifier.
         input_cost_per_1k: Cost per 1,000 input tokens in USD.
         output_cost_per_1k: Cost per 1,000 output tokens in USD.
     """
 
-    model_config = ConfigDict(strict=True, extra="forbid")
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
 
-    model: str
+    model: _ModelName
     input_cost_per_1k: float = Field(ge=0.0)
     output_cost_per_1k: float = Field(ge=0.0)
 
@@ -46,12 +120,16 @@ class PricingConfig(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    entries: dict[str, PricingEntry] = Field(default_factory=dict)
+    entries: dict[_ModelName, PricingEntry] = Field(default_factory=dict)
 
     @classmethod
     def load_from_dir(cls, pricing_dir: str | Path | None = None) -> PricingConfig:
         """Load pricing data from all YAML files in a directory.
 
+        The parsed result is cached in memory and under
+        ``$XDG_CACHE_HOME/agentprobe`` (``~/.cache`` by default), and reused
+        while every file's mtime and size are unchanged.
+
         Args:
             pricing_dir: Directory containing pricing YAML files.
                 Defaults to the bundled pricing_data directory.
@@ -60,27 +138,86 @@ class PricingConfig(BaseModel):
             A PricingConfig with all entries loaded.
         """
         directory = Path(pricing_dir) if pricing_dir else _DEFAULT_PRICING_DIR
-        entries: dict[str, PricingEntry] = {}
 
         if not directory.is_dir():
             logger.warning("Pricing directory not found: %s", directory)
-            return cls(entries=entries)
+            return cls(entries={})
+
+        signature = _dir_signature(directory)
+        try:
+            entries = _load_entries(str(directory.resolve()), signature)
+        except _PartialPricingError as exc:
+            entries = exc.entries
+        # Each caller gets its own dict; the entries themselves are shared.
+        return cls(entries=dict(entries))
+
+    @classmethod
+    async def load_from_dir_async(cls, pricing_dir: str | Path | None = None) -> PricingConfig:
+        """Load pricing data without blocking the event loop.
+
+        The directory scan, file reads, and parsing run in the default
+        executor; see ``load_from_dir``.
+
+        Args:
+            pricing_dir: Directory containing pricing YAML files.
+                Defaults to the bundled pricing_data directory.
+
+        Returns:
+            A PricingConfig with all entries loaded.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(cls.load_from_dir, pricing_dir))
 
-        for yaml_file in sorted(directory.glob("*.yaml")):
-            try:
-                raw = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
-                if not isinstance(raw, dict):
-                    continue
-                models = raw.get("models", [])
-                for model_data in models:
-                    if isinstance(model_data, dict) and "model" in model_data:
-                        entry = PricingEntry.model_validate(model_data)
-                        entries[entry.model] = entry
-            except Exception:
-                logger.exception("Failed to load pricing from %s", yaml_file)
 
-        logger.info("Loaded pricing for %d models", len(entries))
-        return cls(entries=entries)
+@functools.lru_cache(maxsize=8)
+def _load_entries(directory_str: str, signature: _DirSignature) -> dict[str, PricingEntry]:
+    """Parse the pricing files of a directory, via the on-disk cache.
+
+    Memoized per process on the directory and its file signature, so
+    repeated ``CostCalculator()`` construction skips even the cache read.
+    """
+    directory = Path(directory_str)
+    cached = _read_pricing_cache(directory, signature)
+    if cached is not None:
+        try:
+            return PricingConfig.model_validate(cached).entries
+        except ValidationError:
+            logger.debug("Ignoring invalid pricing cache for %s", directory)
+
+    entries: dict[str, PricingEntry] = {}
+    failed = False
+    for name, _, _ in signature:
+        yaml_file = directory / name
+        try:
+            # LibYAML decodes the UTF-8 bytes itself.
+            raw = yaml.load(yaml_file.read_bytes(), Loader=_YamlLoader)
+            if not isinstance(raw, dict):
+                continue
+            models = raw.get("models", [])
+            for model_data in models:
+                if isinstance(model_data, dict) and "model" in model_data:
+                    entry = PricingEntry.model_validate(model_data)
+                    entries[entry.model] = entry
+        except Exception:
+            logger.exception("Failed to load pricing from %s", yaml_file)
+            failed = True
+
+    logger.info("Loaded pricing for %d models", len(entries))
+    if failed:
+        # Neither cache may keep a partial result: the next load retries
+        # the bad file and reports it again.
+        raise _PartialPricingError(entries)
+    _write_pricing_cache(directory, signature, PricingConfig(entries=entries))
+    return entries
+
+
+@dataclass(slots=True)
+class _ModelUsage:
+    """Running token totals for one model within a trace."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    call_count: int = 0
 
 
 class CostCalculator:
@@ -101,12 +238,38 @@ class CostCalculator:
     ) -> None:
         """Initialize the cost calculator.
 
+        The pricing is read once here; later changes to its entries are
+        not seen by this calculator.
+
         Args:
             pricing: Pricing configuration. Loads defaults if None.
             budget_limit_usd: Optional budget limit in USD.
         """
         self._pricing = pricing or PricingConfig.load_from_dir()
         self._budget_limit = budget_limit_usd
+        # Per-token (input, output) rates, read once from the pricing so the
+        # cost paths skip per-call model attribute access. Multiplying by a
+        # pre-divided rate rounds twice, so a cost can differ from
+        # ``tokens * cost_per_1k / 1000`` in the last bit.
+        self._rates: dict[str, tuple[float, float]] = {
+            model: (entry.input_cost_per_1k / 1000.0, entry.output_cost_per_1k / 1000.0)
+            for model, entry in self._pricing.entries.items()
+        }
+
+    def _token_costs(
+        self, model: str, input_tokens: int, output_tokens: int
+    ) -> tuple[float, float]:
+        """Price token counts for a model with a single pricing lookup.
+
+        Returns:
+            The (input, output) cost in USD; zeros if the model has no pricing.
+        """
+        rates = self._rates.get(model)
+        if rates is None:
+            logger.warning("No pricing found for model: %s", model)
+            return 0.0, 0.0
+        input_rate, output_rate = rates
+        return input_tokens * input_rate, output_tokens * output_rate
 
     def calculate_llm_cost(self, call: LLMCall) -> float:
         """Calculate the cost of a single LLM call.
@@ -117,13 +280,9 @@ class CostCalculator:
         Returns:
             Cost in USD.
         """
-        entry = self._pricing.entries.get(call.model)
-        if entry is None:
-            logger.warning("No pricing found for model: %s", call.model)
-            return 0.0
-
-        input_cost = (call.input_tokens / 1000.0) * entry.input_cost_per_1k
-        output_cost = (call.output_tokens / 1000.0) * entry.output_cost_per_1k
+        input_cost, output_cost = self._token_costs(
+            call.model, call.input_tokens, call.output_tokens
+        )
         return input_cost + output_cost
 
     def calculate_trace_cost(self, trace: Trace) -> CostSummary:
@@ -138,44 +297,44 @@ class CostCalculator:
         Raises:
             BudgetExceededError: If budget_limit_usd is set and exceeded.
         """
-        breakdowns: dict[str, dict[str, Any]] = {}
+        # Group token counts by model first and price each model once,
+        # keeping per-call work to integer adds.
+        usage: dict[str, _ModelUsage] = {}
 
         for call in trace.llm_calls:
-            cost = self.calculate_llm_cost(call)
-            entry = self._pricing.entries.get(call.model)
-            input_cost = 0.0
-            output_cost = 0.0
-            if entry is not None:
-                input_cost = (call.input_tokens / 1000.0) * entry.input_cost_per_1k
-                output_cost = (call.output_tokens / 1000.0) * entry.output_cost_per_1k
-
-            if call.model not in breakdowns:
-                breakdowns[call.model] = {
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "input_cost_usd": 0.0,
-                    "output_cost_usd": 0.0,
-                    "total_cost_usd": 0.0,
-                    "call_count": 0,
-                }
-
-            bd = breakdowns[call.model]
-            bd["input_tokens"] += call.input_tokens
-            bd["output_tokens"] += call.output_tokens
-            bd["input_cost_usd"] += input_cost
-            bd["output_cost_usd"] += output_cost
-            bd["total_cost_usd"] += cost
-            bd["call_count"] += 1
-
-        model_breakdowns = {
-            model: CostBreakdown(model=model, **data) for model, data in breakdowns.items()
-        }
-
-        total_llm = sum(bd.total_cost_usd for bd in model_breakdowns.values())
-        total_input = sum(bd.input_tokens for bd in model_breakdowns.values())
-        total_output = sum(bd.output_tokens for bd in model_breakdowns.values())
+            acc = usage.get(call.model)
+            if acc is None:
+                acc = usage[call.model] = _ModelUsage()
+            acc.input_tokens += call.input_tokens
+            acc.output_tokens += call.output_tokens
+            acc.call_count += 1
+
+        model_breakdowns: dict[str, CostBreakdown] = {}
+        total_llm = 0.0
+        total_input = 0
+        total_output = 0
+        for model, acc in usage.items():
+            input_cost, output_cost = self._token_costs(model, acc.input_tokens, acc.output_tokens)
+            model_cost = input_cost + output_cost
+            model_breakdowns[model] = CostBreakdown(
+                model=model,
+                input_tokens=acc.input_tokens,
+                output_tokens=acc.output_tokens,
+                input_cost_usd=input_cost,
+                output_cost_usd=output_cost,
+                total_cost_usd=model_cost,
+                call_count=acc.call_count,
+            )
+            total_llm += model_cost
+            total_input += acc.input_tokens
+            total_output += acc.output_tokens
+
+        # Checked before the summary is built; the error reports the full
+        # trace cost, so the token loop itself cannot stop early.
+        if self._budget_limit is not None and total_llm > self._budget_limit:
+            raise BudgetExceededError(total_llm, self._budget_limit)
 
-        summary = CostSummary(
+        return CostSummary(
             total_llm_cost_usd=total_llm,
             total_tool_cost_usd=0.0,
             total_cost_usd=total_llm,
@@ -183,8 +342,3 @@ class CostCalculator:
             total_input_tokens=total_input,
             total_output_tokens=total_output,
         )
-
-        if self._budget_limit is not None and total_llm > self._budget_limit:
-            raise BudgetExceededError(total_llm, self._budget_limit)
-
-        return summary
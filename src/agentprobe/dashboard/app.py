@@ -11,11 +11,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from agentprobe.dashboard.dependencies import build_storage
 from agentprobe.dashboard.routes.health import router as health_router
 from agentprobe.dashboard.routes.metrics import router as metrics_router
 from agentprobe.dashboard.routes.results import router as results_router
 from agentprobe.dashboard.routes.traces import router as traces_router
-from agentprobe.storage.sqlite import SQLiteStorage
 
 
 def create_app(db_path: str = ".agentprobe/traces.db") -> FastAPI:
@@ -27,7 +27,7 @@ def create_app(db_path: str = ".agentprobe/traces.db") -> FastAPI:
     Returns:
         A FastAPI app with all routes and storage wired up.
     """
-    storage = SQLiteStorage(db_path=db_path)
+    storage = build_storage(db_path)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
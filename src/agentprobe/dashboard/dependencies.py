@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+# Resolved at runtime when FastAPI inspects the dependency signature.
+from fastapi import Request  # noqa: TC002
+
 from agentprobe.storage.sqlite import SQLiteStorage
 
 
-def get_storage(db_path: str = ".agentprobe/traces.db") -> SQLiteStorage:
+def get_storage(request: Request) -> SQLiteStorage:
+    """Return the storage shared by the running dashboard app.
+
+    The app opens one storage in ``create_app`` and keeps it on
+    ``app.state``, so requests reuse its connection instead of setting
+    up a new one each time.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The app's SQLiteStorage instance.
+    """
+    storage: SQLiteStorage = request.app.state.storage
+    return storage
+
+
+def build_storage(db_path: str = ".agentprobe/traces.db") -> SQLiteStorage:
     """Create a SQLiteStorage instance for the given database path.
 
     Args:
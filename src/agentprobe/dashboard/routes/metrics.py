@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
+from pydantic import TypeAdapter
 
+from agentprobe.core.models import MetricAggregation
+from agentprobe.dashboard.streaming import json_array_response
 from agentprobe.metrics.aggregator import MetricAggregator
 
 router = APIRouter()
 
+# Responses are encoded straight to JSON bytes by pydantic-core; returning a
+# Response skips FastAPI's jsonable_encoder walk over the payload.
+_AGGREGATION_MAP = TypeAdapter(dict[str, MetricAggregation])
+
 
 @router.get("/api/metrics")
 async def list_metrics(
     request: Request,
     metric_name: str | None = None,
     limit: int = 1000,
-) -> list[dict[str, Any]]:
+) -> Response:
     """List metric values with optional filtering by name.
 
     Args:
@@ -25,27 +30,23 @@ async def list_metrics(
         limit: Maximum number of metric values to return.
 
     Returns:
-        A list of serialized metric value objects.
+        A JSON array of serialized metric value objects.
     """
     storage = request.app.state.storage
-    values = await storage.load_metrics(metric_name=metric_name, limit=limit)
-    return [v.model_dump(mode="json") for v in values]
+    return await json_array_response(storage.stream_metrics(metric_name=metric_name, limit=limit))
 
 
 @router.get("/api/metrics/summary")
-async def metrics_summary(request: Request) -> dict[str, dict[str, Any]]:
+async def metrics_summary(request: Request) -> Response:
     """Return aggregated summaries for all metrics.
 
     Args:
         request: The incoming request (carries app state).
 
     Returns:
-        A mapping of metric name to aggregated summary.
+        A JSON object mapping metric name to aggregated summary.
     """
     storage = request.app.state.storage
     values = await storage.load_metrics()
-    if not values:
-        return {}
-    aggregator = MetricAggregator()
-    aggregations = aggregator.aggregate_by_name(list(values))
-    return {name: agg.model_dump(mode="json") for name, agg in aggregations.items()}
+    aggregations = MetricAggregator().aggregate_by_name(list(values)) if values else {}
+    return Response(_AGGREGATION_MAP.dump_json(aggregations), media_type="application/json")
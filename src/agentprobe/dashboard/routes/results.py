@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from fastapi import APIRouter, HTTPException, Request, Response
 
-from fastapi import APIRouter, HTTPException, Request
+from agentprobe.dashboard.streaming import json_array_response
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ async def list_results(
     request: Request,
     test_name: str | None = None,
     limit: int = 100,
-) -> list[dict[str, Any]]:
+) -> Response:
     """List test results with optional filtering by test name.
 
     Args:
@@ -23,15 +23,14 @@ async def list_results(
         limit: Maximum number of results to return.
 
     Returns:
-        A list of serialized test result objects.
+        A JSON array of serialized test result objects.
     """
     storage = request.app.state.storage
-    results = await storage.load_results(test_name=test_name, limit=limit)
-    return [r.model_dump(mode="json") for r in results]
+    return await json_array_response(storage.stream_results(test_name=test_name, limit=limit))
 
 
 @router.get("/api/results/{result_id}")
-async def get_result(request: Request, result_id: str) -> dict[str, Any]:
+async def get_result(request: Request, result_id: str) -> Response:
     """Retrieve a single test result by ID.
 
     Args:
@@ -39,7 +38,7 @@ async def get_result(request: Request, result_id: str) -> dict[str, Any]:
         result_id: The unique result identifier.
 
     Returns:
-        The serialized test result object.
+        The serialized test result object as JSON.
 
     Raises:
         HTTPException: 404 if the result is not found.
@@ -48,5 +47,4 @@ async def get_result(request: Request, result_id: str) -> dict[str, Any]:
     result = await storage.load_result(result_id)
     if result is None:
         raise HTTPException(status_code=404, detail=f"Result '{result_id}' not found")
-    data: dict[str, Any] = result.model_dump(mode="json")
-    return data
+    return Response(result.model_dump_json(), media_type="application/json")
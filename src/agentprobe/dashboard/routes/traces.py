@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from fastapi import APIRouter, HTTPException, Request, Response
 
-from fastapi import APIRouter, HTTPException, Request
+from agentprobe.dashboard.streaming import json_array_response
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ async def list_traces(
     request: Request,
     agent_name: str | None = None,
     limit: int = 100,
-) -> list[dict[str, Any]]:
+) -> Response:
     """List traces with optional filtering by agent name.
 
     Args:
@@ -23,15 +23,14 @@ async def list_traces(
         limit: Maximum number of traces to return.
 
     Returns:
-        A list of serialized trace objects.
+        A JSON array of serialized trace objects.
     """
     storage = request.app.state.storage
-    traces = await storage.list_traces(agent_name=agent_name, limit=limit)
-    return [t.model_dump(mode="json") for t in traces]
+    return await json_array_response(storage.stream_traces(agent_name=agent_name, limit=limit))
 
 
 @router.get("/api/traces/{trace_id}")
-async def get_trace(request: Request, trace_id: str) -> dict[str, Any]:
+async def get_trace(request: Request, trace_id: str) -> Response:
     """Retrieve a single trace by ID.
 
     Args:
@@ -39,7 +38,7 @@ async def get_trace(request: Request, trace_id: str) -> dict[str, Any]:
         trace_id: The unique trace identifier.
 
     Returns:
-        The serialized trace object.
+        The serialized trace object as JSON.
 
     Raises:
         HTTPException: 404 if the trace is not found.
@@ -48,5 +47,4 @@ async def get_trace(request: Request, trace_id: str) -> dict[str, Any]:
     trace = await storage.load_trace(trace_id)
     if trace is None:
         raise HTTPException(status_code=404, detail=f"Trace '{trace_id}' not found")
-    result: dict[str, Any] = trace.model_dump(mode="json")
-    return result
+    return Response(trace.model_dump_json(), media_type="application/json")
@@ -0,0 +1,51 @@
+"""Streamed JSON array responses for the dashboard list endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# Encoded items are buffered up to roughly this size before each write,
+# so large listings are not sent one tiny chunk per item.
+_CHUNK_BYTES = 64 * 1024
+
+
+async def json_array_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """Stream an async iterator of models as a JSON array.
+
+    The body is encoded item by item as rows arrive, so neither the full
+    list of models nor the full response body is held in memory. The
+    first item is fetched before the response starts, so a failing query
+    still surfaces as an error status rather than a truncated body.
+
+    Args:
+        items: The models to serialize, in response order.
+
+    Returns:
+        A streaming ``application/json`` response.
+    """
+    first = await anext(items, None)
+    return StreamingResponse(_encode(first, items), media_type="application/json")
+
+
+async def _encode(first: BaseModel | None, rest: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """Yield the JSON array encoding of ``first`` followed by ``rest``."""
+    if first is None:
+        yield b"[]"
+        return
+    buffer = bytearray(b"[")
+    buffer += to_json(first)
+    async for item in rest:
+        if len(buffer) >= _CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+        buffer += b","
+        buffer += to_json(item)
+    buffer += b"]"
+    yield bytes(buffer)
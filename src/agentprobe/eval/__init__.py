@@ -2,12 +2,13 @@
 
 from agentprobe.eval.base import BaseEvaluator
 from agentprobe.eval.embedding import EmbeddingSimilarityEvaluator
-from agentprobe.eval.llm_judge import LLMJudge
+from agentprobe.eval.llm_judge import JudgeCache, LLMJudge
 from agentprobe.eval.rules import RuleBasedEvaluator, RuleSpec
 
 __all__ = [
     "BaseEvaluator",
     "EmbeddingSimilarityEvaluator",
+    "JudgeCache",
     "LLMJudge",
     "RuleBasedEvaluator",
     "RuleSpec",
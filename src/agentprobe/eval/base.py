@@ -6,13 +6,22 @@ timing, error wrapping, and consistent result construction.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import time
+import weakref
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Self
 
 from agentprobe.core.exceptions import EvaluatorError
 from agentprobe.core.models import EvalResult, EvalVerdict, TestCase, Trace
 
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +30,8 @@ class BaseEvaluator(ABC):
 
     Provides a public ``evaluate()`` template method that delegates to
     the subclass-defined ``_evaluate()``, adding timing and error handling.
+    Evaluators that call an HTTP API share one session through
+    ``_http_session()``; ``close()`` (or ``async with``) releases it.
 
     Attributes:
         _name: The evaluator's name, used in results and logging.
@@ -33,12 +44,78 @@ class BaseEvaluator(ABC):
             name: A unique name identifying this evaluator instance.
         """
         self._name = name
+        # HTTP session for API-backed evaluators, tied to the loop it was
+        # opened on.
+        self._http: aiohttp.ClientSession | None = None
+        self._http_loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
 
     @property
     def name(self) -> str:
         """Return the evaluator name."""
         return self._name
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def cache_key(self) -> str | None:
+        """Return a fingerprint of the configuration that shapes verdicts.
+
+        ``TestRunner`` folds this into its result cache key, so changing the
+        configuration invalidates cached results. The default of None
+        disables result caching for runs that use this evaluator.
+
+        Returns:
+            A string that changes whenever the verdicts could, or None.
+        """
+        return None
+
+    async def close(self) -> None:
+        """Release the evaluator's HTTP session, if one is open.
+
+        Safe to call repeatedly; the next API call opens a new session.
+        ``TestRunner`` calls this when a run finishes.
+        """
+        http, self._http, self._http_loop = self._http, None, None
+        await _close_session(http)
+
+    async def _http_session(self) -> aiohttp.ClientSession:
+        """Return the evaluator's HTTP session, opening one if needed.
+
+        A session is bound to the event loop it was created on, so when
+        called from a different loop the old session is closed and a new
+        one opened.
+        """
+        loop = asyncio.get_running_loop()
+        http = self._http
+        if (
+            http is not None
+            and not http.closed
+            and self._http_loop is not None
+            and self._http_loop() is loop
+        ):
+            return http
+        # The new session is in place before the old one's close suspends,
+        # so a concurrent caller reuses it instead of opening another.
+        stale = http
+        http = self._http = self._open_http()
+        self._http_loop = weakref.ref(loop)
+        await _close_session(stale)
+        return http
+
+    def _open_http(self) -> aiohttp.ClientSession:
+        """Open a new HTTP session; override to configure its connector."""
+        import aiohttp
+
+        return aiohttp.ClientSession()
+
     async def evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
         """Evaluate an agent trace for a given test case.
 
@@ -98,3 +175,12 @@ class BaseEvaluator(ABC):
             An evaluation result with score and verdict.
         """
         ...
+
+
+async def _close_session(http: aiohttp.ClientSession | None) -> None:
+    """Close an HTTP session unless it is missing or already closed."""
+    if http is not None and not http.closed:
+        # A session left behind by a finished event loop can no longer
+        # use it; closing still marks the session and its pool closed.
+        with contextlib.suppress(RuntimeError):
+            await http.close()
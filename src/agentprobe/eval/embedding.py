@@ -6,10 +6,14 @@ to produce a similarity score.
 
 from __future__ import annotations
 
+import json
 import logging
 import math
-
-import aiohttp
+import operator
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from agentprobe.core.exceptions import EvaluatorError
 from agentprobe.core.models import EvalResult, EvalVerdict, TestCase, Trace
@@ -18,6 +22,41 @@ from agentprobe.eval.base import BaseEvaluator
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _Embedding:
+    """An embedding vector together with its Euclidean norm."""
+
+    vector: Sequence[float]
+    norm: float
+
+    @classmethod
+    def of(cls, vector: Sequence[float]) -> _Embedding:
+        """Wrap a vector, computing its norm once."""
+        return cls(vector, math.hypot(*vector))
+
+    def similarity(self, other: _Embedding) -> float:
+        """Cosine similarity with another embedding, reusing both norms.
+
+        Raises:
+            ValueError: If vectors have different lengths or are empty.
+        """
+        if len(self.vector) != len(other.vector):
+            msg = f"Vector length mismatch: {len(self.vector)} vs {len(other.vector)}"
+            raise ValueError(msg)
+
+        if len(self.vector) == 0:
+            msg = "Cannot compute similarity of empty vectors"
+            raise ValueError(msg)
+
+        if self.norm == 0.0 or other.norm == 0.0:
+            return 0.0
+
+        # map/operator.mul keeps the per-element loop in C; the lengths
+        # were checked above, so map() cannot silently truncate.
+        dot: float = sum(map(operator.mul, self.vector, other.vector))
+        return dot / (self.norm * other.norm)
+
+
 def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
     """Compute cosine similarity between two vectors.
 
@@ -31,22 +70,7 @@ def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
     Raises:
         ValueError: If vectors have different lengths or are empty.
     """
-    if len(vec_a) != len(vec_b):
-        msg = f"Vector length mismatch: {len(vec_a)} vs {len(vec_b)}"
-        raise ValueError(msg)
-
-    if len(vec_a) == 0:
-        msg = "Cannot compute similarity of empty vectors"
-        raise ValueError(msg)
-
-    dot = sum(a * b for a, b in zip(vec_a, vec_b, strict=True))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
-
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
-
-    return dot / (norm_a * norm_b)
+    return _Embedding.of(vec_a).similarity(_Embedding.of(vec_b))
 
 
 class EmbeddingSimilarityEvaluator(BaseEvaluator):
@@ -70,6 +94,7 @@ class EmbeddingSimilarityEvaluator(BaseEvaluator):
         api_key: str | None = None,
         threshold: float = 0.8,
         name: str = "embedding-similarity",
+        cache_size: int = 4096,
     ) -> None:
         """Initialize the embedding similarity evaluator.
 
@@ -79,13 +104,29 @@ class EmbeddingSimilarityEvaluator(BaseEvaluator):
             api_key: API key. Read from environment if None.
             threshold: Minimum similarity to pass.
             name: Evaluator name.
+            cache_size: Maximum number of embeddings kept in memory; the
+                least recently used are evicted first. 0 disables caching.
+
+        Raises:
+            ValueError: If cache_size is negative.
         """
+        if cache_size < 0:
+            msg = "cache_size must be at least 0"
+            raise ValueError(msg)
         super().__init__(name)
         self.model = model
         self.provider = provider
         self._api_key = api_key
         self.threshold = threshold
-        self._cache: dict[str, list[float]] = {}
+        # Text -> embedding with its norm, so a text reused across test
+        # cases (typically the expected output) has its norm computed once.
+        # Kept in LRU order and bounded so long-lived evaluators stay flat.
+        self._cache: OrderedDict[str, _Embedding] = OrderedDict()
+        self._cache_size = cache_size
+
+    def cache_key(self) -> str:
+        """Return a fingerprint of the embedding model and threshold."""
+        return json.dumps([self.provider, self.model, self.threshold])
 
     async def _evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
         """Compare embeddings of expected and actual output.
@@ -105,10 +146,11 @@ class EmbeddingSimilarityEvaluator(BaseEvaluator):
                 reason="No expected output — skip embedding comparison",
             )
 
-        expected_emb = await self._get_embedding(test_case.expected_output)
-        actual_emb = await self._get_embedding(trace.output_text)
+        expected_emb, actual_emb = await self._get_embeddings(
+            [test_case.expected_output, trace.output_text]
+        )
 
-        similarity = cosine_similarity(expected_emb, actual_emb)
+        similarity = expected_emb.similarity(actual_emb)
         score = max(0.0, min(1.0, similarity))
 
         if score >= self.threshold:
@@ -126,30 +168,51 @@ class EmbeddingSimilarityEvaluator(BaseEvaluator):
             metadata={"similarity": similarity, "threshold": self.threshold},
         )
 
-    async def _get_embedding(self, text: str) -> list[float]:
-        """Get the embedding for a text string, using cache.
+    async def _get_embeddings(self, texts: list[str]) -> list[_Embedding]:
+        """Get embeddings for several texts, fetching uncached ones in one request.
 
         Args:
-            text: The text to embed.
+            texts: The texts to embed.
 
         Returns:
-            Embedding vector.
-        """
-        if text in self._cache:
-            return self._cache[text]
+            Embedding vectors with their norms, in input order.
 
-        embedding = await self._call_embedding_api(text)
-        self._cache[text] = embedding
-        return embedding
-
-    async def _call_embedding_api(self, text: str) -> list[float]:  # pragma: no cover
-        """Call the embedding API.
+        Raises:
+            EvaluatorError: If the API returns the wrong number of embeddings.
+        """
+        found: dict[str, _Embedding] = {}
+        missing: list[str] = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache.get(text)
+            if cached is None:
+                missing.append(text)
+            else:
+                self._cache.move_to_end(text)
+                found[text] = cached
+
+        if missing:
+            vectors = await self._call_embedding_api(missing)
+            if len(vectors) != len(missing):
+                raise EvaluatorError(
+                    f"Embedding API returned {len(vectors)} embeddings for {len(missing)} inputs"
+                )
+            for text, vector in zip(missing, vectors, strict=True):
+                # Cached as float32: 4 bytes per dimension instead of a boxed
+                # Python float (~32 bytes), at ~1e-7 relative precision.
+                found[text] = self._cache[text] = _Embedding.of(array("f", vector))
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return [found[text] for text in texts]
+
+    async def _call_embedding_api(self, texts: list[str]) -> list[list[float]]:  # pragma: no cover
+        """Call the embedding API for a batch of texts.
 
         Args:
-            text: Text to embed.
+            texts: Texts to embed.
 
         Returns:
-            Embedding vector.
+            One embedding vector per text, in input order.
 
         Raises:
             EvaluatorError: If the API call fails.
@@ -165,16 +228,14 @@ class EmbeddingSimilarityEvaluator(BaseEvaluator):
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
-        payload = {"model": self.model, "input": text}
+        payload = {"model": self.model, "input": texts}
 
         _http_ok = 200
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(url, json=payload, headers=headers) as resp,
-        ):
+        session = await self._http_session()
+        async with session.post(url, json=payload, headers=headers) as resp:
             if resp.status != _http_ok:
                 body = await resp.text()
                 raise EvaluatorError(f"Embedding API error: {resp.status} — {body}")
             data = await resp.json()
-            embedding: list[float] = data["data"][0]["embedding"]
-            return embedding
+            items = sorted(data["data"], key=lambda item: item["index"])
+            return [item["embedding"] for item in items]
@@ -6,15 +6,26 @@ parses the structured JSON response into an EvalResult.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import aiohttp
+from pydantic import ValidationError
 
-from agentprobe.core.exceptions import JudgeAPIError
+from agentprobe.core.exceptions import EvaluatorError, JudgeAPIError
 from agentprobe.core.models import EvalResult, EvalVerdict, TestCase, Trace
 from agentprobe.eval.base import BaseEvaluator
 
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_SYSTEM_PROMPT = """\
@@ -27,6 +38,182 @@ Respond with ONLY a JSON object (no markdown, no explanation) in this exact form
 }
 """
 
+_DELTA_SYSTEM_PROMPT = """\
+You are an evaluation judge. You already judged an earlier version of the agent's
+output; your previous verdict is included below. Only the newly appended output is
+shown. Update the verdict so it covers the full output, earlier parts included.
+Respond with ONLY a JSON object (no markdown, no explanation) in this exact format:
+{
+  "verdict": "pass" | "fail" | "partial",
+  "score": <float 0.0-1.0>,
+  "reason": "<one sentence explanation>"
+}
+"""
+
+_BATCH_SYSTEM_PROMPT = """\
+You are an evaluation judge. Assess each numbered item below against its own criteria.
+Respond with ONLY a JSON array (no markdown, no explanation) holding one object per
+item, in this exact format:
+[
+  {
+    "index": <item number>,
+    "verdict": "pass" | "fail" | "partial",
+    "score": <float 0.0-1.0>,
+    "reason": "<one sentence explanation>"
+  }
+]
+"""
+
+_VERDICTS = {
+    "pass": EvalVerdict.PASS,
+    "fail": EvalVerdict.FAIL,
+    "partial": EvalVerdict.PARTIAL,
+}
+
+# Set to 1/true/yes to bypass the verdict cache without changing code.
+_CACHE_DISABLE_ENV = "AGENTPROBE_JUDGE_CACHE_DISABLE"
+
+# TestCase.metadata key naming the judge session a test case belongs to.
+_SESSION_METADATA_KEY = "judge_session_id"
+
+# Minimum Jaccard overlap between the output blocks of consecutive
+# judgements in a session for only the new tail to be sent.
+_DELTA_MIN_OVERLAP = 0.8
+
+# Connection pool settings for the judge's shared HTTP session.
+_HTTP_TIMEOUT_SECONDS = 180
+_HTTP_CONNECTION_LIMIT = 1000
+_HTTP_CONNECTIONS_PER_HOST = 200
+_DNS_CACHE_TTL_SECONDS = 600
+_KEEPALIVE_SECONDS = 60
+
+# Sessions remembered per judge, least recently used evicted first.
+_MAX_SESSIONS = 256
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_embedded(text: str, opener: str) -> Any:
+    """Decode the first JSON value starting with ``opener`` inside free text.
+
+    ``raw_decode`` matches brackets in one pass, skipping those inside
+    strings, and stops at the end of the value, so trailing prose (even
+    with its own braces) is ignored.
+
+    Returns:
+        The decoded value, or None if no candidate position decodes.
+    """
+    start = text.find(opener)
+    while start >= 0:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            start = text.find(opener, start + 1)
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _JudgeSession:
+    """The last full-context judgement made in a session."""
+
+    context: tuple[str, str | None]
+    blocks: frozenset[int]
+    verdict: EvalResult
+
+
+def _output_blocks(output_text: str) -> list[str]:
+    """Split an output into the paragraph blocks compared across a session."""
+    return output_text.split("\n\n")
+
+
+def _block_hash(block: str) -> int:
+    """Fingerprint a block for in-process comparison within a session.
+
+    Sessions never leave the process, so the interpreter's own string hash
+    (64-bit SipHash) is enough; the persistent cache key stays SHA-256.
+    """
+    return hash(block)
+
+
+def _new_tail_length(session: _JudgeSession, hashes: Sequence[int]) -> int:
+    """Return how many trailing blocks are new, or 0 if a full judgement is needed.
+
+    A delta only applies when the output grew by appending blocks: every
+    previously judged block is still present, all new blocks come after
+    them, and the two block sets overlap by at least ``_DELTA_MIN_OVERLAP``.
+    """
+    current = frozenset(hashes)
+    if not session.blocks <= current:
+        return 0
+    if len(session.blocks) / len(current) < _DELTA_MIN_OVERLAP:
+        return 0
+    new = 0
+    for block in reversed(hashes):
+        if block in session.blocks:
+            break
+        new += 1
+    if new == 0 or not all(block in session.blocks for block in hashes[: len(hashes) - new]):
+        return 0
+    return new
+
+
+class JudgeCache:
+    """On-disk store of judge verdicts, addressed by a hash of the judge inputs.
+
+    Entries are JSON files under ``{cache_dir}/{key[:2]}/{key}.json``.
+    Subclass and override ``get`` and ``put`` to use another backend.
+
+    Attributes:
+        cache_dir: Root directory of the cache.
+    """
+
+    def __init__(self, cache_dir: str | Path = ".agentprobe/judge_cache") -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Root directory of the cache; created on first write.
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> EvalResult | None:
+        """Return the cached verdict for a key, or None if absent or unreadable.
+
+        Args:
+            key: The content hash of the judge inputs.
+
+        Returns:
+            The cached EvalResult, if any.
+        """
+        path = self._path(key)
+        try:
+            return EvalResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError):
+            logger.warning("Ignoring unreadable judge cache entry: %s", path)
+            return None
+
+    def put(self, key: str, result: EvalResult) -> None:
+        """Store a verdict, logging rather than failing on I/O errors.
+
+        Args:
+            key: The content hash of the judge inputs.
+            result: The verdict to store.
+        """
+        path = self._path(key)
+        # Written to a temporary file and renamed into place, so a concurrent
+        # reader never sees a partially written entry.
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(result.model_dump_json(), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            logger.warning("Could not write judge cache entry: %s", path)
+
 
 class LLMJudge(BaseEvaluator):
     """Evaluator that uses a language model as a judge.
@@ -40,6 +227,7 @@ class LLMJudge(BaseEvaluator):
         temperature: Sampling temperature for the judge.
         max_tokens: Maximum response tokens.
         rubric: Evaluation rubric/criteria text.
+        cache: Verdict cache consulted before calling the judge, if any.
     """
 
     def __init__(
@@ -52,6 +240,7 @@ class LLMJudge(BaseEvaluator):
         max_tokens: int = 1024,
         rubric: str = "",
         name: str = "llm-judge",
+        cache: JudgeCache | None = None,
     ) -> None:
         """Initialize the judge evaluator.
 
@@ -63,6 +252,10 @@ class LLMJudge(BaseEvaluator):
             max_tokens: Max response tokens.
             rubric: Evaluation criteria text.
             name: Evaluator name.
+            cache: Verdict cache. Only used at temperature 0, where the
+                judge's answer is reproducible; set the
+                ``AGENTPROBE_JUDGE_CACHE_DISABLE`` environment variable
+                to bypass it.
         """
         super().__init__(name)
         self.model = model
@@ -71,6 +264,33 @@ class LLMJudge(BaseEvaluator):
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.rubric = rubric
+        self.cache = cache
+        self._sessions: OrderedDict[str, _JudgeSession] = OrderedDict()
+
+    def _open_http(self) -> aiohttp.ClientSession:
+        """Open the judge's HTTP session with a pooled, keep-alive connector.
+
+        The session is reused across calls (see ``BaseEvaluator``), keeping
+        connections to the judge API alive.
+        """
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=_HTTP_CONNECTION_LIMIT,
+            limit_per_host=_HTTP_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=_KEEPALIVE_SECONDS,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT_SECONDS),
+        )
+
+    def cache_key(self) -> str:
+        """Return a fingerprint of the judge model, sampling settings, and rubric."""
+        return json.dumps(
+            [self.provider, self.model, self.temperature, self.max_tokens, self.rubric]
+        )
 
     async def _evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
         """Send the output to the judge model and parse the verdict.
@@ -83,8 +303,234 @@ class LLMJudge(BaseEvaluator):
             Parsed evaluation result from the judge.
         """
         prompt = self._build_prompt(test_case, trace)
-        response_text = await self._call_api(prompt)
-        return self._parse_response(response_text)
+        cache = self._active_cache()
+        key = ""
+        if cache is not None:
+            key = self._cache_key(prompt)
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug("Judge verdict for test '%s' served from cache", test_case.name)
+                return self._from_cached(cached)
+
+        session_id = test_case.metadata.get(_SESSION_METADATA_KEY)
+        if isinstance(session_id, str):
+            result = await self._evaluate_in_session(session_id, test_case, trace, prompt)
+        else:
+            result = self._parse_response(await self._call_api(prompt))
+
+        # Unparseable responses are worth retrying, and delta verdicts depend
+        # on the session history rather than the prompt, so neither is cached.
+        if (
+            cache is not None
+            and result.verdict != EvalVerdict.ERROR
+            and "delta_blocks" not in result.metadata
+        ):
+            cache.put(key, result)
+        return result
+
+    async def _evaluate_in_session(
+        self, session_id: str, test_case: TestCase, trace: Trace, prompt: str
+    ) -> EvalResult:
+        """Judge a test case that continues a session, sending only new output if possible.
+
+        When the output extends the one last judged in the same session
+        (see ``_new_tail_length``), the judge receives only the appended
+        blocks and its previous verdict instead of the full output.
+
+        Args:
+            session_id: The session named in the test case metadata.
+            test_case: The test case.
+            trace: The execution trace.
+            prompt: The full evaluation prompt.
+
+        Returns:
+            The judge's verdict, with ``delta_blocks`` in its metadata if
+            only the new output was sent.
+        """
+        blocks = _output_blocks(trace.output_text)
+        hashes = [_block_hash(block) for block in blocks]
+        context = (test_case.input_text, test_case.expected_output)
+
+        session = self._sessions.get(session_id)
+        new = 0
+        if session is not None and session.context == context:
+            new = _new_tail_length(session, hashes)
+
+        if session is not None and new:
+            delta_prompt = self._build_delta_prompt(
+                test_case, "\n\n".join(blocks[-new:]), session.verdict
+            )
+            response_text = await self._call_api(delta_prompt, system_prompt=_DELTA_SYSTEM_PROMPT)
+            result = self._parse_response(response_text)
+            result = result.model_copy(update={"metadata": {"delta_blocks": new}})
+        else:
+            result = self._parse_response(await self._call_api(prompt))
+
+        if result.verdict != EvalVerdict.ERROR:
+            self._sessions[session_id] = _JudgeSession(context, frozenset(hashes), result)
+            self._sessions.move_to_end(session_id)
+            if len(self._sessions) > _MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        return result
+
+    async def evaluate_batch(
+        self,
+        pairs: Sequence[tuple[TestCase, Trace]],
+        batch_size: int = 5,
+        max_concurrency: int = 4,
+    ) -> list[EvalResult]:
+        """Judge many test cases, packing up to ``batch_size`` into each API call.
+
+        Each call asks the judge for a JSON array of verdicts, one per item,
+        and the verdicts are matched back to their items by index. Batches
+        are sent concurrently, at most ``max_concurrency`` at a time; if one
+        raises, the others are cancelled. Verdicts are cached in the
+        JudgeCache under keys that include the batch system prompt, so
+        batched and single judgements never stand in for each other;
+        session metadata is ignored.
+
+        Args:
+            pairs: The (test case, trace) pairs to judge.
+            batch_size: Maximum items per API call.
+            max_concurrency: Maximum batches in flight at once.
+
+        Returns:
+            One result per pair, in input order. Items whose verdict is
+            missing or unparseable, or whose batch failed, get an ERROR result.
+
+        Raises:
+            ValueError: If batch_size or max_concurrency is less than 1.
+            JudgeAPIError: If the judge API rejects a request.
+        """
+        if batch_size < 1:
+            msg = "batch_size must be at least 1"
+            raise ValueError(msg)
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        prompts = [self._build_prompt(tc, trace) for tc, trace in pairs]
+        results: list[EvalResult | None] = [None] * len(prompts)
+        cache = self._active_cache()
+        keys = (
+            [self._cache_key(p, system_prompt=_BATCH_SYSTEM_PROMPT) for p in prompts]
+            if cache is not None
+            else []
+        )
+        if cache is not None:
+            for i, key in enumerate(keys):
+                cached = cache.get(key)
+                if cached is not None:
+                    results[i] = self._from_cached(cached)
+
+        pending = [i for i, r in enumerate(results) if r is None]
+        batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(batch: list[int]) -> None:
+            async with semaphore:
+                batch_results = await self._judge_batch([prompts[i] for i in batch])
+            for i, result in zip(batch, batch_results, strict=True):
+                results[i] = result
+                if cache is not None and result.verdict != EvalVerdict.ERROR:
+                    cache.put(keys[i], result)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for batch in batches:
+                    group.create_task(_bounded(batch))
+        except ExceptionGroup as exc_group:
+            # Surface the first failure (e.g. JudgeAPIError), not the group.
+            raise exc_group.exceptions[0] from exc_group
+
+        filled = [r for r in results if r is not None]
+        assert len(filled) == len(results), "evaluate_batch left a result slot empty"
+        return filled
+
+    async def _judge_batch(self, prompts: list[str]) -> list[EvalResult]:
+        """Judge several prompts with one API call."""
+        prompt = "\n---\n".join(f"Item {i}:\n{p}" for i, p in enumerate(prompts))
+        try:
+            response_text = await self._call_api(prompt, system_prompt=_BATCH_SYSTEM_PROMPT)
+        except EvaluatorError:
+            raise
+        except Exception as exc:
+            logger.error("Evaluator '%s' batch of %d failed: %s", self.name, len(prompts), exc)
+            return [self._error_result(f"Evaluation error: {exc}") for _ in prompts]
+        return self._parse_batch_response(response_text, len(prompts))
+
+    def _parse_batch_response(self, response_text: str, count: int) -> list[EvalResult]:
+        """Split a batched judge response into one result per item.
+
+        Args:
+            response_text: Raw response text holding a JSON array.
+            count: Number of items in the batch.
+
+        Returns:
+            One result per item, in item order.
+        """
+        try:
+            data = json.loads(response_text)
+        except json.JSONDecodeError:
+            data = _decode_embedded(response_text, "[")
+        if not isinstance(data, list):
+            reason = f"No JSON array in batched judge response: {response_text[:200]}"
+            return [self._error_result(reason) for _ in range(count)]
+
+        by_index: dict[int, dict[str, Any]] = {}
+        for item in data:
+            if isinstance(item, dict) and isinstance(item.get("index"), int):
+                by_index.setdefault(item["index"], item)
+        results: list[EvalResult] = []
+        for i in range(count):
+            item = by_index.get(i)
+            if item is None:
+                results.append(self._error_result(f"No verdict for item {i} in judge response"))
+                continue
+            try:
+                results.append(self._result_from_data(item))
+            except (TypeError, ValueError) as exc:
+                results.append(self._error_result(f"Invalid verdict for item {i}: {exc}"))
+        return results
+
+    def _error_result(self, reason: str) -> EvalResult:
+        return EvalResult(
+            evaluator_name=self.name, verdict=EvalVerdict.ERROR, score=0.0, reason=reason
+        )
+
+    def _from_cached(self, cached: EvalResult) -> EvalResult:
+        """Return a fresh result for this evaluation carrying a cached verdict."""
+        return EvalResult(
+            evaluator_name=self.name,
+            verdict=cached.verdict,
+            score=cached.score,
+            reason=cached.reason,
+            metadata=cached.metadata,
+        )
+
+    def _active_cache(self) -> JudgeCache | None:
+        """Return the verdict cache if caching applies to this judge."""
+        if self.cache is None or self.temperature != 0.0:
+            return None
+        if os.environ.get(_CACHE_DISABLE_ENV, "").lower() in {"1", "true", "yes"}:
+            return None
+        return self.cache
+
+    def _cache_key(self, prompt: str, *, system_prompt: str = _DEFAULT_SYSTEM_PROMPT) -> str:
+        """Return the SHA-256 content hash of everything that shapes a verdict."""
+        canonical = json.dumps(
+            {
+                "model": self.model,
+                "provider": self.provider,
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+                "system_prompt": system_prompt,
+                "rubric": self.rubric,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
 
     def _build_prompt(self, test_case: TestCase, trace: Trace) -> str:
         """Build the evaluation prompt for the judge.
@@ -108,11 +554,41 @@ class LLMJudge(BaseEvaluator):
 
         return "\n\n".join(parts)
 
-    async def _call_api(self, prompt: str) -> str:
+    def _build_delta_prompt(
+        self, test_case: TestCase, new_output: str, previous: EvalResult
+    ) -> str:
+        """Build the prompt asking the judge to update a verdict for appended output.
+
+        Args:
+            test_case: The test case with expectations.
+            new_output: The output appended since the previous verdict.
+            previous: The verdict for the output before the append.
+
+        Returns:
+            Formatted prompt string.
+        """
+        parts = [f"## Agent Input\n{test_case.input_text}"]
+
+        if test_case.expected_output:
+            parts.append(f"## Expected Output\n{test_case.expected_output}")
+
+        previous_json = json.dumps(
+            {"verdict": previous.verdict.value, "score": previous.score, "reason": previous.reason}
+        )
+        parts.append(f"## Previous Verdict\n{previous_json}")
+        parts.append(f"## Newly Appended Output\n{new_output}")
+
+        if self.rubric:
+            parts.append(f"## Evaluation Criteria\n{self.rubric}")
+
+        return "\n\n".join(parts)
+
+    async def _call_api(self, prompt: str, *, system_prompt: str = _DEFAULT_SYSTEM_PROMPT) -> str:
         """Call the judge model API.
 
         Args:
             prompt: The evaluation prompt.
+            system_prompt: The judge's system instructions.
 
         Returns:
             Raw response text from the judge.
@@ -121,23 +597,22 @@ class LLMJudge(BaseEvaluator):
             JudgeAPIError: If the API call fails.
         """
         if self.provider == "anthropic":
-            return await self._call_anthropic(prompt)
+            return await self._call_anthropic(prompt, system_prompt)
         elif self.provider == "openai":
-            return await self._call_openai(prompt)
+            return await self._call_openai(prompt, system_prompt)
         else:
             raise JudgeAPIError(self.model, 0, f"Unknown provider: {self.provider}")
 
-    async def _call_anthropic(self, prompt: str) -> str:  # pragma: no cover
+    async def _call_anthropic(self, prompt: str, system_prompt: str) -> str:  # pragma: no cover
         """Call the Anthropic Messages API.
 
         Args:
             prompt: The evaluation prompt.
+            system_prompt: The judge's system instructions.
 
         Returns:
             Response text.
         """
-        import os
-
         api_key = self._api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise JudgeAPIError(self.model, 0, "ANTHROPIC_API_KEY not set")
@@ -152,32 +627,29 @@ class LLMJudge(BaseEvaluator):
             "model": self.model,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
-            "system": _DEFAULT_SYSTEM_PROMPT,
+            "system": system_prompt,
             "messages": [{"role": "user", "content": prompt}],
         }
 
         _http_ok = 200
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(url, json=payload, headers=headers) as resp,
-        ):
+        http = await self._http_session()
+        async with http.post(url, json=payload, headers=headers) as resp:
             if resp.status != _http_ok:
                 body = await resp.text()
                 raise JudgeAPIError(self.model, resp.status, body)
             data = await resp.json()
             return str(data["content"][0]["text"])
 
-    async def _call_openai(self, prompt: str) -> str:  # pragma: no cover
+    async def _call_openai(self, prompt: str, system_prompt: str) -> str:  # pragma: no cover
         """Call the OpenAI Chat Completions API.
 
         Args:
             prompt: The evaluation prompt.
+            system_prompt: The judge's system instructions.
 
         Returns:
             Response text.
         """
-        import os
-
         api_key = self._api_key or os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise JudgeAPIError(self.model, 0, "OPENAI_API_KEY not set")
@@ -192,16 +664,14 @@ class LLMJudge(BaseEvaluator):
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "messages": [
-                {"role": "system", "content": _DEFAULT_SYSTEM_PROMPT},
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": prompt},
             ],
         }
 
         _http_ok = 200
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(url, json=payload, headers=headers) as resp,
-        ):
+        http = await self._http_session()
+        async with http.post(url, json=payload, headers=headers) as resp:
             if resp.status != _http_ok:
                 body = await resp.text()
                 raise JudgeAPIError(self.model, resp.status, body)
@@ -220,34 +690,29 @@ class LLMJudge(BaseEvaluator):
         try:
             data = json.loads(response_text)
         except json.JSONDecodeError:
-            cleaned = response_text.strip()
-            start = cleaned.find("{")
-            end = cleaned.rfind("}") + 1
-            if start >= 0 and end > start:
-                try:
-                    data = json.loads(cleaned[start:end])
-                except json.JSONDecodeError:
-                    return EvalResult(
-                        evaluator_name=self.name,
-                        verdict=EvalVerdict.ERROR,
-                        score=0.0,
-                        reason=f"Failed to parse judge response: {response_text[:200]}",
-                    )
-            else:
+            data = _decode_embedded(response_text, "{")
+            if data is None:
+                problem = "Failed to parse" if "{" in response_text else "No JSON found in"
                 return EvalResult(
                     evaluator_name=self.name,
                     verdict=EvalVerdict.ERROR,
                     score=0.0,
-                    reason=f"No JSON found in judge response: {response_text[:200]}",
+                    reason=f"{problem} judge response: {response_text[:200]}",
                 )
 
+        return self._result_from_data(data)
+
+    def _result_from_data(self, data: dict[str, Any]) -> EvalResult:
+        """Build an EvalResult from one decoded judge verdict object.
+
+        Args:
+            data: The decoded ``{verdict, score, reason}`` object.
+
+        Returns:
+            The corresponding EvalResult.
+        """
         verdict_str = str(data.get("verdict", "error")).lower()
-        verdict_map = {
-            "pass": EvalVerdict.PASS,
-            "fail": EvalVerdict.FAIL,
-            "partial": EvalVerdict.PARTIAL,
-        }
-        verdict = verdict_map.get(verdict_str, EvalVerdict.ERROR)
+        verdict = _VERDICTS.get(verdict_str, EvalVerdict.ERROR)
 
         score = float(data.get("score", 0.0))
         score = max(0.0, min(1.0, score))
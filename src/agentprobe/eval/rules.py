@@ -7,12 +7,13 @@ like ``contains_any``, ``not_contains``, ``max_length``, ``regex``, and
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from agentprobe.core.models import EvalResult, EvalVerdict, TestCase, Trace
 from agentprobe.eval.base import BaseEvaluator
@@ -37,6 +38,27 @@ class RuleSpec(BaseModel):
     weight: float = Field(default=1.0, gt=0)
     description: str = ""
 
+    @model_validator(mode="after")
+    def _check_regex(self) -> RuleSpec:
+        """Compile regex rules up front so a bad pattern fails at load time."""
+        if self.rule_type == "regex":
+            pattern = self.params.get("pattern", "")
+            if not isinstance(pattern, str):
+                msg = "regex rule 'pattern' must be a string"
+                raise ValueError(msg)
+            try:
+                _compiled(pattern)
+            except re.error as exc:
+                msg = f"Invalid regex pattern {pattern!r}: {exc}"
+                raise ValueError(msg) from exc
+        return self
+
+
+@functools.lru_cache(maxsize=1024)
+def _compiled(pattern: str) -> re.Pattern[str]:
+    """Compile a rule pattern once per process."""
+    return re.compile(pattern)
+
 
 # ── Built-in rule handlers ──
 
@@ -62,7 +84,7 @@ def _max_length(output: str, params: dict[str, Any]) -> bool:
 def _regex(output: str, params: dict[str, Any]) -> bool:
     """Check that output matches a regex pattern."""
     pattern: str = params.get("pattern", "")
-    return re.search(pattern, output) is not None
+    return _compiled(pattern).search(output) is not None
 
 
 def _json_valid(output: str, params: dict[str, Any]) -> bool:
@@ -91,21 +113,32 @@ class RuleBasedEvaluator(BaseEvaluator):
 
     Attributes:
         rules: List of rule specifications to evaluate.
+        collect_metadata: Whether results carry per-rule outcomes.
     """
 
     def __init__(
         self,
         name: str = "rule-based",
         rules: list[RuleSpec] | None = None,
+        *,
+        collect_metadata: bool = True,
     ) -> None:
         """Initialize the rule-based evaluator.
 
         Args:
             name: Evaluator name.
             rules: List of rule specifications. Defaults to empty.
+            collect_metadata: Record each rule's outcome under
+                ``rule_results`` in the result metadata. Disable when
+                evaluating at volume and only the score is needed.
         """
         super().__init__(name)
         self.rules = rules or []
+        self.collect_metadata = collect_metadata
+
+    def cache_key(self) -> str:
+        """Return a fingerprint of the rules."""
+        return json.dumps([rule.model_dump(mode="json") for rule in self.rules], sort_keys=True)
 
     async def _evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
         """Evaluate the trace output against all configured rules.
@@ -126,40 +159,46 @@ class RuleBasedEvaluator(BaseEvaluator):
             )
 
         output = trace.output_text
+        collect = self.collect_metadata
         total_weight = 0.0
         weighted_score = 0.0
+        all_passed = True
         results: list[dict[str, Any]] = []
 
         for rule in self.rules:
+            weight = rule.weight
+            total_weight += weight
             handler = _RULE_HANDLERS.get(rule.rule_type)
             if handler is None:
                 logger.warning("Unknown rule type: %s", rule.rule_type)
+                all_passed = False
+                if collect:
+                    results.append(
+                        {
+                            "rule": rule.rule_type,
+                            "passed": False,
+                            "error": "unknown rule type",
+                        }
+                    )
+                continue
+
+            passed = handler(output, rule.params)
+            if passed:
+                weighted_score += weight
+            else:
+                all_passed = False
+
+            if collect:
                 results.append(
                     {
                         "rule": rule.rule_type,
-                        "passed": False,
-                        "error": "unknown rule type",
+                        "description": rule.description,
+                        "passed": passed,
+                        "weight": weight,
                     }
                 )
-                total_weight += rule.weight
-                continue
-
-            passed = handler(output, rule.params)
-            total_weight += rule.weight
-            if passed:
-                weighted_score += rule.weight
-
-            results.append(
-                {
-                    "rule": rule.rule_type,
-                    "description": rule.description,
-                    "passed": passed,
-                    "weight": rule.weight,
-                }
-            )
 
         score = weighted_score / total_weight if total_weight > 0 else 0.0
-        all_passed = all(r["passed"] for r in results)
 
         _partial_threshold = 0.5
         if all_passed:
@@ -174,5 +213,5 @@ class RuleBasedEvaluator(BaseEvaluator):
             verdict=verdict,
             score=score,
             reason=f"{int(weighted_score)}/{int(total_weight)} rules passed (weighted)",
-            metadata={"rule_results": results},
+            metadata={"rule_results": results} if collect else {},
         )
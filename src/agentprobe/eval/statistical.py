@@ -7,9 +7,10 @@ intervals from the score distribution.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import math
-import statistics
 from collections.abc import Sequence
 
 from agentprobe.core.models import (
@@ -39,6 +40,73 @@ def _percentile(sorted_data: list[float], pct: float) -> float:
     return sorted_data[f] * (c - k) + sorted_data[c] * (k - f)
 
 
+# Below this many scores, converting to a NumPy array costs more than the
+# pure-Python path saves (about 75us of fixed overhead per call).
+_NUMPY_MIN_SAMPLES = 1000
+
+
+def _moments(scores: list[float]) -> tuple[float, float, float, float, float]:
+    """Return (mean, sample std dev, median, p5, p95) of a non-empty list of scores.
+
+    Sorts once and derives every order statistic from the sorted list.
+    Mean and standard deviation use ``math.fsum`` rather than
+    ``statistics.mean``/``stdev``, which convert each float to an exact
+    fraction and are an order of magnitude slower on large samples.
+    Large samples go through NumPy when it is installed.
+    """
+    n = len(scores)
+    if n >= _NUMPY_MIN_SAMPLES:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            arr = np.asarray(scores, dtype=np.float64)
+            p5, median, p95 = (float(p) for p in np.percentile(arr, [5, 50, 95]))
+            return float(arr.mean()), float(arr.std(ddof=1)), median, p5, p95
+
+    mean = math.fsum(scores) / n
+    std_dev = math.sqrt(math.fsum([(s - mean) ** 2 for s in scores]) / (n - 1)) if n > 1 else 0.0
+    sorted_scores = sorted(scores)
+    return (
+        mean,
+        std_dev,
+        _percentile(sorted_scores, 50),
+        _percentile(sorted_scores, 5),
+        _percentile(sorted_scores, 95),
+    )
+
+
+def _summarize_scores(evaluator_name: str, scores: list[float]) -> StatisticalSummary:
+    """Compute the summary statistics for a non-empty list of scores."""
+    n = len(scores)
+    mean, std_dev, median, p5, p95 = _moments(scores)
+
+    # 95% confidence interval using t-distribution approximation
+    if n > 1:
+        se = std_dev / math.sqrt(n)
+        # Approximate t-value for 95% CI (use 1.96 for large n)
+        t_val = 1.96
+        ci_lower = max(0.0, mean - t_val * se)
+        ci_upper = min(1.0, mean + t_val * se)
+    else:
+        ci_lower = mean
+        ci_upper = mean
+
+    return StatisticalSummary(
+        evaluator_name=evaluator_name,
+        sample_count=n,
+        scores=tuple(scores),
+        mean=round(mean, 6),
+        std_dev=round(std_dev, 6),
+        median=round(median, 6),
+        p5=round(p5, 6),
+        p95=round(p95, 6),
+        ci_lower=round(ci_lower, 6),
+        ci_upper=round(ci_upper, 6),
+    )
+
+
 class StatisticalEvaluator(BaseEvaluator):
     """Evaluator that runs an inner evaluator multiple times and aggregates stats.
 
@@ -56,6 +124,7 @@ class StatisticalEvaluator(BaseEvaluator):
         *,
         name: str | None = None,
         pass_threshold: float = 0.7,
+        max_concurrency: int = 8,
     ) -> None:
         """Initialize the statistical evaluator.
 
@@ -63,17 +132,38 @@ class StatisticalEvaluator(BaseEvaluator):
             inner: The evaluator to wrap and run repeatedly.
             name: Optional name override. Defaults to 'statistical-{inner.name}'.
             pass_threshold: Minimum mean score for a pass verdict.
+            max_concurrency: Maximum inner evaluations in flight at once
+                in ``evaluate_multiple()``.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
         resolved_name = name or f"statistical-{inner.name}"
         super().__init__(resolved_name)
         self._inner = inner
         self._pass_threshold = pass_threshold
+        self._max_concurrency = max_concurrency
 
     @property
     def inner(self) -> BaseEvaluator:
         """Return the wrapped evaluator."""
         return self._inner
 
+    async def close(self) -> None:
+        """Release the wrapped evaluator's resources along with this one's."""
+        await self._inner.close()
+        await super().close()
+
+    def cache_key(self) -> str | None:
+        """Return the wrapped evaluator's fingerprint, or None if it has none."""
+        inner_key = self._inner.cache_key()
+        if inner_key is None:
+            return None
+        return json.dumps([inner_key, self._pass_threshold])
+
     async def _evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
         """Run the inner evaluator once (single-trace mode).
 
@@ -95,9 +185,10 @@ class StatisticalEvaluator(BaseEvaluator):
     ) -> StatisticalSummary:
         """Evaluate multiple traces and compute aggregate statistics.
 
-        Runs the inner evaluator on each trace, collects scores, and
-        computes mean, standard deviation, median, percentiles, and
-        a 95% confidence interval.
+        Runs the inner evaluator on the traces concurrently, at most
+        ``max_concurrency`` at a time, collects scores, and computes mean,
+        standard deviation, median, percentiles, and a 95% confidence
+        interval.
 
         Args:
             test_case: The test case specification.
@@ -106,10 +197,15 @@ class StatisticalEvaluator(BaseEvaluator):
         Returns:
             A statistical summary of the score distribution.
         """
-        scores: list[float] = []
-        for trace in traces:
-            result = await self._inner.evaluate(test_case, trace)
-            scores.append(result.score)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _bounded(trace: Trace) -> EvalResult:
+            async with semaphore:
+                return await self._inner.evaluate(test_case, trace)
+
+        # gather() returns results in input order, so scores keep trace order.
+        results = await asyncio.gather(*(_bounded(trace) for trace in traces))
+        scores = [result.score for result in results]
 
         if not scores:
             return StatisticalSummary(
@@ -125,38 +221,7 @@ class StatisticalEvaluator(BaseEvaluator):
                 ci_upper=0.0,
             )
 
-        n = len(scores)
-        mean = statistics.mean(scores)
-        std_dev = statistics.stdev(scores) if n > 1 else 0.0
-
-        sorted_scores = sorted(scores)
-        median = statistics.median(sorted_scores)
-        p5 = _percentile(sorted_scores, 5)
-        p95 = _percentile(sorted_scores, 95)
-
-        # 95% confidence interval using t-distribution approximation
-        if n > 1:
-            se = std_dev / math.sqrt(n)
-            # Approximate t-value for 95% CI (use 1.96 for large n)
-            t_val = 1.96
-            ci_lower = max(0.0, mean - t_val * se)
-            ci_upper = min(1.0, mean + t_val * se)
-        else:
-            ci_lower = mean
-            ci_upper = mean
-
-        return StatisticalSummary(
-            evaluator_name=self.name,
-            sample_count=n,
-            scores=tuple(scores),
-            mean=round(mean, 6),
-            std_dev=round(std_dev, 6),
-            median=round(median, 6),
-            p5=round(p5, 6),
-            p95=round(p95, 6),
-            ci_lower=round(ci_lower, 6),
-            ci_upper=round(ci_upper, 6),
-        )
+        return _summarize_scores(self.name, scores)
 
     def summary_to_eval_result(self, summary: StatisticalSummary) -> EvalResult:
         """Convert a statistical summary into a standard EvalResult.
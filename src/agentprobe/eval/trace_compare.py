@@ -6,7 +6,9 @@ similarity, and cost deviation, producing a weighted composite score.
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Set
 from typing import ClassVar
 
 from agentprobe.core.models import EvalResult, EvalVerdict, TestCase, Trace
@@ -16,22 +18,55 @@ logger = logging.getLogger(__name__)
 
 
 def _levenshtein_distance(a: list[str], b: list[str]) -> int:
-    """Compute Levenshtein edit distance between two string sequences."""
-    m, n = len(a), len(b)
-    dp = list(range(n + 1))
+    """Compute Levenshtein edit distance between two string sequences.
 
-    for i in range(1, m + 1):
-        prev = dp[0]
-        dp[0] = i
-        for j in range(1, n + 1):
-            temp = dp[j]
-            if a[i - 1] == b[j - 1]:
-                dp[j] = prev
-            else:
-                dp[j] = 1 + min(prev, dp[j], dp[j - 1])
-            prev = temp
-
-    return dp[n]
+    The shared prefix and suffix are trimmed first, since matching ends
+    never change the distance. The rest uses Hyyrö's bit-parallel form of
+    Myers' algorithm: each column of the DP table is held as bit vectors
+    in Python ints, so one step of the outer loop is a handful of integer
+    operations instead of an inner loop over the shorter sequence.
+    """
+    start = 0
+    shortest = min(len(a), len(b))
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if len(a) < len(b):
+        a, b = b, a
+
+    m = len(b)
+    if m == 0:
+        return len(a)
+
+    # Bit i of peq[x] is set where b[i] == x.
+    peq: dict[str, int] = {}
+    for i, item in enumerate(b):
+        peq[item] = peq.get(item, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = mask  # vertical +1 deltas
+    mv = 0  # vertical -1 deltas
+    distance = m
+    for item in a:
+        eq = peq.get(item, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            distance += 1
+        elif mh & last:
+            distance -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    return distance
 
 
 def _levenshtein_similarity(a: list[str], b: list[str]) -> float:
@@ -43,20 +78,19 @@ def _levenshtein_similarity(a: list[str], b: list[str]) -> float:
     return 1.0 - (dist / max_len)
 
 
-def _jaccard_similarity(a: set[str], b: set[str]) -> float:
+def _jaccard_similarity(a: Set[str], b: Set[str]) -> float:
     """Compute Jaccard similarity between two sets."""
     if not a and not b:
         return 1.0
-    intersection = a & b
-    union = a | b
-    return len(intersection) / len(union)
+    # The union size follows from the intersection; building it is as
+    # costly as the intersection itself.
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
 
 
-def _keyword_overlap(a: str, b: str) -> float:
-    """Compute word-level Jaccard similarity."""
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
-    return _jaccard_similarity(words_a, words_b)
+def _word_set(text: str) -> frozenset[str]:
+    """Return the case-insensitive set of whitespace-separated words."""
+    return frozenset(text.lower().split())
 
 
 class TraceComparisonEvaluator(BaseEvaluator):
@@ -97,6 +131,19 @@ class TraceComparisonEvaluator(BaseEvaluator):
         self._reference = reference_trace
         self._weights = weights or dict(self.DEFAULT_WEIGHTS)
         self._pass_threshold = pass_threshold
+        # The reference side of every comparison is fixed, so it is
+        # derived once here rather than on each evaluation.
+        self._ref_tools = [tc.tool_name for tc in reference_trace.tool_calls]
+        self._ref_param_keys = frozenset(_collect_param_keys(reference_trace))
+        self._ref_words = _word_set(reference_trace.output_text)
+        self._ref_tokens = reference_trace.total_input_tokens + reference_trace.total_output_tokens
+
+    def cache_key(self) -> str:
+        """Return a fingerprint of the reference trace, weights, and threshold."""
+        return json.dumps(
+            [self._reference.model_dump_json(), self._weights, self._pass_threshold],
+            sort_keys=True,
+        )
 
     async def _evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
         """Compare the trace against the reference.
@@ -111,22 +158,19 @@ class TraceComparisonEvaluator(BaseEvaluator):
         scores: dict[str, float] = {}
 
         # Tool sequence similarity (Levenshtein)
-        ref_tools = [tc.tool_name for tc in self._reference.tool_calls]
         cur_tools = [tc.tool_name for tc in trace.tool_calls]
-        scores["tool_sequence"] = _levenshtein_similarity(ref_tools, cur_tools)
+        scores["tool_sequence"] = _levenshtein_similarity(self._ref_tools, cur_tools)
 
         # Tool parameter similarity (Jaccard on parameter keys)
-        ref_params = _collect_param_keys(self._reference)
         cur_params = _collect_param_keys(trace)
-        scores["tool_parameters"] = _jaccard_similarity(ref_params, cur_params)
+        scores["tool_parameters"] = _jaccard_similarity(self._ref_param_keys, cur_params)
 
         # Output text similarity (word-level Jaccard)
-        scores["output_similarity"] = _keyword_overlap(
-            self._reference.output_text, trace.output_text
-        )
+        cur_words = _word_set(trace.output_text)
+        scores["output_similarity"] = _jaccard_similarity(self._ref_words, cur_words)
 
         # Cost deviation
-        ref_tokens = self._reference.total_input_tokens + self._reference.total_output_tokens
+        ref_tokens = self._ref_tokens
         cur_tokens = trace.total_input_tokens + trace.total_output_tokens
         if ref_tokens > 0:
             cost_ratio = min(cur_tokens, ref_tokens) / max(cur_tokens, ref_tokens)
@@ -136,9 +180,15 @@ class TraceComparisonEvaluator(BaseEvaluator):
             cost_ratio = 0.0
         scores["cost_deviation"] = cost_ratio
 
-        # Weighted composite
-        total_weight = sum(self._weights.get(k, 0.0) for k in scores)
-        composite = sum(scores[k] * self._weights.get(k, 0.0) for k in scores)
+        # Weighted composite, rounded so float noise cannot tip the verdict
+        # across a threshold.
+        weights = self._weights
+        total_weight = 0.0
+        composite = 0.0
+        for key, value in scores.items():
+            weight = weights.get(key, 0.0)
+            total_weight += weight
+            composite += value * weight
         final_score = composite / total_weight if total_weight > 0 else 0.0
         final_score = round(min(max(final_score, 0.0), 1.0), 4)
 
@@ -1,12 +1,11 @@
 """Metric aggregation: computes statistical summaries from metric values.
 
-Uses stdlib ``statistics`` module for calculations — no numpy dependency.
+Uses stdlib ``math`` for calculations — no numpy dependency.
 """
 
 from __future__ import annotations
 
 import math
-import statistics
 from collections import defaultdict
 
 from agentprobe.core.exceptions import MetricsError
@@ -19,7 +18,7 @@ class MetricAggregator:
     """Computes statistical aggregations over collections of metric values.
 
     Supports mean, median, min, max, p95, p99, and standard deviation.
-    All computations use the stdlib ``statistics`` module.
+    All computations use the stdlib only.
     """
 
     def aggregate(self, values: list[MetricValue]) -> MetricAggregation:
@@ -80,13 +79,18 @@ class MetricAggregator:
             A MetricAggregation with computed statistics.
         """
         n = len(raw)
-        mean = statistics.mean(raw)
-        median = statistics.median(raw)
-        min_val = min(raw)
-        max_val = max(raw)
-        std_dev = statistics.stdev(raw) if n >= _MIN_STDEV_SAMPLES else 0.0
-
+        # One sort serves min, max, median and the percentiles; fsum avoids
+        # the exact-fraction arithmetic statistics.mean/stdev perform.
         sorted_raw = sorted(raw)
+        mean = math.fsum(raw) / n
+        median = self._percentile(sorted_raw, 0.5)
+        min_val = sorted_raw[0]
+        max_val = sorted_raw[-1]
+        std_dev = (
+            math.sqrt(math.fsum([(x - mean) ** 2 for x in raw]) / (n - 1))
+            if n >= _MIN_STDEV_SAMPLES
+            else 0.0
+        )
         p95 = self._percentile(sorted_raw, 0.95)
         p99 = self._percentile(sorted_raw, 0.99)
 
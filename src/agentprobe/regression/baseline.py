@@ -52,7 +52,7 @@ class BaselineManager:
         self._dir.mkdir(parents=True, exist_ok=True)
         path = self._baseline_path(name)
 
-        data = [json.loads(r.model_dump_json()) for r in results]
+        data = [r.model_dump(mode="json") for r in results]
         path.write_text(
             json.dumps(data, indent=2, ensure_ascii=False),
             encoding="utf-8",
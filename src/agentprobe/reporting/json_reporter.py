@@ -44,7 +44,7 @@ class JSONReporter:
         self._output_dir.mkdir(parents=True, exist_ok=True)
         output_path = self._output_dir / f"report-{run.run_id}.json"
 
-        data = json.loads(run.model_dump_json())
+        data = run.model_dump(mode="json")
         output_path.write_text(
             json.dumps(data, indent=2, ensure_ascii=False),
             encoding="utf-8",
@@ -10,7 +10,7 @@ import asyncio
 import json
 import logging
 import sqlite3
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from datetime import datetime
 from functools import partial
 from pathlib import Path
@@ -67,6 +67,123 @@ CREATE INDEX IF NOT EXISTS idx_metrics_name ON metrics(metric_name);
 CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON metrics(timestamp);
 """
 
+_INSERT_TRACE = """INSERT OR REPLACE INTO traces
+   (trace_id, agent_name, model, input_text, output_text,
+    total_input_tokens, total_output_tokens, total_latency_ms,
+    tags, data, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_INSERT_RESULT = """INSERT OR REPLACE INTO test_results
+   (result_id, test_name, status, score, duration_ms, data, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+_INSERT_METRIC = """INSERT INTO metrics (metric_name, value, tags, metadata, timestamp)
+   VALUES (?, ?, ?, ?, ?)"""
+
+_METRIC_COLUMNS = "SELECT metric_name, value, tags, metadata, timestamp FROM metrics"
+
+# Rows fetched per executor hop when streaming query results.
+_STREAM_BATCH_SIZE = 100
+
+_Query = tuple[str, tuple[object, ...]]
+
+
+def _trace_row(trace: Trace) -> tuple[object, ...]:
+    """Build the ``traces`` row for a trace."""
+    return (
+        trace.trace_id,
+        trace.agent_name,
+        trace.model,
+        trace.input_text,
+        trace.output_text,
+        trace.total_input_tokens,
+        trace.total_output_tokens,
+        trace.total_latency_ms,
+        json.dumps(list(trace.tags)),
+        trace.model_dump_json(),
+        trace.created_at.isoformat(),
+    )
+
+
+def _result_row(result: TestResult) -> tuple[object, ...]:
+    """Build the ``test_results`` row for a test result."""
+    return (
+        result.result_id,
+        result.test_name,
+        result.status.value,
+        result.score,
+        result.duration_ms,
+        result.model_dump_json(),
+        result.created_at.isoformat(),
+    )
+
+
+def _metric_row(mv: MetricValue) -> tuple[object, ...]:
+    """Build the ``metrics`` row for a metric value."""
+    return (
+        mv.metric_name,
+        mv.value,
+        json.dumps(list(mv.tags)),
+        json.dumps(mv.metadata),
+        mv.timestamp.isoformat(),
+    )
+
+
+def _traces_query(agent_name: str | None, limit: int) -> _Query:
+    """Build the trace listing query."""
+    if agent_name:
+        return (
+            "SELECT data FROM traces WHERE agent_name = ? ORDER BY created_at DESC LIMIT ?",
+            (agent_name, limit),
+        )
+    return "SELECT data FROM traces ORDER BY created_at DESC LIMIT ?", (limit,)
+
+
+def _results_query(test_name: str | None, limit: int) -> _Query:
+    """Build the test result listing query."""
+    if test_name:
+        return (
+            "SELECT data FROM test_results WHERE test_name = ? ORDER BY created_at DESC LIMIT ?",
+            (test_name, limit),
+        )
+    return "SELECT data FROM test_results ORDER BY created_at DESC LIMIT ?", (limit,)
+
+
+def _metrics_query(metric_name: str | None, limit: int) -> _Query:
+    """Build the metric listing query."""
+    if metric_name:
+        return (
+            f"{_METRIC_COLUMNS} WHERE metric_name = ? ORDER BY timestamp DESC LIMIT ?",
+            (metric_name, limit),
+        )
+    return f"{_METRIC_COLUMNS} ORDER BY timestamp DESC LIMIT ?", (limit,)
+
+
+def _trace_from_row(row: sqlite3.Row) -> Trace:
+    """Rebuild a trace from its ``data`` column."""
+    return Trace.model_validate_json(row["data"])
+
+
+def _result_from_row(row: sqlite3.Row) -> TestResult:
+    """Rebuild a test result from its ``data`` column."""
+    return TestResult.model_validate_json(row["data"])
+
+
+def _metric_from_row(row: sqlite3.Row) -> MetricValue:
+    """Rebuild a metric value from a ``metrics`` row."""
+    return MetricValue(
+        metric_name=row["metric_name"],
+        value=row["value"],
+        tags=tuple(json.loads(row["tags"])) if row["tags"] else (),
+        metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        timestamp=datetime.fromisoformat(row["timestamp"]),
+    )
+
+
+def _fetch_batch(cursor: sqlite3.Cursor, parse: Callable[[sqlite3.Row], _T]) -> list[_T]:
+    """Fetch and parse the next batch of rows from an open cursor."""
+    return [parse(row) for row in cursor.fetchmany(_STREAM_BATCH_SIZE)]
+
 
 class SQLiteStorage:
     """SQLite-based storage for traces and test results.
@@ -128,31 +245,29 @@ class SQLiteStorage:
         except Exception as exc:
             raise StorageError(f"Failed to save trace: {exc}") from exc
 
+    async def save_traces(self, traces: Sequence[Trace]) -> None:
+        """Persist a batch of traces in a single transaction.
+
+        Prefer this over repeated ``save_trace`` calls when many traces
+        are ready at once; it pays for one commit instead of one per trace.
+
+        Args:
+            traces: The traces to save.
+        """
+        if not traces:
+            return
+        try:
+            await self._run(partial(self._save_traces_sync, traces))
+        except Exception as exc:
+            raise StorageError(f"Failed to save traces: {exc}") from exc
+
     def _save_trace_sync(self, trace: Trace) -> None:
+        self._save_traces_sync((trace,))
+
+    def _save_traces_sync(self, traces: Sequence[Trace]) -> None:
         conn = self._get_conn()
-        data = trace.model_dump_json()
-        tags_json = json.dumps(list(trace.tags))
-        conn.execute(
-            """INSERT OR REPLACE INTO traces
-               (trace_id, agent_name, model, input_text, output_text,
-                total_input_tokens, total_output_tokens, total_latency_ms,
-                tags, data, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                trace.trace_id,
-                trace.agent_name,
-                trace.model,
-                trace.input_text,
-                trace.output_text,
-                trace.total_input_tokens,
-                trace.total_output_tokens,
-                trace.total_latency_ms,
-                tags_json,
-                data,
-                trace.created_at.isoformat(),
-            ),
-        )
-        conn.commit()
+        with conn:
+            conn.executemany(_INSERT_TRACE, map(_trace_row, traces))
 
     async def load_trace(self, trace_id: str) -> Trace | None:
         """Load a trace by ID.
@@ -176,7 +291,7 @@ class SQLiteStorage:
         row = conn.execute("SELECT data FROM traces WHERE trace_id = ?", (trace_id,)).fetchone()
         if row is None:
             return None
-        return Trace.model_validate_json(row["data"])
+        return _trace_from_row(row)
 
     async def list_traces(
         self,
@@ -199,18 +314,27 @@ class SQLiteStorage:
             raise StorageError(f"Failed to list traces: {exc}") from exc
 
     def _list_traces_sync(self, agent_name: str | None, limit: int) -> list[Trace]:
-        conn = self._get_conn()
-        if agent_name:
-            rows = conn.execute(
-                "SELECT data FROM traces WHERE agent_name = ? ORDER BY created_at DESC LIMIT ?",
-                (agent_name, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT data FROM traces ORDER BY created_at DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-        return [Trace.model_validate_json(row["data"]) for row in rows]
+        rows = self._get_conn().execute(*_traces_query(agent_name, limit)).fetchall()
+        return [_trace_from_row(row) for row in rows]
+
+    def stream_traces(
+        self,
+        agent_name: str | None = None,
+        limit: int = 100,
+    ) -> AsyncIterator[Trace]:
+        """Yield the traces ``list_traces`` would return, a batch at a time.
+
+        Only one batch of rows is held in memory, so callers that write
+        traces out as they go never hold the whole listing.
+
+        Args:
+            agent_name: Filter by agent name.
+            limit: Maximum results.
+
+        Returns:
+            An async iterator over matching traces.
+        """
+        return self._stream(_traces_query(agent_name, limit), _trace_from_row, "traces")
 
     async def save_result(self, result: TestResult) -> None:
         """Persist a test result.
@@ -223,24 +347,26 @@ class SQLiteStorage:
         except Exception as exc:
             raise StorageError(f"Failed to save result: {exc}") from exc
 
+    async def save_results(self, results: Sequence[TestResult]) -> None:
+        """Persist a batch of test results in a single transaction.
+
+        Args:
+            results: The test results to save.
+        """
+        if not results:
+            return
+        try:
+            await self._run(partial(self._save_results_sync, results))
+        except Exception as exc:
+            raise StorageError(f"Failed to save results: {exc}") from exc
+
     def _save_result_sync(self, result: TestResult) -> None:
+        self._save_results_sync((result,))
+
+    def _save_results_sync(self, results: Sequence[TestResult]) -> None:
         conn = self._get_conn()
-        data = result.model_dump_json()
-        conn.execute(
-            """INSERT OR REPLACE INTO test_results
-               (result_id, test_name, status, score, duration_ms, data, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                result.result_id,
-                result.test_name,
-                result.status.value,
-                result.score,
-                result.duration_ms,
-                data,
-                result.created_at.isoformat(),
-            ),
-        )
-        conn.commit()
+        with conn:
+            conn.executemany(_INSERT_RESULT, map(_result_row, results))
 
     async def load_results(
         self,
@@ -263,18 +389,24 @@ class SQLiteStorage:
             raise StorageError(f"Failed to load results: {exc}") from exc
 
     def _load_results_sync(self, test_name: str | None, limit: int) -> list[TestResult]:
-        conn = self._get_conn()
-        if test_name:
-            rows = conn.execute(
-                "SELECT data FROM test_results WHERE test_name = ? ORDER BY created_at DESC LIMIT ?",
-                (test_name, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT data FROM test_results ORDER BY created_at DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-        return [TestResult.model_validate_json(row["data"]) for row in rows]
+        rows = self._get_conn().execute(*_results_query(test_name, limit)).fetchall()
+        return [_result_from_row(row) for row in rows]
+
+    def stream_results(
+        self,
+        test_name: str | None = None,
+        limit: int = 100,
+    ) -> AsyncIterator[TestResult]:
+        """Yield the test results ``load_results`` would return, a batch at a time.
+
+        Args:
+            test_name: Filter by test name.
+            limit: Maximum results.
+
+        Returns:
+            An async iterator over matching test results.
+        """
+        return self._stream(_results_query(test_name, limit), _result_from_row, "results")
 
     async def load_result(self, result_id: str) -> TestResult | None:
         """Load a single test result by ID.
@@ -299,7 +431,7 @@ class SQLiteStorage:
         ).fetchone()
         if row is None:
             return None
-        return TestResult.model_validate_json(row["data"])
+        return _result_from_row(row)
 
     async def save_metrics(self, metrics: Sequence[MetricValue]) -> None:
         """Persist a batch of metric values.
@@ -316,15 +448,8 @@ class SQLiteStorage:
 
     def _save_metrics_sync(self, metrics: Sequence[MetricValue]) -> None:
         conn = self._get_conn()
-        for mv in metrics:
-            tags_json = json.dumps(list(mv.tags))
-            meta_json = json.dumps(mv.metadata)
-            conn.execute(
-                """INSERT INTO metrics (metric_name, value, tags, metadata, timestamp)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (mv.metric_name, mv.value, tags_json, meta_json, mv.timestamp.isoformat()),
-            )
-        conn.commit()
+        with conn:
+            conn.executemany(_INSERT_METRIC, map(_metric_row, metrics))
 
     async def load_metrics(
         self,
@@ -346,30 +471,51 @@ class SQLiteStorage:
             raise StorageError(f"Failed to load metrics: {exc}") from exc
 
     def _load_metrics_sync(self, metric_name: str | None, limit: int) -> list[MetricValue]:
-        conn = self._get_conn()
-        if metric_name:
-            rows = conn.execute(
-                "SELECT metric_name, value, tags, metadata, timestamp "
-                "FROM metrics WHERE metric_name = ? ORDER BY timestamp DESC LIMIT ?",
-                (metric_name, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT metric_name, value, tags, metadata, timestamp "
-                "FROM metrics ORDER BY timestamp DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-
-        return [
-            MetricValue(
-                metric_name=row["metric_name"],
-                value=row["value"],
-                tags=tuple(json.loads(row["tags"])) if row["tags"] else (),
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-            )
-            for row in rows
-        ]
+        rows = self._get_conn().execute(*_metrics_query(metric_name, limit)).fetchall()
+        return [_metric_from_row(row) for row in rows]
+
+    def stream_metrics(
+        self,
+        metric_name: str | None = None,
+        limit: int = 1000,
+    ) -> AsyncIterator[MetricValue]:
+        """Yield the metric values ``load_metrics`` would return, a batch at a time.
+
+        Args:
+            metric_name: Filter by metric name.
+            limit: Maximum values to return.
+
+        Returns:
+            An async iterator over matching metric values.
+        """
+        return self._stream(_metrics_query(metric_name, limit), _metric_from_row, "metrics")
+
+    async def _stream(
+        self,
+        query: _Query,
+        parse: Callable[[sqlite3.Row], _T],
+        what: str,
+    ) -> AsyncIterator[_T]:
+        """Run a query and yield parsed rows, fetching one batch per executor hop."""
+        try:
+            cursor = await self._run(partial(self._execute_sync, query))
+        except Exception as exc:
+            raise StorageError(f"Failed to stream {what}: {exc}") from exc
+        try:
+            while True:
+                try:
+                    batch = await self._run(partial(_fetch_batch, cursor, parse))
+                except Exception as exc:
+                    raise StorageError(f"Failed to stream {what}: {exc}") from exc
+                if not batch:
+                    return
+                for item in batch:
+                    yield item
+        finally:
+            cursor.close()
+
+    def _execute_sync(self, query: _Query) -> sqlite3.Cursor:
+        return self._get_conn().execute(*query)
 
     async def close(self) -> None:
         """Close the database connection."""
@@ -8,19 +8,31 @@ of agent execution flow.
 from __future__ import annotations
 
 import logging
+from array import array
 from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import accumulate
 
 from agentprobe.core.models import Trace, TraceStep, TurnType
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _CumulativeColumns:
+    """Per-step cumulative metrics stored as parallel flat arrays."""
+
+    input_tokens: array[int]
+    output_tokens: array[int]
+    latency_ms: array[int]
+
+
 class TimeTravel:
     """Step-by-step trace inspector with cumulative metrics.
 
-    Pre-computes a list of TraceStep objects on construction,
-    providing indexed access and iteration over the trace timeline
-    with cumulative token, cost, and latency metrics at each step.
+    Pre-computes cumulative token, cost, and latency columns on
+    construction and builds TraceStep objects on demand, providing
+    indexed access and iteration over the trace timeline.
 
     Attributes:
         trace: The trace being inspected.
@@ -37,7 +49,13 @@ class TimeTravel:
             cost_per_1k_output: Cost per 1K output tokens for cumulative cost.
         """
         self._trace = trace
-        self._steps = self._build_steps(trace, cost_per_1k_input, cost_per_1k_output)
+        self._input_rate = cost_per_1k_input / 1000.0
+        self._output_rate = cost_per_1k_output / 1000.0
+        self._columns = self._build_columns(trace)
+        # TraceStep objects are materialized on first access; for long
+        # traces this dominates the cost, and most callers only look at
+        # a handful of steps.
+        self._steps: list[TraceStep | None] = [None] * len(trace.turns)
 
     @property
     def trace(self) -> Trace:
@@ -50,42 +68,57 @@ class TimeTravel:
         return len(self._steps)
 
     @staticmethod
-    def _build_steps(
-        trace: Trace,
-        cost_per_1k_input: float,
-        cost_per_1k_output: float,
-    ) -> list[TraceStep]:
-        """Build the list of trace steps with cumulative metrics."""
-        steps: list[TraceStep] = []
-        cum_input = 0
-        cum_output = 0
-        cum_cost = 0.0
-        cum_latency = 0
-
-        for i, turn in enumerate(trace.turns):
-            if turn.turn_type == TurnType.LLM_CALL and turn.llm_call is not None:
-                cum_input += turn.llm_call.input_tokens
-                cum_output += turn.llm_call.output_tokens
-                cum_cost += (
-                    turn.llm_call.input_tokens / 1000.0 * cost_per_1k_input
-                    + turn.llm_call.output_tokens / 1000.0 * cost_per_1k_output
-                )
-                cum_latency += turn.llm_call.latency_ms
-            elif turn.turn_type == TurnType.TOOL_CALL and turn.tool_call is not None:
-                cum_latency += turn.tool_call.latency_ms
-
-            steps.append(
-                TraceStep(
-                    step_index=i,
-                    turn=turn,
-                    cumulative_input_tokens=cum_input,
-                    cumulative_output_tokens=cum_output,
-                    cumulative_cost_usd=round(cum_cost, 6),
-                    cumulative_latency_ms=cum_latency,
-                )
-            )
+    def _build_columns(trace: Trace) -> _CumulativeColumns:
+        """Compute the cumulative token and latency metrics as flat columns.
 
-        return steps
+        A single pass over the turns collects per-turn deltas, which
+        ``itertools.accumulate`` then sums in C.
+        """
+        input_tokens: list[int] = []
+        output_tokens: list[int] = []
+        latency_ms: list[int] = []
+
+        for turn in trace.turns:
+            call = turn.llm_call
+            if call is not None and turn.turn_type == TurnType.LLM_CALL:
+                input_tokens.append(call.input_tokens)
+                output_tokens.append(call.output_tokens)
+                latency_ms.append(call.latency_ms)
+                continue
+            input_tokens.append(0)
+            output_tokens.append(0)
+            tool_call = turn.tool_call
+            if tool_call is not None and turn.turn_type == TurnType.TOOL_CALL:
+                latency_ms.append(tool_call.latency_ms)
+            else:
+                latency_ms.append(0)
+
+        return _CumulativeColumns(
+            input_tokens=array("q", accumulate(input_tokens)),
+            output_tokens=array("q", accumulate(output_tokens)),
+            latency_ms=array("q", accumulate(latency_ms)),
+        )
+
+    def _step(self, index: int) -> TraceStep:
+        """Return the step at a non-negative index, building it if needed."""
+        step = self._steps[index]
+        if step is None:
+            columns = self._columns
+            input_tokens = columns.input_tokens[index]
+            output_tokens = columns.output_tokens[index]
+            # Cost is linear in tokens, so the cumulative cost follows
+            # directly from the cumulative token counts.
+            cost = input_tokens * self._input_rate + output_tokens * self._output_rate
+            step = TraceStep(
+                step_index=index,
+                turn=self._trace.turns[index],
+                cumulative_input_tokens=input_tokens,
+                cumulative_output_tokens=output_tokens,
+                cumulative_cost_usd=round(cost, 6),
+                cumulative_latency_ms=columns.latency_ms[index],
+            )
+            self._steps[index] = step
+        return step
 
     def __len__(self) -> int:
         return len(self._steps)
@@ -102,14 +135,17 @@ class TimeTravel:
         Raises:
             IndexError: If the index is out of range.
         """
-        return self._steps[index]
+        total = len(self._steps)
+        if not -total <= index < total:
+            raise IndexError(f"Step index {index} out of range [0, {total})")
+        return self._step(index % total)
 
     def __iter__(self) -> Iterator[TraceStep]:
-        return iter(self._steps)
+        return (self._step(i) for i in range(len(self._steps)))
 
     def steps(self) -> list[TraceStep]:
         """Return all steps as a list."""
-        return list(self._steps)
+        return list(self)
 
     def rerun_from(self, step_index: int) -> list[TraceStep]:
         """Return all steps from a given index onward.
@@ -125,4 +161,4 @@ class TimeTravel:
         """
         if step_index < 0 or step_index >= len(self._steps):
             raise IndexError(f"Step index {step_index} out of range [0, {len(self._steps)})")
-        return list(self._steps[step_index:])
+        return [self._step(i) for i in range(step_index, len(self._steps))]
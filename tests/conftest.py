@@ -10,6 +10,14 @@ from tests.fixtures.agents import MockAdapter
 from tests.fixtures.traces import make_llm_call, make_tool_call, make_trace
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep on-disk caches (e.g. parsed pricing) out of the user's home."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture
 def mock_adapter() -> MockAdapter:
     """Provide a default MockAdapter instance."""
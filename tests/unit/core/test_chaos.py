@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from agentprobe.core.chaos import ChaosProxy
-from agentprobe.core.models import ChaosOverride, ChaosType
+from agentprobe.core.models import ChaosOverride, ChaosType, Trace
 from tests.fixtures.agents import MockAdapter
 from tests.fixtures.traces import make_tool_call
 
@@ -91,6 +91,20 @@ class TestChaosProxy:
             assert tc.success is True
             assert tc.tool_output == ""
 
+    async def test_fault_preserves_other_fields(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.TIMEOUT, probability=1.0)
+        proxy = ChaosProxy(adapter, overrides=[override], seed=42)
+        original = await adapter.invoke("test")
+        faulted = proxy._apply_chaos(original)
+
+        assert faulted.trace_id == original.trace_id
+        assert faulted.output_text == original.output_text
+        for before, after in zip(original.tool_calls, faulted.tool_calls, strict=True):
+            assert after.call_id == before.call_id
+            assert after.tool_name == before.tool_name
+            assert after.tool_output is None
+            assert "success" in after.model_fields_set
+
     async def test_probability_zero_no_fault(self, adapter: MockAdapter) -> None:
         override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=0.0)
         proxy = ChaosProxy(adapter, overrides=[override], seed=42)
@@ -99,6 +113,13 @@ class TestChaosProxy:
         for tc in trace.tool_calls:
             assert tc.success is True
 
+    async def test_all_disabled_overrides_passthrough(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=0.0)
+        proxy = ChaosProxy(adapter, overrides=[override], seed=42)
+        original = await adapter.invoke("test")
+
+        assert proxy._apply_chaos(original) is original
+
     async def test_targeted_tool(self, adapter: MockAdapter) -> None:
         override = ChaosOverride(
             chaos_type=ChaosType.ERROR,
@@ -134,3 +155,66 @@ class TestChaosProxy:
 
         assert trace.output_text == "no tools"
         assert len(trace.tool_calls) == 0
+
+    async def test_unmodified_trace_returned_as_is(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=1.0, target_tool="none")
+        proxy = ChaosProxy(adapter, overrides=[override], seed=42)
+        original = await adapter.invoke("test")
+
+        assert proxy._apply_chaos(original) is original
+
+    async def test_interleaved_inputs_do_not_shift_faults(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=0.5)
+        plain = ChaosProxy(adapter, overrides=[override], seed=7)
+        interleaved = ChaosProxy(adapter, overrides=[override], seed=7)
+
+        expected = [await plain.invoke("same input") for _ in range(3)]
+        actual = []
+        for _ in range(3):
+            await interleaved.invoke("other input")
+            actual.append(await interleaved.invoke("same input"))
+
+        def _pattern(traces: list[Trace]) -> list[list[bool]]:
+            return [[tc.success for tc in t.tool_calls] for t in traces]
+
+        assert _pattern(actual) == _pattern(expected)
+
+    async def test_repeat_invocations_are_independent(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=0.5)
+        proxy = ChaosProxy(adapter, overrides=[override], seed=7)
+        patterns = set()
+        for _ in range(20):
+            trace = await proxy.invoke("same input")
+            patterns.add(tuple(tc.success for tc in trace.tool_calls))
+
+        # With two tool calls at p=0.5, repeats cover more than one outcome.
+        assert len(patterns) > 1
+
+    async def test_reset_restarts_occurrences(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=0.5)
+        proxy = ChaosProxy(adapter, overrides=[override], seed=7)
+        first = [await proxy.invoke("same input") for _ in range(5)]
+        proxy.reset()
+        again = [await proxy.invoke("same input") for _ in range(5)]
+        assert [t.tool_calls for t in again] == [t.tool_calls for t in first]
+
+    async def test_tracked_inputs_are_bounded(
+        self, adapter: MockAdapter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("agentprobe.core.chaos._MAX_TRACKED_INPUTS", 2)
+        proxy = ChaosProxy(adapter, overrides=[], seed=7)
+        for text in ("a", "b", "a", "c"):
+            await proxy.invoke(text)
+        assert dict(proxy._invocations) == {"a": 2, "c": 1}
+
+    async def test_faults_keyed_on_invoked_input(self, adapter: MockAdapter) -> None:
+        override = ChaosOverride(chaos_type=ChaosType.ERROR, probability=0.5)
+        proxy = ChaosProxy(adapter, overrides=[override], seed=7)
+        reference = ChaosProxy(adapter, overrides=[override], seed=7)
+        for _ in range(5):
+            trace = await adapter.invoke("rewritten by the agent")
+            expected = await reference.invoke("sent input")
+            faulted = proxy._apply_chaos(
+                trace, reference._invocations["sent input"] - 1, input_text="sent input"
+            )
+            assert faulted.tool_calls == expected.tool_calls
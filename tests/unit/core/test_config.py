@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from agentprobe.core.config import (
     AgentProbeConfig,
@@ -36,6 +37,14 @@ class TestAgentProbeConfig:
         assert config.parallel is True
         assert config.max_workers == 8
 
+    def test_default_sub_configs_shared_and_frozen(self) -> None:
+        first = AgentProbeConfig()
+        second = AgentProbeConfig()
+        assert first.runner is second.runner
+        assert first.eval is not second.eval
+        with pytest.raises(ValidationError):
+            first.runner.parallel = True  # type: ignore[misc]
+
     def test_extra_fields_rejected(self) -> None:
         with pytest.raises(ValueError):
             AgentProbeConfig(unknown_field="value")  # type: ignore[call-arg]
@@ -65,6 +74,22 @@ class TestLoadConfig:
         assert config.runner.parallel is True
         assert config.runner.max_workers == 8
 
+    def test_json_config(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentprobe.yaml"
+        config_file.write_text(
+            '{"project_name": "json-project", "runner": {"max_workers": 2}}',
+            encoding="utf-8",
+        )
+        config = load_config(config_file)
+        assert config.project_name == "json-project"
+        assert config.runner.max_workers == 2
+
+    def test_yaml_flow_mapping_falls_back_to_yaml(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentprobe.yaml"
+        config_file.write_text("{project_name: flow-project}", encoding="utf-8")
+        config = load_config(config_file)
+        assert config.project_name == "flow-project"
+
     def test_invalid_yaml(self, tmp_path: Path) -> None:
         config_file = tmp_path / "agentprobe.yaml"
         config_file.write_text("{{invalid yaml", encoding="utf-8")
@@ -87,6 +112,24 @@ class TestLoadConfig:
         config = load_config(config_file)
         assert config.project_name == "env-project"
 
+    def test_env_var_values_stay_strings(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("AP_NAME", "2024")
+        monkeypatch.setenv("AP_DB", "/tmp/db #1.sqlite")
+        monkeypatch.delenv("AP_UNSET", raising=False)
+        config_file = tmp_path / "agentprobe.yaml"
+        config_file.write_text(
+            "project_name: ${AP_NAME}\n"
+            "trace:\n  database_path: ${AP_DB}\n"
+            "reporting:\n  output_dir: ${AP_UNSET}\n",
+            encoding="utf-8",
+        )
+        config = load_config(config_file)
+        assert config.project_name == "2024"
+        assert config.trace.database_path == "/tmp/db #1.sqlite"
+        assert config.reporting.output_dir == "${AP_UNSET}"
+
     def test_no_config_file_returns_defaults(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
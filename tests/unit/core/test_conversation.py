@@ -130,6 +130,24 @@ class TestConversationRunner:
         assert result.passed_turns == 0
         assert result.aggregate_score == 0.2
 
+    async def test_mixed_evaluators_average_score(
+        self,
+        adapter: MockAdapter,
+        pass_evaluator: _AlwaysPassEvaluator,
+        fail_evaluator: _AlwaysFailEvaluator,
+    ) -> None:
+        runner = ConversationRunner(
+            evaluators={"pass-eval": pass_evaluator, "fail-eval": fail_evaluator},
+        )
+        turns = [
+            ConversationTurn(input_text="One", evaluators=("pass-eval", "fail-eval")),
+            ConversationTurn(input_text="Two", evaluators=("pass-eval",)),
+        ]
+        result = await runner.run(adapter, turns)
+
+        assert result.passed_turns == 1
+        assert result.aggregate_score == pytest.approx(0.8)
+
     async def test_missing_evaluator_skipped(self, adapter: MockAdapter) -> None:
         runner = ConversationRunner(evaluators={})
         turns = [
@@ -141,6 +159,21 @@ class TestConversationRunner:
         assert result.passed_turns == 1
         assert len(result.turn_results[0].eval_results) == 0
 
+    async def test_missing_evaluator_logged_once(
+        self,
+        adapter: MockAdapter,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        runner = ConversationRunner(evaluators={})
+        turns = [
+            ConversationTurn(input_text="One", evaluators=("nonexistent",)),
+            ConversationTurn(input_text="Two", evaluators=("nonexistent",)),
+        ]
+        await runner.run(adapter, turns)
+
+        warnings = [r for r in caplog.records if "nonexistent" in r.getMessage()]
+        assert len(warnings) == 1
+
     async def test_adapter_error_handled(self) -> None:
         adapter = MockAdapter(error=RuntimeError("boom"))
         runner = ConversationRunner()
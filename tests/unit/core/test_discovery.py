@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from agentprobe.core import discovery
 from agentprobe.core.discovery import (
     discover_test_files,
     extract_test_cases,
@@ -58,6 +59,41 @@ class TestDiscoverTestFiles:
         names = {p.name for p in result}
         assert names == {"test_root.py", "test_nested.py"}
 
+    def test_skips_hidden_and_cache_directories(self, tmp_path: Path) -> None:
+        for dirname in (".venv", ".git", "__pycache__"):
+            hidden = tmp_path / dirname
+            hidden.mkdir()
+            (hidden / "test_hidden.py").write_text("# hidden", encoding="utf-8")
+        (tmp_path / "test_visible.py").write_text("# visible", encoding="utf-8")
+
+        result = discover_test_files(tmp_path)
+
+        assert [p.name for p in result] == ["test_visible.py"]
+
+    def test_repeat_calls_see_nested_changes(self, tmp_path: Path) -> None:
+        sub = tmp_path / "subdir"
+        sub.mkdir()
+        (sub / "test_first.py").write_text("# first", encoding="utf-8")
+        assert len(discover_test_files(tmp_path)) == 1
+
+        (sub / "test_second.py").write_text("# second", encoding="utf-8")
+        assert len(discover_test_files(tmp_path)) == 2
+
+        (sub / "test_first.py").unlink()
+        assert [p.name for p in discover_test_files(tmp_path)] == ["test_second.py"]
+
+    def test_repeat_calls_reuse_unchanged_walk(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "test_a.py").write_text("# a", encoding="utf-8")
+        first = discover_test_files(tmp_path)
+
+        def _fail_walk(*args: object) -> None:
+            raise AssertionError("directory walked again")
+
+        monkeypatch.setattr(discovery, "_iter_test_files", _fail_walk)
+        assert discover_test_files(tmp_path) == first
+
     def test_accepts_string_path(self, tmp_path: Path) -> None:
         (tmp_path / "test_a.py").write_text("# a", encoding="utf-8")
 
@@ -1,5 +1,7 @@
 """Tests for the core Pydantic models."""
 
+import uuid
+
 import pytest
 from pydantic import ValidationError
 
@@ -36,6 +38,7 @@ from agentprobe.core.models import (
     TrendDirection,
     TurnResult,
     TurnType,
+    _IDPool,
 )
 from tests.fixtures.results import make_eval_result, make_test_result
 from tests.fixtures.traces import (
@@ -51,6 +54,29 @@ from tests.fixtures.traces import (
 )
 
 
+class TestDefaultFactories:
+    """Test the shared default-value factories."""
+
+    def test_generated_ids_are_uuid4(self) -> None:
+        call_id = make_llm_call().call_id
+        parsed = uuid.UUID(call_id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == call_id
+
+    def test_generated_ids_are_unique_across_pool_refills(self) -> None:
+        ids = {make_tool_call().call_id for _ in range(600)}
+        assert len(ids) == 600
+
+    def test_reset_replaces_held_lock(self) -> None:
+        pool = _IDPool()
+        pool.next()
+        pool._lock.acquire()
+        pool.reset()
+        assert pool._pos == 0
+        assert uuid.UUID(pool.next()).version == 4
+
+
 class TestEnums:
     """Test enum values and string representation."""
 
@@ -113,6 +139,12 @@ class TestLLMCall:
         assert restored.model == "gpt-4o"
         assert restored.input_tokens == 42
 
+    def test_model_name_interned(self) -> None:
+        json_str = make_llm_call(model="interned-model-name").model_dump_json()
+        first = LLMCall.model_validate_json(json_str)
+        second = LLMCall.model_validate_json(json_str)
+        assert first.model is second.model
+
 
 class TestToolCall:
     """Test ToolCall model construction and constraints."""
@@ -242,6 +274,14 @@ class TestTestCase:
         with pytest.raises(ValidationError, match="alphanumeric"):
             TestCase(name="test@#$%")
 
+    def test_name_validation_unicode(self) -> None:
+        tc = TestCase(name="prueba_señal")
+        assert tc.name == "prueba_señal"
+
+    def test_name_validation_separators_only(self) -> None:
+        with pytest.raises(ValidationError, match="alphanumeric"):
+            TestCase(name="_-. ")
+
     def test_name_min_length(self) -> None:
         with pytest.raises(ValidationError, match="at least 1"):
             TestCase(name="")
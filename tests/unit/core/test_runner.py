@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from agentprobe.core.config import AgentProbeConfig
+from agentprobe.core.config import AgentProbeConfig, RunnerConfig
 from agentprobe.core.models import (
     EvalResult,
     EvalVerdict,
@@ -54,15 +55,40 @@ class _MockAdapter:
 class _MockEvaluator:
     """Mock evaluator for testing."""
 
-    def __init__(self, verdict: EvalVerdict = EvalVerdict.PASS, score: float = 1.0) -> None:
+    def __init__(
+        self,
+        verdict: EvalVerdict = EvalVerdict.PASS,
+        score: float = 1.0,
+        *,
+        name: str = "mock-eval",
+        delay: float = 0.0,
+        fail: bool = False,
+        cache_key: str | None = None,
+    ) -> None:
         self._verdict = verdict
         self._score = score
+        self._name = name
+        self._delay = delay
+        self._fail = fail
+        self.close_count = 0
+        self.key = cache_key
 
     @property
     def name(self) -> str:
-        return "mock-eval"
+        return self._name
+
+    async def close(self) -> None:
+        self.close_count += 1
+
+    def cache_key(self) -> str | None:
+        return self.key
 
     async def evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
+        if self._delay > 0:
+            await asyncio.sleep(self._delay)
+        if self._fail:
+            msg = "evaluator crashed"
+            raise RuntimeError(msg)
         return EvalResult(
             evaluator_name=self.name,
             verdict=self._verdict,
@@ -92,14 +118,13 @@ class TestTestRunner:
 
     @pytest.mark.asyncio
     async def test_parallel_execution(self, test_cases: list[TestCase]) -> None:
-        config = AgentProbeConfig()
-        config.runner.parallel = True
-        config.runner.max_workers = 2
+        config = AgentProbeConfig(runner=RunnerConfig(parallel=True, max_workers=2))
         adapter = _MockAdapter()
         runner = TestRunner(config=config)
         run = await runner.run(test_cases, adapter)
         assert run.total_tests == 2
         assert run.passed == 2
+        assert [r.test_name for r in run.test_results] == ["test_one", "test_two"]
 
     @pytest.mark.asyncio
     async def test_adapter_failure_produces_error_result(self) -> None:
@@ -152,3 +177,197 @@ class TestTestRunner:
         runner = TestRunner()
         run = await runner.run([TestCase(name="test_err", input_text="x")], adapter)
         assert run.status == RunStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_evaluators_run_concurrently_in_order(self) -> None:
+        evaluators = [
+            _MockEvaluator(name="slow", delay=0.2),
+            _MockEvaluator(name="fast", delay=0.2),
+        ]
+        runner = TestRunner(evaluators=evaluators)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        run = await runner.run([TestCase(name="test_concurrent", input_text="x")], _MockAdapter())
+        assert loop.time() - start < 0.35
+        names = [r.evaluator_name for r in run.test_results[0].eval_results]
+        assert names == ["slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_raising_evaluator_is_skipped(self) -> None:
+        evaluators = [_MockEvaluator(name="broken", fail=True), _MockEvaluator(name="ok")]
+        runner = TestRunner(evaluators=evaluators)
+        run = await runner.run([TestCase(name="test_raise", input_text="x")], _MockAdapter())
+        result = run.test_results[0]
+        assert [r.evaluator_name for r in result.eval_results] == ["ok"]
+        assert result.status == TestStatus.PASSED
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_remaining_evaluators(self) -> None:
+        evaluators = [
+            _MockEvaluator(name="slow", delay=5.0),
+            _MockEvaluator(EvalVerdict.FAIL, 0.0, name="failing"),
+        ]
+        config = AgentProbeConfig(runner=RunnerConfig(fail_fast=True))
+        runner = TestRunner(config=config, evaluators=evaluators)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        run = await runner.run([TestCase(name="test_fail_fast", input_text="x")], _MockAdapter())
+        assert loop.time() - start < 1.0
+        result = run.test_results[0]
+        assert [r.evaluator_name for r in result.eval_results] == ["failing"]
+        assert result.status == TestStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_all_passing_keeps_order(self) -> None:
+        evaluators = [
+            _MockEvaluator(name="first", delay=0.05),
+            _MockEvaluator(name="second"),
+        ]
+        config = AgentProbeConfig(runner=RunnerConfig(fail_fast=True))
+        runner = TestRunner(config=config, evaluators=evaluators)
+        run = await runner.run(
+            [TestCase(name="test_fail_fast_pass", input_text="x")], _MockAdapter()
+        )
+        names = [r.evaluator_name for r in run.test_results[0].eval_results]
+        assert names == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_cache_results_skips_repeat_invocation(self, tmp_path: Path) -> None:
+        config = AgentProbeConfig(
+            runner=RunnerConfig(cache_results=True, cache_dir=str(tmp_path / "cache"))
+        )
+        adapter = _MockAdapter()
+        tc = TestCase(name="test_cached", input_text="x")
+
+        first = await TestRunner(config=config).run([tc], adapter)
+        second = await TestRunner(config=config).run([tc], adapter)
+
+        assert adapter.call_count == 1
+        replayed, original = second.test_results[0], first.test_results[0]
+        assert (replayed.status, replayed.score) == (original.status, original.score)
+        assert replayed.result_id != original.result_id
+        assert replayed.created_at >= original.created_at
+
+    @pytest.mark.asyncio
+    async def test_cache_results_ignores_errors(self, tmp_path: Path) -> None:
+        config = AgentProbeConfig(
+            runner=RunnerConfig(cache_results=True, cache_dir=str(tmp_path / "cache"))
+        )
+        adapter = _MockAdapter(fail=True)
+        tc = TestCase(name="test_uncached_error", input_text="x")
+
+        await TestRunner(config=config).run([tc], adapter)
+        await TestRunner(config=config).run([tc], adapter)
+
+        assert adapter.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_input(self, tmp_path: Path) -> None:
+        config = AgentProbeConfig(
+            runner=RunnerConfig(cache_results=True, cache_dir=str(tmp_path / "cache"))
+        )
+        adapter = _MockAdapter()
+        runner = TestRunner(config=config)
+
+        await runner.run([TestCase(name="test_key", input_text="a")], adapter)
+        await runner.run([TestCase(name="test_key", input_text="b")], adapter)
+
+        assert adapter.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_evaluator_config_and_metadata(self, tmp_path: Path) -> None:
+        config = AgentProbeConfig(
+            runner=RunnerConfig(cache_results=True, cache_dir=str(tmp_path / "cache"))
+        )
+        adapter = _MockAdapter()
+        evaluator = _MockEvaluator(cache_key="v1")
+        runner = TestRunner(config=config, evaluators=[evaluator])
+        tc = TestCase(name="test_key", input_text="x")
+
+        await runner.run([tc], adapter)
+        await runner.run([tc], adapter)
+        assert adapter.call_count == 1
+
+        evaluator.key = "v2"
+        await runner.run([tc], adapter)
+        assert adapter.call_count == 2
+
+        await runner.run([TestCase(name="test_key", input_text="x", metadata={"k": 1})], adapter)
+        assert adapter.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_for_evaluator_without_key(self, tmp_path: Path) -> None:
+        config = AgentProbeConfig(
+            runner=RunnerConfig(cache_results=True, cache_dir=str(tmp_path / "cache"))
+        )
+        adapter = _MockAdapter()
+        runner = TestRunner(config=config, evaluators=[_MockEvaluator()])
+        tc = TestCase(name="test_unkeyed", input_text="x")
+
+        await runner.run([tc], adapter)
+        await runner.run([tc], adapter)
+
+        assert adapter.call_count == 2
+        assert not (tmp_path / "cache").exists()
+
+    @pytest.mark.asyncio
+    async def test_parallel_respects_adapter_max_concurrency(self) -> None:
+        class _LimitedAdapter(_MockAdapter):
+            max_concurrency = 1
+
+            def __init__(self) -> None:
+                super().__init__(delay=0.01)
+                self.active = 0
+                self.peak = 0
+
+            async def invoke(self, input_text: str, **kwargs: Any) -> Trace:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                try:
+                    return await super().invoke(input_text, **kwargs)
+                finally:
+                    self.active -= 1
+
+        adapter = _LimitedAdapter()
+        config = AgentProbeConfig(runner=RunnerConfig(parallel=True, max_workers=4))
+        cases = [TestCase(name=f"test_{i}", input_text="x") for i in range(4)]
+        run = await TestRunner(config=config).run(cases, adapter)
+        assert run.passed == 4
+        assert adapter.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_semaphore_reused_across_runs(self) -> None:
+        config = AgentProbeConfig(runner=RunnerConfig(parallel=True, max_workers=2))
+        runner = TestRunner(config=config)
+        cases = [TestCase(name="test_a", input_text="x")]
+        await runner.run(cases, _MockAdapter())
+        first = runner._semaphore
+        await runner.run(cases, _MockAdapter())
+        assert runner._semaphore is first
+
+    @pytest.mark.asyncio
+    async def test_evaluators_closed_after_run(self) -> None:
+        evaluator = _MockEvaluator()
+        runner = TestRunner(evaluators=[evaluator])
+        await runner.run([TestCase(name="test_close", input_text="x")], _MockAdapter())
+        assert evaluator.close_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evaluators_closed_when_run_fails(self) -> None:
+        class _BrokenRunner(TestRunner):
+            async def _run_sequential(self, *args: Any) -> list[Any]:
+                msg = "boom"
+                raise RuntimeError(msg)
+
+        evaluator = _MockEvaluator()
+        with pytest.raises(RuntimeError, match="boom"):
+            await _BrokenRunner(evaluators=[evaluator]).run([], _MockAdapter())
+        assert evaluator.close_count == 1
+
+    def test_parallel_semaphore_rebuilt_for_new_loop(self) -> None:
+        config = AgentProbeConfig(runner=RunnerConfig(parallel=True, max_workers=1))
+        runner = TestRunner(config=config)
+        cases = [TestCase(name=f"test_{i}", input_text="x") for i in range(2)]
+        first = asyncio.run(runner.run(cases, _MockAdapter(delay=0.001)))
+        second = asyncio.run(runner.run(cases, _MockAdapter(delay=0.001)))
+        assert first.passed == second.passed == 2
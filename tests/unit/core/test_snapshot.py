@@ -7,10 +7,53 @@ from pathlib import Path
 import pytest
 
 from agentprobe.core.exceptions import SnapshotError
-from agentprobe.core.snapshot import SnapshotManager
+from agentprobe.core.models import Trace
+from agentprobe.core.snapshot import SnapshotManager, _keyword_overlap, _serialize
 from tests.fixtures.traces import make_llm_call, make_tool_call, make_trace
 
 
+class TestKeywordOverlap:
+    """Tests for the keyword overlap helper."""
+
+    def test_case_insensitive(self) -> None:
+        assert _keyword_overlap("Hello World", "hello world") == 1.0
+
+    def test_ignores_punctuation(self) -> None:
+        assert _keyword_overlap("Hello, world!", "hello world") == 1.0
+
+    def test_keeps_unicode_words(self) -> None:
+        assert _keyword_overlap("caf\u00e9 ouvert", "caf\u00e9") == 0.5
+
+    def test_partial_overlap(self) -> None:
+        assert _keyword_overlap("a b c", "b c d") == 0.5
+
+    def test_empty(self) -> None:
+        assert _keyword_overlap("", "") == 1.0
+        assert _keyword_overlap("a", "") == 0.0
+
+
+class TestSerialize:
+    """Tests for the snapshot serializer."""
+
+    def test_round_trips_through_load(self) -> None:
+        trace = make_trace(
+            output_text="caf\u00e9 \u2014 done",
+            llm_calls=[make_llm_call(input_tokens=10)],
+            tool_calls=[make_tool_call(tool_name="search")],
+        )
+        data = _serialize(trace)
+        assert "caf\u00e9 \u2014 done".encode() in data
+        assert Trace.model_validate_json(data) == trace
+
+    def test_handles_wide_ints_and_floats(self) -> None:
+        trace = make_trace(
+            tool_calls=[make_tool_call(tool_input={"big": 2**70}, tool_output=1e16)],
+        )
+        data = _serialize(trace)
+        assert str(2**70).encode() in data
+        assert b"1e+16" in data
+
+
 class TestSnapshotManager:
     """Tests for SnapshotManager."""
 
@@ -129,6 +172,64 @@ class TestSnapshotManager:
         assert count == 3
         assert manager.list_snapshots() == ["snap1", "snap2", "snap3"]
 
+    def test_compare_reuses_unchanged_baseline(
+        self, manager: SnapshotManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        trace = make_trace(output_text="hello world")
+        manager.save("golden", trace)
+        manager.compare("golden", trace)
+
+        def _fail_load(name: str) -> None:
+            raise AssertionError("baseline reloaded")
+
+        monkeypatch.setattr(manager, "load", _fail_load)
+        diff = manager.compare("golden", trace)
+        assert diff.is_match
+
+    def test_compare_sees_resaved_baseline(self, manager: SnapshotManager) -> None:
+        manager.save("golden", make_trace(output_text="alpha beta"))
+        assert manager.compare("golden", make_trace(output_text="alpha beta")).is_match
+
+        manager.save("golden", make_trace(output_text="something entirely different here"))
+        diff = manager.compare("golden", make_trace(output_text="alpha beta"))
+        output_diff = next(d for d in diff.diffs if d.dimension == "output")
+        assert output_diff.similarity == 0.0
+
+    def test_compare_many_in_process(self, manager: SnapshotManager) -> None:
+        traces = {"a": make_trace(output_text="one"), "b": make_trace(output_text="two")}
+        manager.update_all(traces)
+        diffs = manager.compare_many(traces)
+        assert list(diffs) == ["a", "b"]
+        assert all(d.is_match for d in diffs.values())
+
+    def test_compare_many_process_pool(self, manager: SnapshotManager) -> None:
+        traces = {f"snap{i}": make_trace(output_text=f"output {i}") for i in range(3)}
+        manager.update_all(traces)
+        diffs = manager.compare_many(traces, max_workers=2)
+        assert list(diffs) == ["snap0", "snap1", "snap2"]
+        assert diffs == {name: manager.compare(name, t) for name, t in traces.items()}
+
+    def test_compare_many_missing_snapshot(self, manager: SnapshotManager) -> None:
+        with pytest.raises(SnapshotError, match="not found"):
+            manager.compare_many({"missing": make_trace()})
+
+    @pytest.mark.asyncio
+    async def test_async_save_and_load(self, manager: SnapshotManager) -> None:
+        trace = make_trace(output_text="async snapshot")
+        await manager.save_async("async", trace)
+        assert await manager.load_async("async") == trace
+
+    @pytest.mark.asyncio
+    async def test_load_async_missing(self, manager: SnapshotManager) -> None:
+        with pytest.raises(SnapshotError, match="not found"):
+            await manager.load_async("missing")
+
+    def test_update_all_shared_trace(self, manager: SnapshotManager) -> None:
+        trace = make_trace(output_text="shared")
+        manager.update_all({"a": trace, "b": trace})
+        assert manager.load("a") == trace
+        assert manager.load("b") == trace
+
     def test_compare_dimensions_present(self, manager: SnapshotManager) -> None:
         trace = make_trace(
             llm_calls=[make_llm_call(input_tokens=100)],
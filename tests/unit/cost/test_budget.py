@@ -62,6 +62,15 @@ class TestBudgetEnforcer:
         assert result.within_budget is False
         assert result.actual_cost_usd == 3.0
 
+    def test_check_suite_no_spurious_overrun_from_rounding(self) -> None:
+        # Naive float summation gives 1.5000000000000002 here.
+        enforcer = BudgetEnforcer(suite_budget_usd=1.5)
+        summaries = [self._make_cost_summary(0.1) for _ in range(15)]
+        result = enforcer.check_suite(summaries)
+        assert result is not None
+        assert result.within_budget is True
+        assert result.actual_cost_usd == 1.5
+
     def test_check_suite_no_budget(self) -> None:
         enforcer = BudgetEnforcer()
         summaries = [self._make_cost_summary(100.0)]
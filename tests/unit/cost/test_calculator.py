@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import os
+import sys
+from pathlib import Path
+
 import pytest
+from pydantic import ValidationError
 
 from agentprobe.core.exceptions import BudgetExceededError
-from agentprobe.cost.calculator import CostCalculator, PricingConfig, PricingEntry
+from agentprobe.cost.calculator import (
+    CostCalculator,
+    PricingConfig,
+    PricingEntry,
+    _load_entries,
+)
 from tests.fixtures.traces import make_llm_call, make_trace
 
 
@@ -35,10 +45,92 @@ class TestPricingConfig:
         assert len(config.entries) > 0
         assert "claude-sonnet-4-5-20250929" in config.entries
 
+    @pytest.mark.asyncio
+    async def test_load_from_dir_async(self) -> None:
+        config = await PricingConfig.load_from_dir_async()
+        assert config == PricingConfig.load_from_dir()
+
     def test_load_from_nonexistent_dir(self, tmp_path: object) -> None:
         config = PricingConfig.load_from_dir("/nonexistent/path")
         assert len(config.entries) == 0
 
+    def test_model_names_interned(self, tmp_path: Path) -> None:
+        pricing_dir = tmp_path / "pricing"
+        pricing_dir.mkdir()
+        (pricing_dir / "test.yaml").write_text(
+            "models:\n  - model: interned-model\n"
+            "    input_cost_per_1k: 1.0\n    output_cost_per_1k: 2.0\n"
+        )
+        PricingConfig.load_from_dir(pricing_dir)
+        _load_entries.cache_clear()
+        config = PricingConfig.load_from_dir(pricing_dir)
+        name = "".join(["interned", "-model"])
+        key = next(iter(config.entries))
+        assert key is sys.intern(name)
+        assert config.entries[key].model is key
+
+    def test_load_reuses_disk_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        pricing_dir = tmp_path / "pricing"
+        pricing_dir.mkdir()
+        (pricing_dir / "test.yaml").write_text(
+            "models:\n  - model: m\n    input_cost_per_1k: 1.0\n    output_cost_per_1k: 2.0\n"
+        )
+        first = PricingConfig.load_from_dir(pricing_dir)
+        _load_entries.cache_clear()
+
+        def _fail_load(*args: object, **kwargs: object) -> None:
+            raise AssertionError("YAML re-parsed")
+
+        monkeypatch.setattr("agentprobe.cost.calculator.yaml.load", _fail_load)
+        assert PricingConfig.load_from_dir(pricing_dir) == first
+
+    def test_partial_load_not_cached(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        pricing_dir = tmp_path / "pricing"
+        pricing_dir.mkdir()
+        (pricing_dir / "a.yaml").write_text(
+            "models:\n  - model: a\n    input_cost_per_1k: 1.0\n    output_cost_per_1k: 2.0\n"
+        )
+        (pricing_dir / "b.yaml").write_text("models:\n  - model: b\n    input_cost_per_1k: x\n")
+
+        for _ in range(2):
+            caplog.clear()
+            _load_entries.cache_clear()
+            assert list(PricingConfig.load_from_dir(pricing_dir).entries) == ["a"]
+            assert "Failed to load pricing from" in caplog.text
+
+    def test_load_sees_changed_file(self, tmp_path: Path) -> None:
+        pricing_dir = tmp_path / "pricing"
+        pricing_dir.mkdir()
+        yaml_file = pricing_dir / "test.yaml"
+        yaml_file.write_text(
+            "models:\n  - model: m\n    input_cost_per_1k: 1.0\n    output_cost_per_1k: 2.0\n"
+        )
+        PricingConfig.load_from_dir(pricing_dir)
+
+        yaml_file.write_text(
+            "models:\n  - model: m\n    input_cost_per_1k: 5.25\n    output_cost_per_1k: 2.0\n"
+        )
+        assert PricingConfig.load_from_dir(pricing_dir).entries["m"].input_cost_per_1k == 5.25
+
+    def test_load_returns_independent_configs(self) -> None:
+        first = PricingConfig.load_from_dir()
+        first.entries.clear()
+        assert len(PricingConfig.load_from_dir().entries) > 0
+
+    def test_loaded_entries_are_immutable(self) -> None:
+        entry = next(iter(PricingConfig.load_from_dir().entries.values()))
+        with pytest.raises(ValidationError):
+            entry.input_cost_per_1k = 999.0
+
+    def test_load_ignores_corrupt_cache(self, tmp_path: Path) -> None:
+        config = PricingConfig.load_from_dir()
+        for cache_file in Path(os.environ["XDG_CACHE_HOME"]).glob("agentprobe/pricing-*.json"):
+            cache_file.write_text("{not json")
+        _load_entries.cache_clear()
+        assert PricingConfig.load_from_dir() == config
+
 
 class TestCostCalculator:
     """Tests for CostCalculator cost computation."""
@@ -114,8 +206,9 @@ class TestCostCalculator:
                 ),
             ]
         )
-        with pytest.raises(BudgetExceededError):
+        with pytest.raises(BudgetExceededError) as exc_info:
             calculator.calculate_trace_cost(trace)
+        assert exc_info.value.actual == pytest.approx(10000 / 1000 * 0.003 + 5000 / 1000 * 0.015)
 
     @pytest.mark.parametrize(
         "input_tokens,output_tokens,expected_cost",
@@ -152,6 +245,18 @@ class TestCostCalculator:
         assert summary.breakdown_by_model["gpt-4o"].call_count == 3
         assert summary.breakdown_by_model["gpt-4o"].input_tokens == 60
 
+    def test_trace_cost_matches_per_call_costs(self, calculator: CostCalculator) -> None:
+        calls = [
+            make_llm_call(model="gpt-4o", input_tokens=123, output_tokens=45),
+            make_llm_call(model="claude-sonnet-4-5-20250929", input_tokens=10, output_tokens=99),
+            make_llm_call(model="gpt-4o", input_tokens=7, output_tokens=300),
+            make_llm_call(model="unknown-model", input_tokens=50, output_tokens=50),
+        ]
+        summary = calculator.calculate_trace_cost(make_trace(llm_calls=calls))
+        expected = sum(calculator.calculate_llm_cost(c) for c in calls)
+        assert summary.total_cost_usd == pytest.approx(expected, rel=1e-12)
+        assert summary.breakdown_by_model["unknown-model"].total_cost_usd == 0.0
+
 
 class TestCostCalculatorNewProviders:
     """Parametrized tests for cost calculation across multiple providers."""
@@ -0,0 +1,28 @@
+"""Tests for dashboard dependency helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from starlette.requests import Request
+
+from agentprobe.dashboard.app import create_app
+from agentprobe.dashboard.dependencies import build_storage, get_storage
+from agentprobe.storage.sqlite import SQLiteStorage
+
+
+class TestGetStorage:
+    """Tests for get_storage."""
+
+    def test_returns_app_storage(self, tmp_path: Path) -> None:
+        app = create_app(db_path=str(tmp_path / "test.db"))
+        request = Request({"type": "http", "app": app})
+        assert get_storage(request) is app.state.storage
+        assert get_storage(request) is get_storage(request)
+
+
+class TestBuildStorage:
+    """Tests for build_storage."""
+
+    def test_builds_sqlite_storage(self, tmp_path: Path) -> None:
+        assert isinstance(build_storage(str(tmp_path / "test.db")), SQLiteStorage)
@@ -0,0 +1,49 @@
+"""Tests for streamed dashboard JSON responses."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Sequence
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from agentprobe.core.models import Trace
+from agentprobe.dashboard import streaming
+from agentprobe.dashboard.streaming import json_array_response
+from tests.fixtures.traces import make_trace
+
+
+async def _iterate(items: Sequence[BaseModel]) -> AsyncIterator[BaseModel]:
+    for item in items:
+        yield item
+
+
+async def _body(items: Sequence[BaseModel]) -> bytes:
+    response = await json_array_response(_iterate(items))
+    assert response.media_type == "application/json"
+    chunks = [chunk async for chunk in response.body_iterator]
+    return b"".join(c if isinstance(c, bytes) else c.encode() for c in chunks)
+
+
+class TestJsonArrayResponse:
+    """Tests for json_array_response."""
+
+    @pytest.mark.asyncio
+    async def test_empty(self) -> None:
+        assert await _body([]) == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_matches_list_encoding(self) -> None:
+        traces = [make_trace(trace_id=f"t{i}") for i in range(3)]
+        assert await _body(traces) == TypeAdapter(list[Trace]).dump_json(traces)
+
+    @pytest.mark.asyncio
+    async def test_splits_large_bodies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(streaming, "_CHUNK_BYTES", 1)
+        traces = [make_trace(trace_id=f"t{i}") for i in range(3)]
+        response = await json_array_response(_iterate(traces))
+        chunks = [chunk async for chunk in response.body_iterator]
+        assert len(chunks) == 3
+        body = b"".join(c if isinstance(c, bytes) else c.encode() for c in chunks)
+        assert [t["trace_id"] for t in json.loads(body)] == ["t0", "t1", "t2"]
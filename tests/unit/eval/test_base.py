@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from agentprobe.core.exceptions import EvaluatorError
@@ -51,6 +53,9 @@ class TestBaseEvaluator:
         with pytest.raises(TypeError, match="abstract"):
             BaseEvaluator("test")  # type: ignore[abstract]
 
+    def test_cache_key_defaults_to_none(self) -> None:
+        assert _PassingEvaluator("my-eval").cache_key() is None
+
     def test_name_property(self) -> None:
         evaluator = _PassingEvaluator("my-eval")
         assert evaluator.name == "my-eval"
@@ -78,3 +83,52 @@ class TestBaseEvaluator:
         evaluator = _EvaluatorErrorRaiser("error-eval")
         with pytest.raises(EvaluatorError, match="deliberate failure"):
             await evaluator.evaluate(test_case, trace)
+
+
+class TestEvaluatorHTTPSession:
+    """Tests for the shared HTTP session lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_and_closed(self) -> None:
+        async with _PassingEvaluator("http-eval") as evaluator:
+            session = await evaluator._http_session()
+            assert await evaluator._http_session() is session
+        assert session.closed
+        assert evaluator._http is None
+
+    def test_session_from_previous_loop_closed(self) -> None:
+        evaluator = _PassingEvaluator("http-eval")
+        first = asyncio.run(evaluator._http_session())
+        second = asyncio.run(evaluator._http_session())
+        assert second is not first
+        assert first.closed
+        asyncio.run(evaluator.close())
+        assert second.closed
+
+    def test_concurrent_callers_share_replacement_session(self) -> None:
+        class _SlowCloseSession:
+            def __init__(self) -> None:
+                self.closed = False
+
+            async def close(self) -> None:
+                await asyncio.sleep(0)
+                self.closed = True
+
+        opened: list[_SlowCloseSession] = []
+
+        class _Evaluator(_PassingEvaluator):
+            def _open_http(self) -> _SlowCloseSession:  # type: ignore[override]
+                session = _SlowCloseSession()
+                opened.append(session)
+                return session
+
+        evaluator = _Evaluator("http-eval")
+        asyncio.run(evaluator._http_session())
+
+        async def _both() -> list[object]:
+            return list(await asyncio.gather(evaluator._http_session(), evaluator._http_session()))
+
+        first, second = asyncio.run(_both())
+        assert first is second
+        assert len(opened) == 2
+        assert opened[0].closed
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import math
+from array import array
 
 import pytest
 
+from agentprobe.core.exceptions import EvaluatorError
 from agentprobe.core.models import EvalVerdict, TestCase, Trace
-from agentprobe.eval.embedding import EmbeddingSimilarityEvaluator, cosine_similarity
+from agentprobe.eval.embedding import (
+    EmbeddingSimilarityEvaluator,
+    _Embedding,
+    cosine_similarity,
+)
 
 
 class TestCosineSimilarity:
@@ -63,8 +69,8 @@ class TestEmbeddingSimilarityEvaluator:
     @pytest.mark.asyncio
     async def test_with_cached_embeddings(self) -> None:
         evaluator = EmbeddingSimilarityEvaluator(api_key="test", threshold=0.8)
-        evaluator._cache["expected text"] = [1.0, 0.0, 0.0]
-        evaluator._cache["actual text"] = [0.9, 0.1, 0.0]
+        evaluator._cache["expected text"] = _Embedding.of([1.0, 0.0, 0.0])
+        evaluator._cache["actual text"] = _Embedding.of([0.9, 0.1, 0.0])
 
         tc = TestCase(name="test", input_text="x", expected_output="expected text")
         trace = Trace(agent_name="test", output_text="actual text")
@@ -75,8 +81,8 @@ class TestEmbeddingSimilarityEvaluator:
     @pytest.mark.asyncio
     async def test_low_similarity_fails(self) -> None:
         evaluator = EmbeddingSimilarityEvaluator(api_key="test", threshold=0.9)
-        evaluator._cache["good"] = [1.0, 0.0, 0.0]
-        evaluator._cache["bad"] = [0.0, 1.0, 0.0]
+        evaluator._cache["good"] = _Embedding.of([1.0, 0.0, 0.0])
+        evaluator._cache["bad"] = _Embedding.of([0.0, 1.0, 0.0])
 
         tc = TestCase(name="test", input_text="x", expected_output="good")
         trace = Trace(agent_name="test", output_text="bad")
@@ -87,11 +93,75 @@ class TestEmbeddingSimilarityEvaluator:
     @pytest.mark.asyncio
     async def test_partial_similarity(self) -> None:
         evaluator = EmbeddingSimilarityEvaluator(api_key="test", threshold=0.9)
-        evaluator._cache["expected"] = [1.0, 1.0, 0.0]
-        evaluator._cache["actual"] = [1.0, 0.0, 0.0]
+        evaluator._cache["expected"] = _Embedding.of([1.0, 1.0, 0.0])
+        evaluator._cache["actual"] = _Embedding.of([1.0, 0.0, 0.0])
 
         tc = TestCase(name="test", input_text="x", expected_output="expected")
         trace = Trace(agent_name="test", output_text="actual")
         result = await evaluator.evaluate(tc, trace)
         sim = cosine_similarity([1.0, 1.0, 0.0], [1.0, 0.0, 0.0])
         assert result.score == pytest.approx(sim, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_embeddings_fetched_once_per_text(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        evaluator = EmbeddingSimilarityEvaluator(api_key="test")
+        calls: list[list[str]] = []
+
+        async def _fake_api(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [[3.0, 4.0] if text == "expected" else [4.0, 3.0] for text in texts]
+
+        monkeypatch.setattr(evaluator, "_call_embedding_api", _fake_api)
+        tc = TestCase(name="test", input_text="x", expected_output="expected")
+        for output in ("a", "b", "a"):
+            await evaluator.evaluate(tc, Trace(agent_name="test", output_text=output))
+
+        assert calls == [["expected", "a"], ["b"]]
+        assert evaluator._cache["expected"].norm == 5.0
+        assert isinstance(evaluator._cache["expected"].vector, array)
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_fetched_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        evaluator = EmbeddingSimilarityEvaluator(api_key="test")
+        calls: list[list[str]] = []
+
+        async def _fake_api(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [[1.0, 0.0] for _ in texts]
+
+        monkeypatch.setattr(evaluator, "_call_embedding_api", _fake_api)
+        tc = TestCase(name="test", input_text="x", expected_output="same")
+        result = await evaluator.evaluate(tc, Trace(agent_name="test", output_text="same"))
+
+        assert calls == [["same"]]
+        assert result.score == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_embedding_count_mismatch_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        evaluator = EmbeddingSimilarityEvaluator(api_key="test")
+
+        async def _fake_api(texts: list[str]) -> list[list[float]]:
+            return [[1.0, 0.0]]
+
+        monkeypatch.setattr(evaluator, "_call_embedding_api", _fake_api)
+        tc = TestCase(name="test", input_text="x", expected_output="a")
+        with pytest.raises(EvaluatorError, match="2 inputs"):
+            await evaluator.evaluate(tc, Trace(agent_name="test", output_text="b"))
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        evaluator = EmbeddingSimilarityEvaluator(api_key="test", cache_size=3)
+
+        async def _fake_api(texts: list[str]) -> list[list[float]]:
+            return [[1.0, 0.0] for _ in texts]
+
+        monkeypatch.setattr(evaluator, "_call_embedding_api", _fake_api)
+        tc = TestCase(name="test", input_text="x", expected_output="expected")
+        for output in ("a", "b", "c"):
+            await evaluator.evaluate(tc, Trace(agent_name="test", output_text=output))
+
+        assert list(evaluator._cache) == ["b", "expected", "c"]
+
+    def test_negative_cache_size_raises(self) -> None:
+        with pytest.raises(ValueError, match="cache_size"):
+            EmbeddingSimilarityEvaluator(api_key="test", cache_size=-1)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from agentprobe.core.exceptions import JudgeAPIError
-from agentprobe.core.models import EvalVerdict, TestCase, Trace
-from agentprobe.eval.llm_judge import LLMJudge
+from agentprobe.core.models import EvalResult, EvalVerdict, TestCase, Trace
+from agentprobe.eval.llm_judge import JudgeCache, LLMJudge
 
 
 @pytest.fixture
@@ -74,6 +77,27 @@ class TestLLMJudge:
         result = judge._parse_response(response)
         assert result.verdict == EvalVerdict.PASS
 
+    def test_parse_json_with_trailing_braces(self) -> None:
+        judge = LLMJudge(api_key="test-key")
+        response = (
+            'Verdict: {"verdict": "fail", "score": 0.2, "reason": "Uses {x} wrongly"}\n'
+            "Template used: {placeholder}"
+        )
+        result = judge._parse_response(response)
+        assert result.verdict == EvalVerdict.FAIL
+        assert result.reason == "Uses {x} wrongly"
+
+    def test_parse_skips_unbalanced_brace_before_json(self) -> None:
+        judge = LLMJudge(api_key="test-key")
+        response = 'Note { unclosed. {"verdict": "pass", "score": 0.9, "reason": "ok"}'
+        assert judge._parse_response(response).verdict == EvalVerdict.PASS
+
+    def test_parse_malformed_json_reports_failure(self) -> None:
+        judge = LLMJudge(api_key="test-key")
+        result = judge._parse_response('{"verdict": "pass", "score": }')
+        assert result.verdict == EvalVerdict.ERROR
+        assert result.reason.startswith("Failed to parse")
+
     def test_score_clamped(self) -> None:
         judge = LLMJudge(api_key="test-key")
         result = judge._parse_response('{"verdict": "pass", "score": 5.0, "reason": ""}')
@@ -96,3 +120,277 @@ class TestLLMJudge:
         judge = LLMJudge(provider="unknown", api_key="key")
         with pytest.raises(JudgeAPIError, match="Unknown provider"):
             await judge._call_api("test prompt")
+
+
+_PASS_RESPONSE = '{"verdict": "pass", "score": 0.9, "reason": "Correct"}'
+
+
+class TestJudgeCache:
+    """Tests for the judge verdict cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_api(self, tmp_path: Path, test_case: TestCase, trace: Trace) -> None:
+        judge = LLMJudge(api_key="k", cache=JudgeCache(tmp_path))
+        with patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api:
+            first = await judge.evaluate(test_case, trace)
+            second = await judge.evaluate(test_case, trace)
+        assert api.await_count == 1
+        assert (second.verdict, second.score, second.reason) == (
+            first.verdict,
+            first.score,
+            first.reason,
+        )
+        assert second.eval_id != first.eval_id
+
+    def test_put_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        cache = JudgeCache(tmp_path)
+        result = EvalResult(evaluator_name="llm-judge", verdict=EvalVerdict.PASS, score=1.0)
+        cache.put("ab" * 32, result)
+        assert cache.get("ab" * 32) == result
+        assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [f"{'ab' * 32}.json"]
+
+    @pytest.mark.asyncio
+    async def test_key_depends_on_rubric(
+        self, tmp_path: Path, test_case: TestCase, trace: Trace
+    ) -> None:
+        cache = JudgeCache(tmp_path)
+        for rubric in ("be brief", "be thorough"):
+            judge = LLMJudge(api_key="k", rubric=rubric, cache=cache)
+            with patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api:
+                await judge.evaluate(test_case, trace)
+            assert api.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_key_depends_on_max_tokens(
+        self, tmp_path: Path, test_case: TestCase, trace: Trace
+    ) -> None:
+        cache = JudgeCache(tmp_path)
+        for max_tokens in (256, 1024):
+            judge = LLMJudge(api_key="k", max_tokens=max_tokens, cache=cache)
+            with patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api:
+                await judge.evaluate(test_case, trace)
+            assert api.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("temperature", "env"),
+        [(0.7, {}), (0.0, {"AGENTPROBE_JUDGE_CACHE_DISABLE": "1"})],
+    )
+    async def test_bypassed(
+        self,
+        tmp_path: Path,
+        test_case: TestCase,
+        trace: Trace,
+        temperature: float,
+        env: dict[str, str],
+    ) -> None:
+        judge = LLMJudge(api_key="k", temperature=temperature, cache=JudgeCache(tmp_path))
+        with (
+            patch.dict("os.environ", env),
+            patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api,
+        ):
+            await judge.evaluate(test_case, trace)
+            await judge.evaluate(test_case, trace)
+        assert api.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_not_cached(
+        self, tmp_path: Path, test_case: TestCase, trace: Trace
+    ) -> None:
+        judge = LLMJudge(api_key="k", cache=JudgeCache(tmp_path))
+        with patch.object(judge, "_call_api", AsyncMock(return_value="garbage")) as api:
+            await judge.evaluate(test_case, trace)
+            await judge.evaluate(test_case, trace)
+        assert api.await_count == 2
+
+    def test_corrupt_entry_ignored(self, tmp_path: Path) -> None:
+        cache = JudgeCache(tmp_path)
+        key = "ab" + "0" * 62
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / f"{key}.json").write_text("{not json")
+        assert cache.get(key) is None
+
+
+class TestJudgeSessions:
+    """Tests for incremental judging within a session."""
+
+    @pytest.fixture
+    def session_case(self) -> TestCase:
+        return TestCase(name="test_session", input_text="Chat", metadata={"judge_session_id": "s1"})
+
+    @staticmethod
+    def _trace(blocks: int) -> Trace:
+        return Trace(agent_name="test", output_text="\n\n".join(f"turn {i}" for i in range(blocks)))
+
+    @pytest.mark.asyncio
+    async def test_appended_output_sends_only_tail(self, session_case: TestCase) -> None:
+        judge = LLMJudge(api_key="k")
+        with patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api:
+            await judge.evaluate(session_case, self._trace(8))
+            result = await judge.evaluate(session_case, self._trace(9))
+
+        assert result.metadata == {"delta_blocks": 1}
+        delta_prompt = api.await_args_list[1].args[0]
+        assert "turn 8" in delta_prompt
+        assert "turn 0" not in delta_prompt
+        assert "Previous Verdict" in delta_prompt
+        assert "system_prompt" in api.await_args_list[1].kwargs
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "second_output",
+        [
+            "turn 0\n\nturn 1",  # blocks removed
+            "changed\n\n" + "\n\n".join(f"turn {i}" for i in range(1, 9)),  # edited, not appended
+            "\n\n".join(f"turn {i}" for i in range(20)),  # overlap below threshold
+        ],
+    )
+    async def test_non_append_judges_full_output(
+        self, session_case: TestCase, second_output: str
+    ) -> None:
+        judge = LLMJudge(api_key="k")
+        with patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api:
+            await judge.evaluate(session_case, self._trace(8))
+            result = await judge.evaluate(
+                session_case, Trace(agent_name="test", output_text=second_output)
+            )
+
+        assert "delta_blocks" not in result.metadata
+        assert "Actual Output" in api.await_args_list[1].args[0]
+
+    @pytest.mark.asyncio
+    async def test_without_session_id_judges_full_output(self) -> None:
+        judge = LLMJudge(api_key="k")
+        case = TestCase(name="test_plain", input_text="Chat")
+        with patch.object(judge, "_call_api", AsyncMock(return_value=_PASS_RESPONSE)) as api:
+            await judge.evaluate(case, self._trace(8))
+            await judge.evaluate(case, self._trace(9))
+        assert all("Actual Output" in call.args[0] for call in api.await_args_list)
+
+
+class TestEvaluateBatch:
+    """Tests for batched judging."""
+
+    @staticmethod
+    def _pairs(count: int) -> list[tuple[TestCase, Trace]]:
+        return [
+            (
+                TestCase(name=f"test_{i}", input_text=f"q{i}"),
+                Trace(agent_name="test", output_text=f"a{i}"),
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _respond(prompt: str, *, system_prompt: str = "") -> str:
+        count = prompt.count("Item ")
+        items = [
+            {"index": i, "verdict": "pass", "score": i / 10, "reason": ""} for i in range(count)
+        ]
+        return json.dumps(list(reversed(items)))
+
+    @pytest.mark.asyncio
+    async def test_packs_items_per_call(self) -> None:
+        judge = LLMJudge(api_key="k")
+        with patch.object(judge, "_call_api", AsyncMock(side_effect=self._respond)) as api:
+            results = await judge.evaluate_batch(self._pairs(7), batch_size=3)
+        assert api.await_count == 3
+        assert [r.score for r in results] == [0.0, 0.1, 0.2, 0.0, 0.1, 0.2, 0.0]
+        assert all(r.evaluator_name == "llm-judge" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_missing_and_unparseable_items(self) -> None:
+        judge = LLMJudge(api_key="k")
+        response = 'Sure: [{"index": 1, "verdict": "fail", "score": 0.2, "reason": "no"}]'
+        with patch.object(judge, "_call_api", AsyncMock(return_value=response)):
+            results = await judge.evaluate_batch(self._pairs(2))
+        assert [r.verdict for r in results] == [EvalVerdict.ERROR, EvalVerdict.FAIL]
+
+        with patch.object(judge, "_call_api", AsyncMock(return_value="nope")):
+            results = await judge.evaluate_batch(self._pairs(2))
+        assert all(r.verdict == EvalVerdict.ERROR for r in results)
+
+    @pytest.mark.asyncio
+    async def test_uses_cache(self, tmp_path: Path) -> None:
+        judge = LLMJudge(api_key="k", cache=JudgeCache(tmp_path))
+        with patch.object(judge, "_call_api", AsyncMock(side_effect=self._respond)) as api:
+            await judge.evaluate_batch(self._pairs(2))
+            results = await judge.evaluate_batch(self._pairs(3))
+        assert api.await_count == 2
+        assert "Item 1" not in api.await_args_list[1].args[0]
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_verdicts_not_reused_by_evaluate(self, tmp_path: Path) -> None:
+        judge = LLMJudge(api_key="k", cache=JudgeCache(tmp_path))
+        [(test_case, trace)] = self._pairs(1)
+        single = '{"verdict": "fail", "score": 0.3, "reason": "single"}'
+        with patch.object(judge, "_call_api", AsyncMock(side_effect=self._respond)):
+            await judge.evaluate_batch([(test_case, trace)])
+        with patch.object(judge, "_call_api", AsyncMock(return_value=single)) as api:
+            result = await judge.evaluate(test_case, trace)
+        assert api.await_count == 1
+        assert result.reason == "single"
+
+    @pytest.mark.asyncio
+    async def test_error_results_are_distinct(self) -> None:
+        judge = LLMJudge(api_key="k")
+        with patch.object(judge, "_call_api", AsyncMock(return_value="nope")):
+            results = await judge.evaluate_batch(self._pairs(3))
+        assert len({r.eval_id for r in results}) == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_size(self) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            await LLMJudge(api_key="k").evaluate_batch(self._pairs(1), batch_size=0)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await LLMJudge(api_key="k").evaluate_batch(self._pairs(1), max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_bounds_batches_in_flight(self) -> None:
+        judge = LLMJudge(api_key="k")
+        in_flight = peak = 0
+
+        async def _respond(prompt: str, *, system_prompt: str = "") -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._respond(prompt, system_prompt=system_prompt)
+
+        with patch.object(judge, "_call_api", _respond):
+            results = await judge.evaluate_batch(self._pairs(6), batch_size=1, max_concurrency=2)
+        assert len(results) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_api_error_cancels_other_batches(self) -> None:
+        judge = LLMJudge(api_key="k")
+        finished = 0
+
+        async def _respond(prompt: str, *, system_prompt: str = "") -> str:
+            nonlocal finished
+            if "q0" in prompt:
+                raise JudgeAPIError("judge", 400, "rejected")
+            await asyncio.sleep(1)
+            finished += 1
+            return self._respond(prompt, system_prompt=system_prompt)
+
+        with patch.object(judge, "_call_api", _respond), pytest.raises(JudgeAPIError):
+            await judge.evaluate_batch(self._pairs(3), batch_size=1)
+        assert finished == 0
+
+
+class TestJudgeHTTPSession:
+    """Tests for the judge's shared HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_and_closed(self) -> None:
+        async with LLMJudge(api_key="k") as judge:
+            http = await judge._http_session()
+            assert await judge._http_session() is http
+            assert http.connector is not None
+            assert http.connector.limit_per_host == 200
+        assert http.closed
+        assert judge._http is None
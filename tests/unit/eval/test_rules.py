@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from agentprobe.core.models import EvalVerdict, TestCase, Trace
-from agentprobe.eval.rules import RuleBasedEvaluator, RuleSpec
+from agentprobe.eval.rules import RuleBasedEvaluator, RuleSpec, _compiled
 
 
 @pytest.fixture
@@ -29,10 +30,30 @@ class TestRuleSpec:
         with pytest.raises(Exception, match="greater than 0"):
             RuleSpec(rule_type="test", weight=0)
 
+    def test_invalid_regex_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="Invalid regex pattern"):
+            RuleSpec(rule_type="regex", params={"pattern": "(unclosed"})
+        with pytest.raises(ValidationError, match="must be a string"):
+            RuleSpec(rule_type="regex", params={"pattern": 42})
+
+    def test_regex_compiled_once(self) -> None:
+        _compiled.cache_clear()
+        RuleSpec(rule_type="regex", params={"pattern": r"\d+"})
+        assert _compiled(r"\d+") is _compiled(r"\d+")
+        assert _compiled.cache_info().misses == 1
+
 
 class TestRuleBasedEvaluator:
     """Tests for RuleBasedEvaluator evaluation logic."""
 
+    def test_cache_key_tracks_rules(self) -> None:
+        def _rules(limit: int) -> list[RuleSpec]:
+            return [RuleSpec(rule_type="max_length", params={"max_chars": limit})]
+
+        key = RuleBasedEvaluator(rules=_rules(10)).cache_key()
+        assert RuleBasedEvaluator(rules=_rules(10)).cache_key() == key
+        assert RuleBasedEvaluator(rules=_rules(20)).cache_key() != key
+
     @pytest.mark.asyncio
     async def test_no_rules_passes(self, test_case: TestCase) -> None:
         evaluator = RuleBasedEvaluator()
@@ -185,6 +206,24 @@ class TestRuleBasedEvaluator:
         assert result.verdict == EvalVerdict.FAIL
         assert result.score == 0.0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("collect", [True, False])
+    async def test_collect_metadata(self, test_case: TestCase, collect: bool) -> None:
+        evaluator = RuleBasedEvaluator(
+            rules=[
+                RuleSpec(rule_type="contains_any", params={"values": ["hello"]}),
+                RuleSpec(rule_type="nonexistent_rule"),
+            ],
+            collect_metadata=collect,
+        )
+        result = await evaluator.evaluate(test_case, _make_trace("hello"))
+        assert result.verdict == EvalVerdict.PARTIAL
+        assert result.score == 0.5
+        if collect:
+            assert [r["passed"] for r in result.metadata["rule_results"]] == [True, False]
+        else:
+            assert result.metadata == {}
+
     @pytest.mark.asyncio
     async def test_multiple_rules_all_pass(self, test_case: TestCase) -> None:
         evaluator = RuleBasedEvaluator(
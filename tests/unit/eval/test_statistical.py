@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import statistics
+import sys
+
 import pytest
 
 from agentprobe.core.models import (
@@ -10,8 +15,9 @@ from agentprobe.core.models import (
     TestCase,
     Trace,
 )
+from agentprobe.eval import statistical
 from agentprobe.eval.base import BaseEvaluator
-from agentprobe.eval.statistical import StatisticalEvaluator, _percentile
+from agentprobe.eval.statistical import StatisticalEvaluator, _percentile, _summarize_scores
 from tests.fixtures.traces import make_trace
 
 
@@ -51,6 +57,28 @@ class _ConstantEvaluator(BaseEvaluator):
         )
 
 
+class _SlowEvaluator(BaseEvaluator):
+    """Test evaluator that scores by output length and tracks concurrency."""
+
+    def __init__(self) -> None:
+        super().__init__("slow")
+        self.active = 0
+        self.peak = 0
+
+    async def _evaluate(self, test_case: TestCase, trace: Trace) -> EvalResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01 * (5 - len(trace.output_text)))
+        finally:
+            self.active -= 1
+        return EvalResult(
+            evaluator_name=self.name,
+            verdict=EvalVerdict.PASS,
+            score=len(trace.output_text) / 10,
+        )
+
+
 class TestPercentile:
     """Test the percentile helper function."""
 
@@ -69,6 +97,38 @@ class TestPercentile:
         assert abs(_percentile(data, 95) - 0.95) < 0.01
 
 
+class TestSummarizeScores:
+    """Test the score summary helper."""
+
+    def test_matches_statistics_module(self) -> None:
+        rng = random.Random(7)
+        scores = [rng.random() for _ in range(500)]
+        summary = _summarize_scores("s", scores)
+        assert summary.sample_count == 500
+        assert summary.mean == round(statistics.mean(scores), 6)
+        assert summary.std_dev == round(statistics.stdev(scores), 6)
+        assert summary.median == round(statistics.median(scores), 6)
+
+    def test_even_count_median(self) -> None:
+        summary = _summarize_scores("s", [0.2, 0.4, 0.6, 0.8])
+        assert summary.median == 0.5
+
+    def test_numpy_path_matches_pure_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        rng = random.Random(11)
+        scores = [rng.random() for _ in range(2000)]
+        with_numpy = _summarize_scores("s", scores)
+        monkeypatch.setattr(statistical, "_NUMPY_MIN_SAMPLES", len(scores) + 1)
+        assert _summarize_scores("s", scores) == with_numpy
+
+    def test_large_sample_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        scores = [i / 1999 for i in range(2000)]
+        summary = _summarize_scores("s", scores)
+        assert summary.median == 0.5
+        assert summary.mean == 0.5
+
+
 class TestStatisticalEvaluator:
     """Test statistical evaluator with deterministic inner evaluator."""
 
@@ -80,6 +140,12 @@ class TestStatisticalEvaluator:
     def traces(self) -> list[Trace]:
         return [make_trace(output_text=f"output_{i}") for i in range(5)]
 
+    async def test_close_closes_inner_session(self) -> None:
+        inner = _ConstantEvaluator()
+        session = await inner._http_session()
+        await StatisticalEvaluator(inner).close()
+        assert session.closed
+
     async def test_single_trace_delegates(self, test_case: TestCase) -> None:
         inner = _ConstantEvaluator(score=0.85)
         evaluator = StatisticalEvaluator(inner)
@@ -194,3 +260,16 @@ class TestStatisticalEvaluator:
         assert result.metadata["sample_count"] == 5
         assert "std_dev" in result.metadata
         assert "median" in result.metadata
+
+    async def test_evaluate_multiple_concurrent_in_order(self, test_case: TestCase) -> None:
+        inner = _SlowEvaluator()
+        evaluator = StatisticalEvaluator(inner, max_concurrency=2)
+        traces = [make_trace(output_text="x" * i) for i in range(1, 5)]
+        summary = await evaluator.evaluate_multiple(test_case, traces)
+
+        assert summary.scores == (0.1, 0.2, 0.3, 0.4)
+        assert inner.peak == 2
+
+    async def test_invalid_max_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            StatisticalEvaluator(_ConstantEvaluator(), max_concurrency=0)
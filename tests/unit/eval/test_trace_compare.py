@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from agentprobe.core.models import EvalVerdict, TestCase, Trace
+from agentprobe.eval import trace_compare
 from agentprobe.eval.trace_compare import (
     TraceComparisonEvaluator,
     _collect_param_keys,
     _jaccard_similarity,
-    _keyword_overlap,
     _levenshtein_distance,
     _levenshtein_similarity,
+    _word_set,
 )
 from tests.fixtures.traces import make_llm_call, make_tool_call, make_trace
 
@@ -73,6 +76,34 @@ class TestLevenshteinDistance:
     def test_completely_different(self) -> None:
         assert _levenshtein_distance(["a", "b"], ["x", "y"]) == 2
 
+    def test_shared_ends_trimmed(self) -> None:
+        assert _levenshtein_distance(["a", "b", "x", "c"], ["a", "b", "c"]) == 1
+        assert _levenshtein_distance(["a", "a"], ["a", "a", "a"]) == 1
+
+    def test_matches_full_table(self) -> None:
+        def full(a: list[str], b: list[str]) -> int:
+            table = [
+                [i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)
+            ]
+            for i in range(1, len(a) + 1):
+                for j in range(1, len(b) + 1):
+                    cost = 0 if a[i - 1] == b[j - 1] else 1
+                    table[i][j] = min(
+                        table[i - 1][j] + 1, table[i][j - 1] + 1, table[i - 1][j - 1] + cost
+                    )
+            return table[-1][-1]
+
+        rng = random.Random(3)
+        for _ in range(300):
+            a = rng.choices("abcd", k=rng.randint(0, 8))
+            b = rng.choices("abcd", k=rng.randint(0, 8))
+            assert _levenshtein_distance(a, b) == full(a, b)
+        # Sequences longer than a machine word.
+        for _ in range(20):
+            a = rng.choices("abc", k=rng.randint(60, 90))
+            b = rng.choices("abc", k=rng.randint(60, 90))
+            assert _levenshtein_distance(a, b) == full(a, b)
+
 
 class TestLevenshteinSimilarity:
     """Tests for _levenshtein_similarity."""
@@ -121,27 +152,25 @@ class TestJaccardSimilarity:
         # intersection=2, union=3 → 0.6667
         assert sim == pytest.approx(2 / 3, abs=1e-4)
 
+    def test_one_side_empty(self) -> None:
+        assert _jaccard_similarity(frozenset({"a"}), set()) == 0.0
+        assert _jaccard_similarity(set(), {"a"}) == 0.0
 
-# ── Keyword overlap tests ──
 
+# ── Word set tests ──
 
-class TestKeywordOverlap:
-    """Tests for _keyword_overlap."""
 
-    def test_identical_text(self) -> None:
-        assert _keyword_overlap("hello world", "hello world") == 1.0
+class TestWordSet:
+    """Tests for _word_set."""
 
     def test_case_insensitive(self) -> None:
-        assert _keyword_overlap("Hello World", "hello world") == 1.0
+        assert _word_set("Hello World hello") == {"hello", "world"}
 
-    def test_partial_overlap(self) -> None:
-        sim = _keyword_overlap("the quick brown fox", "the slow brown dog")
-        # words_a={the,quick,brown,fox}, words_b={the,slow,brown,dog}
-        # intersection={the,brown}=2, union={the,quick,brown,fox,slow,dog}=6
-        assert sim == pytest.approx(2 / 6, abs=1e-4)
+    def test_splits_on_any_whitespace(self) -> None:
+        assert _word_set("the\tquick\n brown") == {"the", "quick", "brown"}
 
-    def test_no_overlap(self) -> None:
-        assert _keyword_overlap("hello world", "foo bar") == 0.0
+    def test_empty(self) -> None:
+        assert _word_set("") == frozenset()
 
 
 # ── Collect param keys tests ──
@@ -359,3 +388,24 @@ class TestTraceComparisonEvaluator:
         result = await evaluator.evaluate(tc, cur)
 
         assert 0.0 <= result.score <= 1.0
+
+    async def test_reference_side_computed_once(
+        self, tc: TestCase, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        reference = _trace_with_params([("search", {"query": "a"})], output="alpha beta")
+        evaluator = TraceComparisonEvaluator(reference_trace=reference)
+
+        seen: list[Trace] = []
+        real = trace_compare._collect_param_keys
+
+        def _counting(trace: Trace) -> set[str]:
+            seen.append(trace)
+            return real(trace)
+
+        monkeypatch.setattr(trace_compare, "_collect_param_keys", _counting)
+        current = _trace_with_params([("search", {"query": "b"})], output="alpha gamma")
+        result = await evaluator.evaluate(tc, current)
+
+        assert seen == [current]
+        assert result.metadata["dimension_scores"]["tool_parameters"] == 1.0
+        assert result.metadata["dimension_scores"]["output_similarity"] == pytest.approx(1 / 3)
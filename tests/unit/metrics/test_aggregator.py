@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import random
+import statistics
+
 import pytest
 
 from agentprobe.core.exceptions import MetricsError
@@ -60,6 +63,15 @@ class TestAggregate:
         assert agg.min_value == pytest.approx(1.0)
         assert agg.max_value == pytest.approx(100.0)
 
+    def test_matches_statistics_module(self, aggregator: MetricAggregator) -> None:
+        rng = random.Random(3)
+        raw = [rng.uniform(0, 500) for _ in range(301)]
+        agg = aggregator.aggregate([make_metric_value(value=v) for v in raw])
+
+        assert agg.mean == pytest.approx(statistics.mean(raw))
+        assert agg.median == pytest.approx(statistics.median(raw))
+        assert agg.std_dev == pytest.approx(statistics.stdev(raw))
+
     def test_empty_raises(self, aggregator: MetricAggregator) -> None:
         with pytest.raises(MetricsError, match="empty"):
             aggregator.aggregate([])
@@ -9,6 +9,8 @@ from unittest.mock import patch
 import pytest
 
 from agentprobe.core.exceptions import StorageError
+from agentprobe.core.models import Trace
+from agentprobe.storage import sqlite as sqlite_module
 from agentprobe.storage.sqlite import SQLiteStorage
 from tests.fixtures.results import make_test_result
 from tests.fixtures.traces import make_metric_value, make_trace
@@ -116,6 +118,63 @@ class TestSQLiteStorage:
         assert loaded.tool_calls[0].tool_name == "search"
         await storage.close()
 
+    @pytest.mark.asyncio
+    async def test_save_traces_batch(self, storage: SQLiteStorage) -> None:
+        await storage.save_traces(
+            [make_trace(trace_id=f"t{i}", agent_name="batch") for i in range(3)]
+        )
+        traces = await storage.list_traces(agent_name="batch")
+        assert {t.trace_id for t in traces} == {"t0", "t1", "t2"}
+        await storage.save_traces([])
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_save_results_batch(self, storage: SQLiteStorage) -> None:
+        await storage.save_results([make_test_result(test_name=f"test_{i}") for i in range(3)])
+        assert len(await storage.load_results()) == 3
+        await storage.save_results([])
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_save_traces_batch_is_atomic(self, storage: SQLiteStorage) -> None:
+        real_row = sqlite_module._trace_row
+
+        def _row(trace: Trace) -> tuple[object, ...]:
+            if trace.trace_id == "bad":
+                msg = "bad row"
+                raise ValueError(msg)
+            return real_row(trace)
+
+        with (
+            patch.object(sqlite_module, "_trace_row", side_effect=_row),
+            pytest.raises(StorageError, match="Failed to save traces"),
+        ):
+            await storage.save_traces([make_trace(trace_id="good"), make_trace(trace_id="bad")])
+        assert await storage.load_trace("good") is None
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_traces_matches_list(self, storage: SQLiteStorage) -> None:
+        await storage.save_traces([make_trace(trace_id=f"t{i}", agent_name="s") for i in range(5)])
+        with patch.object(sqlite_module, "_STREAM_BATCH_SIZE", 2):
+            streamed = [t async for t in storage.stream_traces(agent_name="s", limit=4)]
+        assert streamed == list(await storage.list_traces(agent_name="s", limit=4))
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_results_matches_load(self, storage: SQLiteStorage) -> None:
+        await storage.save_results([make_test_result(test_name=f"test_{i}") for i in range(3)])
+        streamed = [r async for r in storage.stream_results()]
+        assert streamed == list(await storage.load_results())
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_raises_storage_error(self, tmp_path: Path) -> None:
+        storage = SQLiteStorage(tmp_path / "no_tables.db")
+        with pytest.raises(StorageError, match="Failed to stream traces"):
+            _ = [t async for t in storage.stream_traces()]
+        await storage.close()
+
 
 class TestSQLiteSetup:
     """Tests for SQLiteStorage.setup() behavior."""
@@ -359,6 +418,15 @@ class TestSQLiteMetrics:
         assert len(limited) == 3
         await storage.close()
 
+    @pytest.mark.asyncio
+    async def test_stream_metrics_by_name(self, storage: SQLiteStorage) -> None:
+        await storage.save_metrics(
+            [make_metric_value(metric_name="latency_ms"), make_metric_value(metric_name="cost_usd")]
+        )
+        streamed = [m async for m in storage.stream_metrics(metric_name="cost_usd")]
+        assert streamed == list(await storage.load_metrics(metric_name="cost_usd"))
+        await storage.close()
+
     @pytest.mark.asyncio
     async def test_metrics_table_created(self, tmp_path: Path) -> None:
         db_path = tmp_path / "schema_check.db"
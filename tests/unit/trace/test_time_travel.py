@@ -163,3 +163,11 @@ class TestTimeTravel:
         assert isinstance(trace_with_turns, Trace)
         tt = TimeTravel(trace_with_turns)
         assert tt.trace is trace_with_turns
+
+    def test_steps_built_once(self, trace_with_turns: object) -> None:
+        from agentprobe.core.models import Trace
+
+        assert isinstance(trace_with_turns, Trace)
+        tt = TimeTravel(trace_with_turns)
+        assert tt[-1] is tt[2]
+        assert list(tt)[1] is tt[1]